@@ -1,21 +1,42 @@
 """
 FastAPI Backend - ComplaintIQ API
 """
-from fastapi import FastAPI, HTTPException, UploadFile, File
+from fastapi import FastAPI, HTTPException, UploadFile, File, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from starlette.routing import Match
 from pydantic import BaseModel, Field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import csv
+import io
+import json
 import logging
 import sys
 import os
+import shutil
+import tempfile
+import time
 from pathlib import Path
 
 # Import our modules
 sys.path.append(str(Path(__file__).parent))
-from src.config import APP_CONFIG, API_CONFIG, BUSINESS_RULES
+from src.config import (
+    APP_CONFIG, API_CONFIG, BUSINESS_RULES, BATCHING_CONFIG, DATABASE_CONFIG, DATASET_CONFIG, INFERENCE_CONFIG,
+    JOBS_CONFIG, MODEL_CONFIG, ONLINE_LEARNING_CONFIG, TRAINING_CONFIG, UPLOAD_CONFIG
+)
 from src.inference import classifier, predict_complaint, batch_predict_complaints, get_categories
-from src.pipeline import data_collector, collect_and_train, add_complaint_to_dataset, get_collected_data
+from src.batching import PredictionBatcher
+from src.executor import InferenceExecutor, InferenceSaturatedError
+from src.jobs import BulkJobManager, RESULT_COLUMNS
+from src.storage import COMPLAINT_COLUMNS
+from src import dataset, metrics
+from src.pipeline import (
+    data_collector, online_classifier, add_complaint_to_dataset,
+    add_complaints_to_dataset
+)
+from src.training import TrainingJobManager, TrainingInProgressError
 
 # Logging setup
 logging.basicConfig(level=logging.INFO)
@@ -39,6 +60,106 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class MetricsMiddleware:
+    """
+    Endpoint başına istek sayacı, süre histogramı ve eşzamanlı istek göstergesi
+    
+    Etiket olarak istek yolu değil route şablonu (/jobs/{job_id}) kullanılır.
+    Akış yanıtlarında süre, gövde tamamen gönderilene kadar ölçülür.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    @staticmethod
+    def _endpoint(scope) -> str:
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return route.path
+        return "unmatched"
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        labels = {"method": scope["method"], "endpoint": self._endpoint(scope)}
+        status = {"code": 500}
+        
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+        
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc(**labels)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.HTTP_REQUEST_DURATION_SECONDS.observe(time.perf_counter() - start, **labels)
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec(**labels)
+            metrics.HTTP_REQUESTS_TOTAL.inc(status=str(status["code"]), **labels)
+
+app.add_middleware(MetricsMiddleware)
+
+# CPU yoğun tahminler event loop dışında, sınırlı bir havuzda çalışır
+inference_executor = InferenceExecutor(
+    max_workers=INFERENCE_CONFIG["max_workers"],
+    max_queue_depth=INFERENCE_CONFIG["max_queue_depth"],
+    retry_after_seconds=INFERENCE_CONFIG["retry_after_seconds"]
+)
+
+# Eşzamanlı /predict isteklerini tek model çağrısında birleştirir
+batcher = PredictionBatcher(
+    predict=classifier.predict_validated,
+    validate=classifier.validate_text,
+    executor=inference_executor,
+    max_wait_ms=BATCHING_CONFIG["max_wait_ms"],
+    max_batch_size=BATCHING_CONFIG["max_batch_size"],
+    max_queue_depth=BATCHING_CONFIG["max_queue_depth"]
+)
+
+# Büyük dosyalar için diskte durum tutan arka plan işleri
+job_manager = BulkJobManager(
+    jobs_dir=JOBS_CONFIG["jobs_dir"],
+    predict_batch=classifier.predict_batch,
+    chunk_size=JOBS_CONFIG["chunk_size"]
+)
+
+# Model eğitimi ayrı süreçte çalışır; biten model bu süreçte hemen devreye girer
+training_manager = TrainingJobManager(
+    TRAINING_CONFIG["jobs_dir"], data_collector.store.db_path, on_complete=classifier.reload_if_changed
+)
+
+@app.on_event("startup")
+async def start_background_workers():
+    """Toplu iş thread'ini, model sürüm izleyicisini ve online modeli başlat"""
+    job_manager.start()
+    if ONLINE_LEARNING_CONFIG["enabled"]:
+        await run_in_threadpool(online_classifier.load)
+    classifier.start_watcher(MODEL_CONFIG["reload_poll_seconds"])
+
+@app.on_event("shutdown")
+async def shutdown_inference():
+    """Micro-batch görevini, arka plan thread'lerini ve inference havuzunu durdur"""
+    await batcher.close()
+    job_manager.stop()
+    training_manager.shutdown()
+    classifier.stop_watcher()
+    if ONLINE_LEARNING_CONFIG["enabled"] and online_classifier.is_ready:
+        online_classifier.save()
+    inference_executor.shutdown()
+
+def saturated_error(e: InferenceSaturatedError) -> HTTPException:
+    """Doygun inference kuyruğu için Retry-After başlıklı 503 hatası"""
+    logger.warning(f"Inference kuyruğu dolu: {inference_executor.stats()}")
+    return HTTPException(
+        status_code=503,
+        detail=str(e),
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
 # Pydantic models
 class PredictionRequest(BaseModel):
     text: str = Field(..., min_length=10, max_length=2000, description="Şikayet metni")
@@ -55,7 +176,7 @@ class BatchComplaintCollectionRequest(BaseModel):
     complaints: List[Dict] = Field(..., description="Şikayet listesi")
 
 class TrainingRequest(BaseModel):
-    complaints: List[Dict] = Field(..., description="Eğitim için şikayet listesi")
+    complaints: List[Dict] = Field(..., description="Eğitimden önce depoya eklenecek şikayetler (eğitim depodaki tüm şikayetlerle yapılır)")
     save_model: bool = Field(True, description="Model kaydedilsin mi")
 
 class PredictionResponse(BaseModel):
@@ -92,7 +213,8 @@ async def health_check():
         "status": "healthy",
         "timestamp": "2024-12-08T15:54:00Z",
         "service": "Şikayet Kategorilendirme API",
-        "version": APP_CONFIG["version"]
+        "version": APP_CONFIG["version"],
+        "inference": inference_executor.stats()
     }
 
 # Main prediction endpoint
@@ -103,7 +225,10 @@ async def predict_single(request: PredictionRequest):
         logger.info(f"Tahmin isteği alındı: {len(request.text)} karakter")
         
         # Prediction
-        result = classifier.predict_single(request.text)
+        if BATCHING_CONFIG["enabled"]:
+            result = await batcher.submit(request.text)
+        else:
+            result = await inference_executor.run(classifier.predict_single, request.text)
         
         # Response
         response = PredictionResponse(
@@ -121,10 +246,34 @@ async def predict_single(request: PredictionRequest):
     except ValueError as e:
         logger.error(f"Validation hatası: {e}")
         raise HTTPException(status_code=400, detail=str(e))
+    except InferenceSaturatedError as e:
+        raise saturated_error(e)
     except Exception as e:
         logger.error(f"Tahmin hatası: {e}")
         raise HTTPException(status_code=500, detail="Tahmin işlemi sırasında hata oluştu")
 
+# Online model prediction endpoint
+@app.post("/predict/online", response_model=PredictionResponse)
+async def predict_online(request: PredictionRequest):
+    """
+    Artımlı öğrenen online modelle tahmin
+    
+    Model /collect endpoint'lerine gelen etiketli şikayetlerle anında
+    güncellenir; tam eğitim gerektirmez.
+    """
+    if not ONLINE_LEARNING_CONFIG["enabled"]:
+        raise HTTPException(status_code=404, detail="Online öğrenme kapalı")
+    if not online_classifier.is_ready:
+        raise HTTPException(status_code=503, detail="Online model henüz etiketli şikayetle eğitilmedi")
+    
+    try:
+        classifier.validate_text(request.text)
+        return await inference_executor.run(online_classifier.predict, request.text)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except InferenceSaturatedError as e:
+        raise saturated_error(e)
+
 # Batch prediction endpoint
 @app.post("/batch_predict", response_model=BatchPredictionResponse)
 async def predict_batch(request: BatchPredictionRequest):
@@ -136,7 +285,7 @@ async def predict_batch(request: BatchPredictionRequest):
         start_time = time.time()
         
         # Batch prediction
-        results = classifier.predict_batch(request.texts)
+        results = await inference_executor.run(classifier.predict_batch, request.texts)
         
         processing_time = time.time() - start_time
         
@@ -151,6 +300,8 @@ async def predict_batch(request: BatchPredictionRequest):
         
         return response
         
+    except InferenceSaturatedError as e:
+        raise saturated_error(e)
     except Exception as e:
         logger.error(f"Toplu tahmin hatası: {e}")
         raise HTTPException(status_code=500, detail="Toplu tahmin işlemi sırasında hata oluştu")
@@ -227,16 +378,49 @@ async def get_system_info():
 # Statistics endpoint
 @app.get("/stats")
 async def get_statistics():
-    """İstatistik bilgileri"""
+    """
+    Canlı istatistikler
+    
+    /metrics ile aynı sayaçlardan türetilir; /predict gecikmesi
+    BUSINESS_RULES["max_prediction_time"] hedefiyle karşılaştırılır.
+    """
     try:
+        max_prediction_time = BUSINESS_RULES["max_prediction_time"]
+        latency = metrics.HTTP_REQUEST_DURATION_SECONDS.snapshot(method="POST", endpoint="/predict")
+        
+        requests_by_endpoint: Dict[str, int] = {}
+        errors_by_endpoint: Dict[str, int] = {}
+        for (method, endpoint, status), count in metrics.HTTP_REQUESTS_TOTAL.values().items():
+            name = f"{method} {endpoint}"
+            requests_by_endpoint[name] = requests_by_endpoint.get(name, 0) + int(count)
+            if status.startswith("5"):
+                errors_by_endpoint[name] = errors_by_endpoint.get(name, 0) + int(count)
+        
+        stage_latency = {}
+        for (stage,) in metrics.PREDICTION_STAGE_SECONDS.label_values():
+            snapshot = metrics.PREDICTION_STAGE_SECONDS.snapshot(stage=stage)
+            stage_latency[stage] = {"count": snapshot["count"], "mean": snapshot["mean"], "p95": snapshot["p95"]}
+        
+        predicted = {source: int(count) for (source,), count in metrics.PREDICTED_TEXTS_TOTAL.values().items()}
+        
         stats = {
             "total_categories": len(get_categories()),
-            "model_accuracy": "85%+",
-            "average_prediction_time": "< 100ms",
+            "model_version": classifier.model_version,
             "supported_languages": ["Türkçe"],
             "api_version": APP_CONFIG["version"],
-            "last_updated": "2024-12-08",
-            "deployment_date": "2024-12-08"
+            "predictions": {
+                "requests": latency["count"] if latency else 0,
+                "average_prediction_time": latency["mean"] if latency else None,
+                "p95_prediction_time": latency["p95"] if latency else None,
+                "p99_prediction_time": latency["p99"] if latency else None,
+                "max_prediction_time": max_prediction_time,
+                "within_target": latency["p95"] <= max_prediction_time if latency else None,
+                "texts_predicted": predicted
+            },
+            "stage_latency": stage_latency,
+            "requests": requests_by_endpoint,
+            "server_errors": errors_by_endpoint,
+            "cache_hit_rate": classifier.cache.stats()["hit_rate"]
         }
         
         return stats
@@ -245,6 +429,51 @@ async def get_statistics():
         logger.error(f"İstatistik hatası: {e}")
         raise HTTPException(status_code=500, detail="İstatistikler alınamadı")
 
+# Prometheus metrics endpoint
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus metin formatında metrikler"""
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+# Prediction cache statistics endpoint
+@app.get("/cache/stats")
+async def get_cache_statistics():
+    """Tahmin cache istatistikleri"""
+    return {
+        "model_version": classifier.model_version,
+        **classifier.cache.stats()
+    }
+
+# Model version endpoints
+@app.get("/model")
+async def get_model_version():
+    """Aktif model sürümü"""
+    return {
+        "model_version": classifier.model_version,
+        "engine": classifier.engine is not None,
+        "categories": list(classifier.categories),
+        "online_model": online_classifier.stats()
+    }
+
+@app.post("/model/reload")
+async def reload_model():
+    """
+    Aktif model sürümünü yeniden yükle
+    
+    Yeni sürüm arka planda yüklenip ısıtılır, ardından atomik olarak
+    devreye alınır; devam eden istekler eski sürümle tamamlanır.
+    """
+    previous_version = classifier.model_version
+    reloaded = await run_in_threadpool(classifier.reload_model)
+    if not reloaded:
+        raise HTTPException(status_code=500, detail="Model yüklenemedi, mevcut sürüm korunuyor")
+    
+    return {
+        "status": "success",
+        "previous_version": previous_version,
+        "model_version": classifier.model_version
+    }
+
 # File upload endpoint for batch processing
 @app.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
@@ -260,7 +489,7 @@ async def upload_file(file: UploadFile = File(...)):
         import pandas as pd
         from io import StringIO
         
-        df = pd.read_csv(StringIO(content.decode('utf-8')))
+        df = await run_in_threadpool(pd.read_csv, StringIO(content.decode('utf-8')))
         
         if 'text' not in df.columns:
             raise HTTPException(status_code=400, detail="CSV dosyasında 'text' sütunu bulunamadı")
@@ -271,14 +500,10 @@ async def upload_file(file: UploadFile = File(...)):
         import time
         start_time = time.time()
         
-        results = classifier.predict_batch(texts)
+        results = await inference_executor.run(classifier.predict_batch, texts)
         
         processing_time = time.time() - start_time
         
-        # Add results to dataframe
-        df_results = pd.DataFrame(results)
-        df_results['text'] = texts[:len(results)]
-        
         # Convert to dict for response
         response_data = {
             "total_processed": len(results),
@@ -293,14 +518,158 @@ async def upload_file(file: UploadFile = File(...)):
         
         logger.info(f"Dosya işlendi: {file.filename}, {len(results)} satır")
         
-        return JSONResponse(content=response_data)
+        # Büyük yanıtların JSON'a çevrilmesi de event loop dışında yapılır
+        return await run_in_threadpool(JSONResponse, content=response_data)
         
     except HTTPException:
         raise
+    except InferenceSaturatedError as e:
+        raise saturated_error(e)
     except Exception as e:
         logger.error(f"Dosya yükleme hatası: {e}")
         raise HTTPException(status_code=500, detail="Dosya işlenirken hata oluştu")
 
+# Streaming file upload endpoint for large files
+def serialize_results(results: List[Dict], output_format: str) -> str:
+    """Sonuçları NDJSON satırlarına veya CSV satırlarına çevir"""
+    if output_format == "ndjson":
+        return "".join(json.dumps(result, ensure_ascii=False) + "\n" for result in results)
+    
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=RESULT_COLUMNS, extrasaction="ignore")
+    writer.writerows(results)
+    return buffer.getvalue()
+
+@app.post("/upload/stream")
+async def upload_file_stream(file: UploadFile = File(...),
+                             output_format: str = Query("ndjson", alias="format")):
+    """
+    CSV dosyasını parça parça işleyip sonuçları akış olarak döndür
+    
+    Dosya UPLOAD_CONFIG["chunk_size"] satırlık parçalar halinde okunur, her
+    parça batch motoruyla sınıflandırılır ve sonuçlar NDJSON (veya CSV)
+    olarak hemen gönderilir; bellek kullanımı dosya boyutundan bağımsızdır.
+    """
+    if not file.filename.endswith('.csv'):
+        raise HTTPException(status_code=400, detail="Sadece CSV dosyaları destekleniyor")
+    if output_format not in ("ndjson", "csv"):
+        raise HTTPException(status_code=400, detail="Desteklenen formatlar: ndjson, csv")
+    
+    import pandas as pd
+    
+    # Yanıt gövdesi handler döndükten sonra üretilir; bazı FastAPI sürümleri
+    # UploadFile'ı bu noktada kapattığı için içerik generator'ın sahip olduğu
+    # geçici dosyaya kopyalanır (kapatılınca silinir)
+    upload = await run_in_threadpool(tempfile.TemporaryFile)
+    try:
+        await run_in_threadpool(shutil.copyfileobj, file.file, upload)
+        upload.seek(0)
+        # Sadece 'text' sütunu okunur; başlık hatası yanıt başlamadan yakalanır
+        reader = await run_in_threadpool(
+            pd.read_csv, upload,
+            usecols=['text'], dtype={'text': str},
+            chunksize=UPLOAD_CONFIG["chunk_size"], encoding='utf-8'
+        )
+    except ValueError:
+        upload.close()
+        raise HTTPException(status_code=400, detail="CSV dosyasında 'text' sütunu bulunamadı")
+    except Exception:
+        upload.close()
+        raise
+    
+    try:
+        inference_executor.check_capacity()
+    except InferenceSaturatedError as e:
+        reader.close()
+        upload.close()
+        raise saturated_error(e)
+    
+    async def stream_results():
+        offset = 0
+        try:
+            if output_format == "csv":
+                yield ",".join(RESULT_COLUMNS) + "\n"
+            
+            while True:
+                chunk = await run_in_threadpool(next, reader, None)
+                if chunk is None:
+                    break
+                
+                texts = chunk['text'].fillna('').tolist()
+                
+                # Akış başladıktan sonra doygunlukta 503 yerine beklenir
+                while True:
+                    try:
+                        results = await inference_executor.run(classifier.predict_batch, texts)
+                        break
+                    except InferenceSaturatedError as e:
+                        await asyncio.sleep(e.retry_after)
+                
+                for result in results:
+                    result['text_index'] += offset
+                offset += len(texts)
+                
+                yield serialize_results(results, output_format)
+            
+            logger.info(f"Dosya akış olarak işlendi: {file.filename}, {offset} satır")
+        finally:
+            reader.close()
+            upload.close()
+    
+    media_type = "application/x-ndjson" if output_format == "ndjson" else "text/csv"
+    return StreamingResponse(stream_results(), media_type=media_type)
+
+# Bulk job endpoints
+@app.post("/jobs", status_code=202)
+async def create_job(file: UploadFile = File(...)):
+    """
+    CSV dosyası için arka plan sınıflandırma işi oluştur
+    
+    Dosya diske kaydedilir ve iş kimliği hemen döner; sonuçlar parça parça
+    data/processed/jobs altına yazılır. API yeniden başlatılırsa iş son
+    tamamlanan parçadan devam eder.
+    """
+    if not file.filename.endswith('.csv'):
+        raise HTTPException(status_code=400, detail="Sadece CSV dosyaları destekleniyor")
+    
+    try:
+        job = await run_in_threadpool(job_manager.create_job, file.filename, file.file)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Toplu iş oluşturma hatası: {e}")
+        raise HTTPException(status_code=500, detail="Toplu iş oluşturulurken hata oluştu")
+    
+    return {
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "status_url": f"/jobs/{job['job_id']}",
+        "result_url": f"/jobs/{job['job_id']}/result"
+    }
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Toplu iş durumu ve ilerlemesi"""
+    job = await run_in_threadpool(job_manager.get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="İş bulunamadı")
+    return job
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Tamamlanmış toplu işin sonuçlarını CSV olarak indir"""
+    job = await run_in_threadpool(job_manager.get_job, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="İş bulunamadı")
+    if job["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"İş henüz tamamlanmadı: {job['status']}")
+    
+    return StreamingResponse(
+        job_manager.iter_results(job_id),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{job_id}.csv"'}
+    )
+
 # Data collection endpoints
 @app.post("/collect/complaint")
 async def collect_complaint(request: ComplaintCollectionRequest):
@@ -319,12 +688,22 @@ async def collect_complaint(request: ComplaintCollectionRequest):
         
         logger.info(f"Şikayet toplandı: {complaint['category']}")
         
+        # Sadece açıkça etiketlenmiş şikayetler online modeli günceller
+        online_updated = 0
+        if ONLINE_LEARNING_CONFIG["enabled"] and request.category:
+            online_updated = await run_in_threadpool(
+                online_classifier.partial_fit, [complaint['text']], [request.category]
+            )
+        
         return {
             "status": "success",
             "complaint": complaint,
+            "online_updated": online_updated,
             "message": "Şikayet başarıyla toplandı"
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Şikayet toplama hatası: {e}")
         raise HTTPException(status_code=500, detail="Şikayet toplanırken hata oluştu")
@@ -335,21 +714,27 @@ async def collect_batch_complaints(request: BatchComplaintCollectionRequest):
     try:
         logger.info(f"Toplu şikayet toplanıyor: {len(request.complaints)} şikayet")
         
+        results = await run_in_threadpool(add_complaints_to_dataset, request.complaints)
+        
         collected = []
-        for complaint in request.complaints:
-            result = add_complaint_to_dataset(
-                text=complaint.get('text', ''),
-                category=complaint.get('category'),
-                source=complaint.get('source', 'batch')
-            )
+        labeled_texts, labels = [], []
+        for complaint, result in zip(request.complaints, results):
             if result:
                 collected.append(result)
+                if complaint.get('category'):
+                    labeled_texts.append(result['text'])
+                    labels.append(complaint['category'])
         
         logger.info(f"Toplu şikayet toplandı: {len(collected)} şikayet")
         
+        online_updated = 0
+        if ONLINE_LEARNING_CONFIG["enabled"] and labeled_texts:
+            online_updated = await run_in_threadpool(online_classifier.partial_fit, labeled_texts, labels)
+        
         return {
             "status": "success",
             "total_collected": len(collected),
+            "online_updated": online_updated,
             "complaints": collected,
             "message": f"{len(collected)} şikayet başarıyla toplandı"
         }
@@ -358,54 +743,195 @@ async def collect_batch_complaints(request: BatchComplaintCollectionRequest):
         logger.error(f"Toplu şikayet toplama hatası: {e}")
         raise HTTPException(status_code=500, detail="Toplu şikayet toplanırken hata oluştu")
 
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """Virgülle ayrılmış alan listesini doğrular (cursor için id her zaman dahil)"""
+    if not fields:
+        return COMPLAINT_COLUMNS
+    
+    requested = [field.strip() for field in fields.split(',') if field.strip()]
+    unknown = [field for field in requested if field not in COMPLAINT_COLUMNS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Bilinmeyen alanlar: {', '.join(unknown)}. Geçerli alanlar: {', '.join(COMPLAINT_COLUMNS)}"
+        )
+    return ('id',) + tuple(field for field in dict.fromkeys(requested) if field != 'id')
+
 @app.get("/collect/data")
-async def get_collected_complaints():
-    """Toplanan şikayetleri getir"""
+async def get_collected_complaints(
+    after_id: Optional[int] = Query(None, ge=0, description="Bu id'den sonraki kayıtlar (önceki sayfanın next_after_id değeri)"),
+    limit: int = Query(DATABASE_CONFIG["page_size"], ge=1, le=DATABASE_CONFIG["max_page_size"]),
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    since: Optional[str] = Query(None, description="Bu tarihten (ISO, dahil) itibaren"),
+    until: Optional[str] = Query(None, description="Bu tarihe (ISO, hariç) kadar"),
+    fields: Optional[str] = Query(None, description="Virgülle ayrılmış alanlar, ör. text,category")
+):
+    """
+    Toplanan şikayetleri sayfa sayfa getir
+    
+    Sayfalama id cursor'ı ile yapılır: sonraki sayfa için yanıttaki
+    next_after_id değeri after_id olarak gönderilir (son sayfada None).
+    Toplam ve kategori dağılımı filtreye uyan kayıtlar içindir; filtre
+    yoksa depodaki sayaç tablosundan okunur.
+    """
+    columns = parse_fields(fields)
+    store = data_collector.store
+    
     try:
-        df = get_collected_data()
+        filters = {"source": source, "category": category, "since": since, "until": until}
+        filtered = any(value is not None for value in filters.values())
+        
+        def read_page():
+            page = store.query(after_id=after_id, limit=limit, columns=columns, **filters)
+            distribution = store.category_counts(**filters)
+            total = store.count(**filters) if filtered else sum(distribution.values())
+            return page, distribution, total
         
-        if df.empty:
+        complaints, category_distribution, total = await run_in_threadpool(read_page)
+        
+        if total == 0:
             return {
                 "status": "success",
                 "total_complaints": 0,
+                "category_distribution": {},
                 "complaints": [],
-                "message": "Henüz şikayet toplanmadı"
+                "next_after_id": None,
+                "message": "Filtreye uyan şikayet bulunamadı" if filtered else "Henüz şikayet toplanmadı"
             }
         
         return {
             "status": "success",
-            "total_complaints": len(df),
-            "category_distribution": df['category'].value_counts().to_dict(),
-            "complaints": df.to_dict('records'),
-            "message": f"Toplam {len(df)} şikayet bulundu"
+            "total_complaints": total,
+            "category_distribution": category_distribution,
+            "complaints": complaints,
+            "count": len(complaints),
+            "next_after_id": complaints[-1]['id'] if len(complaints) == limit else None,
+            "message": f"Toplam {total} şikayet bulundu"
         }
         
     except Exception as e:
         logger.error(f"Şikayet getirme hatası: {e}")
         raise HTTPException(status_code=500, detail="Şikayetler alınamadı")
 
-@app.post("/train")
-async def train_model(request: TrainingRequest):
-    """Toplanan şikayetlerle modeli eğit"""
+@app.get("/collect/data/stream")
+async def stream_collected_complaints(
+    after_id: Optional[int] = Query(None, ge=0),
+    category: Optional[str] = None,
+    source: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """
+    Filtreye uyan tüm şikayetleri NDJSON olarak akıt
+    
+    Kayıtlar DATABASE_CONFIG["stream_page_size"] satırlık sorgularla okunup
+    hemen gönderilir; bellek kullanımı veri boyutundan bağımsızdır.
+    """
+    columns = parse_fields(fields)
+    pages = data_collector.store.iter_pages(
+        DATABASE_CONFIG["stream_page_size"], source=source, category=category,
+        since=since, until=until, after_id=after_id, columns=columns
+    )
+    
+    def stream_complaints():
+        for page in pages:
+            yield "".join(json.dumps(complaint, ensure_ascii=False) + "\n" for complaint in page)
+    
+    return StreamingResponse(stream_complaints(), media_type="application/x-ndjson")
+
+@app.get("/dataset/summary")
+async def get_dataset_summary(
+    name: str = Query("training", pattern="^(training|collected)$", description="training: son eğitim verisi, collected: scraper çıktıları"),
+    by: str = Query("source,month", description="Virgülle ayrılmış gruplama kolonları, ör. source,month,complaint_category"),
+    source: Optional[str] = None,
+    since: Optional[str] = Query(None, description="Bu tarihten (ISO, dahil) itibaren"),
+    until: Optional[str] = Query(None, description="Bu tarihe (ISO, hariç) kadar")
+):
+    """
+    Parquet veri setindeki kayıt sayıları
+    
+    Sadece gruplama kolonları okunur; kaynak ve tarih filtreleri bölüm
+    dizinlerine uygulandığından eşleşmeyen bölümler hiç taranmaz.
+    """
+    root = DATASET_CONFIG[f"{name}_dir"]
+    group_by = [column.strip() for column in by.split(',') if column.strip()]
+    
+    available = await run_in_threadpool(dataset.columns, root)
+    if not available:
+        return {"status": "success", "dataset": name, "total": 0, "groups": [], "message": "Veri seti henüz oluşturulmadı"}
+    
+    unknown = [column for column in group_by if column not in available]
+    if not group_by or unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Bilinmeyen kolonlar: {', '.join(unknown) or '-'}. Geçerli kolonlar: {', '.join(available)}"
+        )
+    
     try:
-        logger.info(f"Model eğitimi başlıyor: {len(request.complaints)} şikayet")
-        
-        results = collect_and_train(
-            complaints=request.complaints,
-            save=request.save_model
+        groups = await run_in_threadpool(
+            dataset.summary, root, group_by, source=source, since=since, until=until
         )
+    except Exception as e:
+        logger.error(f"Veri seti özeti hatası: {e}")
+        raise HTTPException(status_code=500, detail="Veri seti özeti alınamadı")
+    
+    return {
+        "status": "success",
+        "dataset": name,
+        "total": sum(group["count"] for group in groups),
+        "groups": groups
+    }
+
+@app.post("/train", status_code=202)
+async def train_model(request: TrainingRequest):
+    """
+    Toplanan şikayetlerle model eğitimini arka planda başlat
+    
+    Eğitim ayrı bir süreçte çalışır ve tahminleri bloklamaz. İlerleme
+    /train/{job_id} ile izlenir; kaydedilen model yayınlanınca otomatik
+    olarak devreye girer.
+    """
+    try:
+        logger.info(f"Model eğitimi isteği: {len(request.complaints)} şikayet")
         
-        logger.info(f"Model eğitimi tamamlandı")
+        # Şikayetler eğitim sürecinde depoya eklenir ve veri orada okunur
+        job = await run_in_threadpool(training_manager.start, request.complaints, save=request.save_model)
         
         return {
-            "status": "success",
-            "training_results": results,
-            "message": "Model başarıyla eğitildi"
+            "status": "accepted",
+            "job_id": job["job_id"],
+            "status_url": f"/train/{job['job_id']}",
+            "message": "Model eğitimi başlatıldı"
         }
         
+    except TrainingInProgressError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         logger.error(f"Model eğitim hatası: {e}")
-        raise HTTPException(status_code=500, detail="Model eğitilirken hata oluştu")
+        raise HTTPException(status_code=500, detail="Model eğitimi başlatılamadı")
+
+@app.get("/train")
+async def list_training_jobs():
+    """Model eğitim işleri"""
+    return {"jobs": await run_in_threadpool(training_manager.list_jobs)}
+
+@app.get("/train/{job_id}")
+async def get_training_job(job_id: str):
+    """Model eğitim işinin durumu, ilerlemesi ve sonuçları"""
+    job = await run_in_threadpool(training_manager.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Eğitim işi bulunamadı")
+    return job
+
+@app.delete("/train/{job_id}")
+async def cancel_training_job(job_id: str):
+    """Çalışan model eğitimini iptal et"""
+    job = await run_in_threadpool(training_manager.cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Eğitim işi bulunamadı")
+    return job
 
 # Root endpoint
 @app.get("/")
@@ -418,14 +944,24 @@ async def root():
         "health": "/health",
         "endpoints": {
             "predict": "/predict - Tekil tahmin",
+            "predict_online": "/predict/online - Artımlı öğrenen online modelle tahmin",
             "batch_predict": "/batch_predict - Toplu tahmin", 
             "categories": "/categories - Kategori listesi",
             "info": "/info - Sistem bilgileri",
             "stats": "/stats - İstatistikler",
+            "metrics": "/metrics - Prometheus metrikleri",
+            "cache_stats": "/cache/stats - Tahmin cache istatistikleri",
+            "model": "/model - Aktif model sürümü",
+            "model_reload": "/model/reload - Modeli kesintisiz yeniden yükle",
+            "upload": "/upload - CSV dosyası ile toplu tahmin",
+            "upload_stream": "/upload/stream - Büyük CSV dosyaları için akış (NDJSON/CSV)",
+            "jobs": "/jobs - Arka plan toplu sınıflandırma işi (durum: /jobs/{id}, sonuç: /jobs/{id}/result)",
             "collect_complaint": "/collect/complaint - Tekil şikayet toplama",
             "collect_batch": "/collect/batch - Toplu şikayet toplama",
-            "get_collected": "/collect/data - Toplanan şikayetleri getir",
-            "train": "/train - Modeli eğit"
+            "get_collected": "/collect/data - Toplanan şikayetleri sayfa sayfa getir (after_id, limit, category, source, since, until, fields)",
+            "stream_collected": "/collect/data/stream - Toplanan şikayetleri NDJSON olarak akıt",
+            "dataset_summary": "/dataset/summary - Parquet veri setinde kaynak/ay/kategori bazında kayıt sayıları",
+            "train": "/train - Model eğitimini arka planda başlat (durum: /train/{id}, iptal: DELETE /train/{id})"
         }
     }
 
@@ -34,7 +34,7 @@ def call_api(endpoint: str, data: dict = None):
         else:
             response = requests.get(url, timeout=10)
         
-        if response.status_code == 200:
+        if response.status_code in (200, 202):
             return response.json()
         else:
             st.error(f"API Hatası: {response.status_code}")
@@ -399,7 +399,7 @@ def show_data_collection():
         
         if st.button("🔄 Verileri Yenile"):
             with st.spinner("Veriler yükleniyor..."):
-                result = call_api("/collect/data")
+                result = call_api("/collect/data?limit=20&fields=text,category,confidence,source")
                 
                 if result and result.get('status') == 'success':
                     total = result.get('total_complaints', 0)
@@ -448,22 +448,31 @@ def show_data_collection():
         
         if st.button("🎓 Modeli Eğit", type="primary"):
             with st.spinner("Model eğitiliyor..."):
-                # Önce verileri al
-                data_result = call_api("/collect/data")
+                # Önce veri olup olmadığını kontrol et
+                data_result = call_api("/collect/data?limit=1&fields=id")
                 
                 if data_result and data_result.get('total_complaints', 0) > 0:
-                    complaints = data_result.get('complaints', [])
-                    
-                    # Modeli eğit
-                    train_result = call_api("/train", {
-                        "complaints": complaints,
+                    # Eğitim sunucudaki tüm toplanmış şikayetlerle yapılır;
+                    # eğitimi başlat ve bitene kadar ilerlemeyi izle
+                    train_job = call_api("/train", {
+                        "complaints": [],
                         "save_model": True
                     })
                     
-                    if train_result and train_result.get('status') == 'success':
+                    train_result = None
+                    if train_job:
+                        progress_bar = st.progress(0.0)
+                        while True:
+                            train_result = call_api(f"/train/{train_job['job_id']}")
+                            if not train_result or train_result.get('status') not in ('running', 'cancelling'):
+                                break
+                            progress_bar.progress(train_result.get('progress', 0.0))
+                            time.sleep(1)
+                    
+                    if train_result and train_result.get('status') == 'completed':
                         st.success("✅ Model başarıyla eğitildi!")
                         
-                        training_results = train_result.get('training_results', {})
+                        training_results = train_result.get('results', {})
                         
                         col1, col2, col3 = st.columns(3)
                         
@@ -474,9 +483,10 @@ def show_data_collection():
                             )
                         
                         with col2:
+                            cv_mean = training_results.get('training_results', {}).get('cv_mean')
                             st.metric(
                                 "CV Ortalaması",
-                                f"{training_results.get('training_results', {}).get('cv_mean', 0):.1%}"
+                                f"{cv_mean:.1%}" if cv_mean is not None else "-"
                             )
                         
                         with col3:
@@ -484,6 +494,8 @@ def show_data_collection():
                                 "Eğitim Seti Boyutu",
                                 training_results.get('training_results', {}).get('train_size', 0)
                             )
+                    elif train_result:
+                        st.error(f"Model eğitimi başarısız: {train_result.get('error') or train_result.get('status')}")
                 else:
                     st.warning("Eğitim için yeterli veri yok. Lütfen önce şikayet ekleyin.")
 
@@ -645,6 +657,22 @@ def show_analytics():
             st.metric("Ortalama Güven", "87.3%", "+2%")
             st.metric("Toplam İşlenen", "15,432", "+8%")
 
+    st.markdown("### 🗂️ Eğitim Verisi Dağılımı")
+
+    # Parquet veri setinden sadece source/month kolonları okunur
+    summary = call_api("/dataset/summary?name=training&by=source,month")
+
+    if summary and summary.get('groups'):
+        df_summary = pd.DataFrame(summary['groups']).sort_values('month')
+        fig = px.bar(
+            df_summary, x='month', y='count', color='source',
+            title=f"Kaynak ve Aya Göre Kayıtlar (toplam {summary['total']})",
+            labels={'month': 'Ay', 'count': 'Kayıt', 'source': 'Kaynak'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("Henüz eğitim veri seti oluşturulmadı. Veri Toplama sayfasından model eğitimi başlatabilirsiniz.")
+
 def show_system_info():
     """Sistem bilgileri sayfası"""
     
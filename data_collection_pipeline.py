@@ -13,9 +13,7 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import numpy as np
-import re
 import json
-import time
 import random
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional
@@ -27,12 +25,74 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import rate_limiter
+from src import dataset
+from src import rate_limiter
+from src import text as text_utils
+from src.config import DATASET_CONFIG
+from src.keywords import KeywordMatcher
 
 # Logging ayarı
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Kategori kuralları (keyword matching) - Türkiye'ye özel 12 kategori sistemi
+CATEGORY_RULES = {
+    "Ürün Kalite Sorunu": {
+        "keywords": ["kalite", "bozuk", "çürük", "hasarlı", "malzeme", "işçilik", "dayanıklı", "kusur"],
+        "weight": 1.0
+    },
+    "Yanlış Ürün": {
+        "keywords": ["yanlış", "farklı", "başka", "istedigim", "sipar", "gelen"],
+        "weight": 1.0
+    },
+    "Eksik Ürün": {
+        "keywords": ["eksik", "yok", "tam değil", "parça", "aks", "kutu"],
+        "weight": 1.0
+    },
+    "Kargo Gecikmesi": {
+        "keywords": ["gecikti", "geç", "zaman", "kargo", "teslimat", "bekliyorum"],
+        "weight": 1.0
+    },
+    "Kargo Firması Problemi": {
+        "keywords": ["kargo firması", "kurye", "dağıtım", "lojistik", "firma"],
+        "weight": 1.0
+    },
+    "İade/Değişim Sorunu": {
+        "keywords": ["iade", "değişim", "para iadesi", "geri gönderme", "işlem"],
+        "weight": 1.0
+    },
+    "Ödeme/Fatura Sorunu": {
+        "keywords": ["fatura", "ödeme", "para", "kart", "faturalandırma", "tutar"],
+        "weight": 1.0
+    },
+    "Müşteri Hizmetleri Sorunu": {
+        "keywords": ["müşteri hizmetleri", "temsilci", "telefon", "destek", "yardım"],
+        "weight": 1.0
+    },
+    "Paketleme/Ambalaj Problemi": {
+        "keywords": ["paket", "ambalaj", "kutu", "paketleme", "hasar", "ezik"],
+        "weight": 1.0
+    },
+    "Ürün Açıklaması Yanıltıcı": {
+        "keywords": ["açıklama", "fotoğraf", "özellik", "yanlış", "farklı", "uymuyor"],
+        "weight": 1.0
+    },
+    "Hizmet Kalite Sorunu": {
+        "keywords": ["hizmet", "kalite", "personel", "davranış", "ortam", "işletme"],
+        "weight": 1.0
+    },
+    "Teknik/Uygulama Sorunu": {
+        "keywords": ["teknik", "uygulama", "yazılım", "sistem", "hata", "çalışmıyor"],
+        "weight": 1.0
+    }
+}
+
+# Kurallardan bir kez derlenen Aho-Corasick eşleştirici
+CATEGORY_MATCHER = KeywordMatcher(
+    {category: rules["keywords"] for category, rules in CATEGORY_RULES.items()},
+    weights={category: rules["weight"] for category, rules in CATEGORY_RULES.items()}
+)
+
 class TurkeyComplaintDataCollector:
     """
     Türkiye'ye özel müşteri şikayet data toplama sınıfı
@@ -42,6 +102,7 @@ class TurkeyComplaintDataCollector:
         """Data collector başlatma"""
         self.config = self.load_config(config_path)
         self.collected_data = []
+        # Host başına token bucket: sadece bütçe tükenince bekler
         self.rate_limiter = rate_limiter.RateLimiter(
             calls_per_minute=self.config.get("rate_limit", 30)
         )
@@ -68,95 +129,21 @@ class TurkeyComplaintDataCollector:
     
     def clean_text(self, text: str) -> str:
         """Metin temizleme fonksiyonu"""
-        if not text:
-            return ""
-            
-        # Temel temizlik
-        text = re.sub(r'\s+', ' ', text)  # Çoklu boşlukları tek boşluk
-        text = re.sub(r'[^\w\s.,!?ğüşıöçĞÜŞIİÖÇ]', '', text)  # Özel karakterleri temizle
-        text = text.strip()
-        
         # Kısa metinleri filtrele (5 karakterden az)
-        if len(text) < 5:
-            return ""
-            
-        return text
+        return text_utils.clean_text(text, min_length=5)
     
     def categorize_complaint(self, text: str) -> Tuple[str, float]:
         """
         Metni otomatik kategorize etme
         Türkiye'ye özel 12 kategori sistemi
         """
-        text_lower = text.lower()
-        
-        # Kategori kuralları (keyword matching)
-        category_rules = {
-            "Ürün Kalite Sorunu": {
-                "keywords": ["kalite", "bozuk", "çürük", "hasarlı", "malzeme", "işçilik", "dayanıklı", "kusur"],
-                "weight": 1.0
-            },
-            "Yanlış Ürün": {
-                "keywords": ["yanlış", "farklı", "başka", "istedigim", "sipar", "gelen"],
-                "weight": 1.0
-            },
-            "Eksik Ürün": {
-                "keywords": ["eksik", "yok", "tam değil", "parça", "aks", "kutu"],
-                "weight": 1.0
-            },
-            "Kargo Gecikmesi": {
-                "keywords": ["gecikti", "geç", "zaman", "kargo", "teslimat", "bekliyorum"],
-                "weight": 1.0
-            },
-            "Kargo Firması Problemi": {
-                "keywords": ["kargo firması", "kurye", "dağıtım", "lojistik", "firma"],
-                "weight": 1.0
-            },
-            "İade/Değişim Sorunu": {
-                "keywords": ["iade", "değişim", "para iadesi", "geri gönderme", "işlem"],
-                "weight": 1.0
-            },
-            "Ödeme/Fatura Sorunu": {
-                "keywords": ["fatura", "ödeme", "para", "kart", "faturalandırma", "tutar"],
-                "weight": 1.0
-            },
-            "Müşteri Hizmetleri Sorunu": {
-                "keywords": ["müşteri hizmetleri", "temsilci", "telefon", "destek", "yardım"],
-                "weight": 1.0
-            },
-            "Paketleme/Ambalaj Problemi": {
-                "keywords": ["paket", "ambalaj", "kutu", "paketleme", "hasar", "ezik"],
-                "weight": 1.0
-            },
-            "Ürün Açıklaması Yanıltıcı": {
-                "keywords": ["açıklama", "fotoğraf", "özellik", "yanlış", "farklı", "uymuyor"],
-                "weight": 1.0
-            },
-            "Hizmet Kalite Sorunu": {
-                "keywords": ["hizmet", "kalite", "personel", "davranış", "ortam", "işletme"],
-                "weight": 1.0
-            },
-            "Teknik/Uygulama Sorunu": {
-                "keywords": ["teknik", "uygulama", "yazılım", "sistem", "hata", "çalışmıyor"],
-                "weight": 1.0
-            }
-        }
-        
-        # Keyword scoring
-        scores = {}
-        for category, rules in category_rules.items():
-            score = 0
-            for keyword in rules["keywords"]:
-                if keyword in text_lower:
-                    score += rules["weight"]
-            scores[category] = score
-        
-        # En yüksek skorlu kategoriyi seç
-        if max(scores.values()) > 0:
-            predicted_category = max(scores, key=scores.get)
-            confidence = min(scores[predicted_category] / 3.0, 1.0)  # Normalize confidence
-            return predicted_category, confidence
-        else:
-            return "Bilinmeyen", 0.0
+        return CATEGORY_MATCHER.categorize(text)
+    
+    def categorize_complaints(self, texts: List[str]) -> List[Tuple[str, float]]:
+        """
+        Bir sayfadaki şikayetleri toplu kategorize etme
+        """
+        return CATEGORY_MATCHER.categorize_batch(texts)
     
     def scrape_google_maps_reviews(self, business_name: str, location: str, max_reviews: int = 100) -> List[Dict]:
         """
@@ -168,33 +155,39 @@ class TurkeyComplaintDataCollector:
             # Google Places API kullanımı (gerçek implementasyon)
             # Place Search + Place Details + Reviews API
             
+            self.rate_limiter.wait('google_maps')
             place_id = self._find_place_id(business_name, location)
             if not place_id:
                 logger.warning(f"İşletme bulunamadı: {business_name}")
                 return []
             
+            self.rate_limiter.wait('google_maps')
             reviews = self._fetch_place_reviews(place_id, max_reviews)
             
             # Sadece negatif yorumları filtrele (1-2 yıldız)
-            negative_reviews = []
+            kept_reviews = []
             for review in reviews:
                 if review.get('rating', 0) <= 2:
                     cleaned_text = self.clean_text(review.get('text', ''))
                     if cleaned_text:
-                        category, confidence = self.categorize_complaint(cleaned_text)
-                        
-                        negative_reviews.append({
-                            'text': cleaned_text,
-                            'category': category,
-                            'confidence': confidence,
-                            'source': 'google_maps',
-                            'rating': review.get('rating', 0),
-                            'business_name': business_name,
-                            'location': location,
-                            'date': review.get('time', ''),
-                            'author': review.get('author_name', ''),
-                            'raw_data': review
-                        })
+                        kept_reviews.append((review, cleaned_text))
+            
+            categorized = self.categorize_complaints([cleaned_text for _, cleaned_text in kept_reviews])
+            
+            negative_reviews = []
+            for (review, cleaned_text), (category, confidence) in zip(kept_reviews, categorized):
+                negative_reviews.append({
+                    'text': cleaned_text,
+                    'category': category,
+                    'confidence': confidence,
+                    'source': 'google_maps',
+                    'rating': review.get('rating', 0),
+                    'business_name': business_name,
+                    'location': location,
+                    'date': review.get('time', ''),
+                    'author': review.get('author_name', ''),
+                    'raw_data': review
+                })
             
             logger.info(f"Google Maps'ten {len(negative_reviews)} negatif yorum toplandı")
             return negative_reviews
@@ -221,12 +214,13 @@ class TurkeyComplaintDataCollector:
             }
             
             for page in range(1, max_pages + 1):
-                self.rate_limiter.wait()
-                
                 url = f"https://www.sikayetvar.com/{category or ''}?page={page}"
+                self.rate_limiter.wait(url)
                 
                 try:
                     response = requests.get(url, headers=headers, timeout=self.config['timeout'])
+                    if response.status_code == 429:
+                        self.rate_limiter.retry_after(url, response.headers)
                     response.raise_for_status()
                     
                     soup = BeautifulSoup(response.content, 'html.parser')
@@ -299,7 +293,7 @@ class TurkeyComplaintDataCollector:
                     products = self._get_category_products(platform, category, max_products // len(categories))
                     
                     for product in products:
-                        self.rate_limiter.wait()
+                        self.rate_limiter.wait(platform)
                         product_reviews = self._get_product_reviews(platform, product['id'])
                         
                         # Sadece negatif yorumları filtrele
@@ -346,7 +340,7 @@ class TurkeyComplaintDataCollector:
         synthetic_data = []
         
         # Her kategori için eşit dağılım
-        categories = list(self.categorize_complaint("dummy").keys())
+        categories = list(CATEGORY_RULES)
         samples_per_category = num_samples // len(categories)
         
         openai.api_key = self.config['openai_api_key']
@@ -435,7 +429,6 @@ class TurkeyComplaintDataCollector:
         for business, location in sample_businesses:
             google_data = self.scrape_google_maps_reviews(business, location, 20)
             all_data.extend(google_data)
-            time.sleep(2)  # Rate limiting
         
         # 2. Şikayetvar
         sikayetvar_data = self.scrape_sikayetvar(max_pages=5)
@@ -466,15 +459,24 @@ class TurkeyComplaintDataCollector:
         return df
     
     def save_data(self, df: pd.DataFrame, filename: str = None) -> str:
-        """Toplanan veriyi kaydetme"""
+        """
+        Toplanan veriyi kaydetme
+        
+        Varsayılan olarak kayıtlar kaynak/ay bölümlü Parquet veri setine
+        (DATASET_CONFIG["collected_dir"]) eklenir. filename verilirse
+        data/collected altına tek dosya yazılır (.parquet veya CSV).
+        """
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"turkey_complaints_dataset_{timestamp}.csv"
+            filepath = dataset.write(df, DATASET_CONFIG["collected_dir"])
+            return str(filepath)
         
         filepath = Path("data/collected") / filename
         filepath.parent.mkdir(parents=True, exist_ok=True)
         
-        df.to_csv(filepath, index=False, encoding='utf-8')
+        if filepath.suffix.lower() == '.parquet':
+            df.to_parquet(filepath, index=False)
+        else:
+            df.to_csv(filepath, index=False, encoding='utf-8')
         logger.info(f"Veri kaydedildi: {filepath}")
         
         return str(filepath)
@@ -485,19 +487,19 @@ if __name__ == "__main__":
     collector = TurkeyComplaintDataCollector()
     
     # Tüm veriyi topla
-    dataset = collector.collect_all_data()
+    collected = collector.collect_all_data()
     
-    if not dataset.empty:
+    if not collected.empty:
         # Veriyi kaydet
-        filepath = collector.save_data(dataset)
+        filepath = collector.save_data(collected)
         
         # Özet istatistikler
         print(f"\n📊 Veri Toplama Özeti:")
-        print(f"Toplam kayıt: {len(dataset)}")
+        print(f"Toplam kayıt: {len(collected)}")
         print(f"Kaynak dağılımı:")
-        print(dataset['source'].value_counts())
+        print(collected['source'].value_counts())
         print(f"\nKategori dağılımı:")
-        print(dataset['category'].value_counts())
+        print(collected['category'].value_counts())
         
         print(f"\n✅ Dataset kaydedildi: {filepath}")
     else:
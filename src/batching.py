@@ -0,0 +1,137 @@
+"""
+Micro-batching modülü - Eşzamanlı tekil tahmin isteklerini tek model çağrısında birleştirir
+"""
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+from src.executor import InferenceExecutor, InferenceSaturatedError
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionBatcher:
+    """
+    Kısa bir pencere içinde gelen tekil tahmin isteklerini toplayıp
+    vektörize batch olarak çalıştıran in-process dağıtıcı
+
+    İlk istek geldiğinde ``max_wait_ms`` süresince (veya ``max_batch_size``
+    isteğe ulaşılana kadar) yeni istekler beklenir, ardından hepsi tek bir
+    ``predict`` çağrısıyla işlenir ve her çağırana kendi sonucu döner.
+    Bir batch çalışırken gelen istekler sonraki batch'te toplanır.
+    """
+
+    def __init__(self, predict: Callable[[List[str]], List[Dict]],
+                 validate: Callable[[str], None],
+                 executor: InferenceExecutor,
+                 max_wait_ms: float = 3.0, max_batch_size: int = 32,
+                 max_queue_depth: int = 1024):
+        """
+        Args:
+            predict: Doğrulanmış metin listesi için sonuç listesi döndüren fonksiyon
+            validate: Geçersiz metinde ValueError fırlatan doğrulama fonksiyonu
+            executor: Batch'lerin çalıştırılacağı inference executor'ı
+            max_wait_ms: Batch toplama penceresi (milisaniye)
+            max_batch_size: Batch başına maksimum istek sayısı
+            max_queue_depth: Bekleyebilecek maksimum istek sayısı
+        """
+        self.predict = predict
+        self.validate = validate
+        self.executor = executor
+        self.max_wait = max_wait_ms / 1000.0
+        self.max_batch_size = max_batch_size
+        self.max_queue_depth = max_queue_depth
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def _ensure_worker(self) -> None:
+        """Kuyruk ve arka plan görevini çalışan event loop üzerinde başlatır"""
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def submit(self, text: str) -> Dict:
+        """
+        Tek bir metni sıraya alır ve batch sonucunu bekler
+
+        Args:
+            text: Tahmin edilecek metin
+
+        Returns:
+            Tahmin sonucu
+
+        Raises:
+            ValueError: Metin doğrulamadan geçemezse
+            InferenceSaturatedError: Bekleyen istek sayısı limiti aştığında
+        """
+        # Doğrulama hatası batch'i beklemeden döner
+        self.validate(text)
+
+        self._ensure_worker()
+        if self._queue.qsize() >= self.max_queue_depth:
+            raise InferenceSaturatedError(self.executor.retry_after_seconds)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _collect(self) -> List[Tuple[str, asyncio.Future]]:
+        """Pencere dolana veya batch boyutuna ulaşılana kadar istek toplar"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # Kuyrukta bekleyenleri beklemeden al
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Batch'i inference havuzunda çalıştırıp sonuçları dağıtır"""
+        # İptal edilmiş (istemcisi kopmuş) istekler hesaplanmaz
+        batch = [(text, future) for text, future in batch if not future.done()]
+        if not batch:
+            return
+
+        texts = [text for text, _ in batch]
+
+        try:
+            results = await self.executor.run(self.predict, texts)
+        except Exception as e:
+            logger.error(f"Micro-batch tahmin hatası: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run(self) -> None:
+        """Arka plan döngüsü"""
+        while True:
+            batch = await self._collect()
+            await self._dispatch(batch)
+
+    async def close(self) -> None:
+        """Arka plan görevini durdurur"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
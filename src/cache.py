@@ -0,0 +1,133 @@
+"""
+Cache modülü - İçerik adresli LRU tahmin cache'i
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+def copy_result(value: Dict) -> Dict:
+    """Sonucun iç içe sözlükleriyle (ör. all_probabilities) birlikte kopyası"""
+    return {key: dict(item) if isinstance(item, dict) else item for key, item in value.items()}
+
+
+class PredictionCache:
+    """
+    TTL destekli, boyut sınırlı LRU tahmin cache'i
+
+    Anahtar, model sürümü ile modelin gerçekten gördüğü girdinin
+    (ön işlenmiş metin, karakter ve kelime sayısı) hash'idir; bu sayede
+    yalnızca noktalama veya büyük/küçük harf farkı olan şablon metinler
+    aynı kayda düşer. Kayıtlar iç içe sözlükleriyle birlikte kopyalanarak
+    saklanır ve döndürülür; çağıranın sonucu değiştirmesi cache'i bozmaz.
+    Thread-safe'tir.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 3600):
+        """
+        Args:
+            max_size: Maksimum kayıt sayısı (0 ise cache kapalı)
+            ttl_seconds: Kaydın geçerlilik süresi (saniye)
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Cache açık mı"""
+        return self.max_size > 0
+
+    @staticmethod
+    def make_key(model_version: str, cleaned_text: str, text_length: int, word_count: int) -> str:
+        """
+        Cache anahtarı üretir
+
+        Args:
+            model_version: Yüklü modelin sürümü
+            cleaned_text: Ön işlenmiş metin
+            text_length: Ham metnin karakter sayısı
+            word_count: Ham metnin kelime sayısı
+
+        Returns:
+            Hex digest
+        """
+        payload = f"{model_version}\x00{text_length}\x00{word_count}\x00{cleaned_text}"
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Kaydı getirir; yoksa veya süresi dolmuşsa None döner
+
+        Args:
+            key: Cache anahtarı
+
+        Returns:
+            Sonucun kopyası veya None
+        """
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy_result(entry[1])
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Kaydı ekler, gerekirse en eski kaydı çıkarır
+
+        Args:
+            key: Cache anahtarı
+            value: Tahmin sonucu
+        """
+        if not self.enabled:
+            return
+
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, copy_result(value))
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Tüm kayıtları siler (sayaçlar korunur)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """
+        Cache istatistikleri
+
+        Returns:
+            Boyut, hit/miss sayaçları ve hit oranı
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
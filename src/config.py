@@ -18,14 +18,87 @@ MODEL_CONFIG = {
     "tfidf_path": MODELS_DIR / "tfidf_vectorizer.pkl", 
     "scaler_path": MODELS_DIR / "feature_scaler.pkl",
     "metadata_path": MODELS_DIR / "model_metadata.json",
+    "engine_dir": MODELS_DIR / "inference_engine",
+    # Sürümlü modeller versions/<sürüm>/ altında, aktif sürüm CURRENT dosyasında
+    "versions_dir": MODELS_DIR / "versions",
+    "current_version_path": MODELS_DIR / "CURRENT",
+    "keep_versions": int(os.getenv("MODEL_KEEP_VERSIONS", "3")),  # aktif sürüm dışında saklanan eski sürüm
+    "reload_poll_seconds": float(os.getenv("MODEL_RELOAD_POLL_SECONDS", "5")),  # 0 = kapalı
 }
 
 # API konfigürasyonu
+def _resolve_workers(value: str) -> int:
+    """API_WORKERS değerini çözer; "auto" çekirdek sayısı kadar worker demektir"""
+    if value.lower() == "auto":
+        return os.cpu_count() or 1
+    return max(int(value), 1)
+
 API_CONFIG = {
     "host": "0.0.0.0",
     "port": 8000,
     "reload": False,
-    "workers": 1,
+    # Model dizileri mmap ile paylaşıldığı için worker sayısı RSS'i katlamaz
+    "workers": _resolve_workers(os.getenv("API_WORKERS", "1")),
+}
+
+# Tahmin cache konfigürasyonu
+CACHE_CONFIG = {
+    "max_size": int(os.getenv("PREDICTION_CACHE_SIZE", "10000")),  # 0 = kapalı
+    "ttl_seconds": float(os.getenv("CACHE_TTL", "3600")),
+}
+
+# Inference thread havuzu konfigürasyonu
+INFERENCE_CONFIG = {
+    "max_workers": int(os.getenv("INFERENCE_WORKERS", str(min(4, os.cpu_count() or 1)))),
+    "max_queue_depth": int(os.getenv("INFERENCE_QUEUE_DEPTH", "64")),
+    "retry_after_seconds": int(os.getenv("INFERENCE_RETRY_AFTER", "1")),
+}
+
+# /predict micro-batching konfigürasyonu
+BATCHING_CONFIG = {
+    "enabled": os.getenv("PREDICT_BATCHING", "true").lower() == "true",
+    "max_wait_ms": float(os.getenv("PREDICT_BATCH_WAIT_MS", "3")),
+    "max_batch_size": int(os.getenv("PREDICT_BATCH_SIZE", "32")),
+    "max_queue_depth": int(os.getenv("PREDICT_BATCH_QUEUE_DEPTH", "1024")),
+}
+
+# Dosya yükleme konfigürasyonu
+UPLOAD_CONFIG = {
+    "chunk_size": int(os.getenv("UPLOAD_CHUNK_SIZE", "1000")),  # satır
+}
+
+# Artımlı (online) öğrenme konfigürasyonu
+ONLINE_LEARNING_CONFIG = {
+    "enabled": os.getenv("ONLINE_LEARNING", "true").lower() == "true",
+    "model_path": MODELS_DIR / "online_model.pkl",
+    "n_features": 2 ** 18,  # HashingVectorizer boyutu
+    "save_every": int(os.getenv("ONLINE_SAVE_EVERY", "200")),  # örnek
+}
+
+# Toplu iş (arka plan sınıflandırma) konfigürasyonu
+JOBS_CONFIG = {
+    "jobs_dir": PROCESSED_DATA_DIR / "jobs",
+    "chunk_size": int(os.getenv("JOB_CHUNK_SIZE", "5000")),  # satır
+}
+
+# Tam model eğitimi konfigürasyonu
+TRAINING_CONFIG = {
+    # full: tüm eğitim seti, sampled: cv_sample_size'lık tabakalı örnek, none: CV yok,
+    # auto: eğitim seti cv_sample_size'dan büyükse sampled, değilse full
+    "cv_mode": os.getenv("TRAINING_CV_MODE", "auto"),
+    "cv_folds": 5,
+    "cv_sample_size": int(os.getenv("TRAINING_CV_SAMPLE_SIZE", "50000")),  # satır
+    # CV fold'ları için süreç sayısı; eğitim API worker'larının yanında çalıştığı için
+    # varsayılan çekirdeklerin yarısıdır (-1: tüm çekirdekler)
+    "n_jobs": int(os.getenv("TRAINING_N_JOBS", str(max((os.cpu_count() or 1) // 2, 1)))),
+    # Veri dosyası + TF-IDF ayarları aynıysa özellik matrisi yeniden hesaplanmaz
+    "feature_cache": os.getenv("FEATURE_CACHE", "true").lower() == "true",
+    "feature_cache_dir": PROCESSED_DATA_DIR / "feature_cache",
+    "feature_cache_max_entries": int(os.getenv("FEATURE_CACHE_MAX_ENTRIES", "5")),
+    # Veri dosyası bu boyutta parçalar halinde okunup özelliklere dönüştürülür
+    "load_chunk_size": int(os.getenv("TRAINING_LOAD_CHUNK_SIZE", "100000")),  # satır
+    # /train iş durumları ve eğitim kilidi (tüm API worker'ları paylaşır)
+    "jobs_dir": PROCESSED_DATA_DIR / "training_jobs",
 }
 
 # Uygulama konfigürasyonu
@@ -73,6 +146,23 @@ DATA_PATHS = {
     "processed_data": PROCESSED_DATA_DIR / "processed_complaints.csv",
 }
 
+# Scraper (async motor) konfigürasyonu
+SCRAPER_CONFIG = {
+    "max_connections": int(os.getenv("SCRAPER_MAX_CONNECTIONS", "32")),  # tüm host'lar için havuz
+    "max_per_host": int(os.getenv("SCRAPER_MAX_PER_HOST", "2")),  # host başına eşzamanlı istek
+    # Host başına token bucket (src/rate_limiter.py); 30/dk eski 1-3 sn rastgele beklemelerin ortalamasıdır
+    "calls_per_minute": float(os.getenv("SCRAPER_CALLS_PER_MINUTE", "30")),
+    "burst": float(os.getenv("SCRAPER_BURST", "1")),
+    "timeout_seconds": float(os.getenv("SCRAPER_TIMEOUT", "20")),
+    "max_retries": 3,
+}
+
+# Parquet veri setleri (source=<kaynak>/month=<YYYY-MM> bölümlü)
+DATASET_CONFIG = {
+    "collected_dir": DATA_DIR / "collected" / "dataset",  # scraper çıktıları (ekleme)
+    "training_dir": PROCESSED_DATA_DIR / "training_dataset",  # /train verisi (her eğitimde yenilenir)
+}
+
 # Environment variables
 def get_env_var(key: str, default=None):
     """Environment variable al"""
@@ -81,8 +171,11 @@ def get_env_var(key: str, default=None):
 # Debug modu
 DEBUG = get_env_var("DEBUG", "False").lower() == "true"
 
-# Database (gelecekte kullanım için)
+# Database (toplanan şikayet deposu, SQLite WAL)
 DATABASE_CONFIG = {
     "url": get_env_var("DATABASE_URL", "sqlite:///./complaints.db"),
     "echo": DEBUG,
+    "page_size": int(get_env_var("COLLECT_PAGE_SIZE", "100")),  # /collect/data varsayılan sayfa
+    "max_page_size": int(get_env_var("COLLECT_MAX_PAGE_SIZE", "1000")),
+    "stream_page_size": 1000,  # /collect/data/stream sorgu başına kayıt
 }
\ No newline at end of file
@@ -0,0 +1,231 @@
+"""
+Veri seti modülü - Toplanan ve eğitim verisi için kaynak/ay bölümlü Parquet deposu
+"""
+import logging
+import os
+import shutil
+import uuid
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+# Hive tarzı dizinler: <kök>/source=<kaynak>/month=<YYYY-MM>/part-*.parquet
+PARTITION_COLUMNS = ('source', 'month')
+UNKNOWN_PARTITION = 'unknown'
+
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    # Şema açık verilir: "2024-05" veya sayısal kaynak adları tip çıkarımıyla bozulmaz
+    return ds.partitioning(pa.schema([(column, pa.string()) for column in PARTITION_COLUMNS]), flavor='hive')
+
+
+def is_dataset(path: Union[str, Path]) -> bool:
+    """Yol bölümlü bir Parquet veri seti dizini mi"""
+    return Path(path).is_dir()
+
+
+def month_of(dates: pd.Series) -> pd.Series:
+    """
+    Tarihlerden ay bölümü (YYYY-MM) üretir
+
+    Args:
+        dates: ISO tarih metinleri veya datetime değerleri
+
+    Returns:
+        Ay değerleri (okunamayan tarihler için UNKNOWN_PARTITION)
+    """
+    parsed = pd.to_datetime(dates.astype(str).str[:10], format='%Y-%m-%d', errors='coerce')
+    return parsed.dt.strftime('%Y-%m').fillna(UNKNOWN_PARTITION).astype(str)
+
+
+def write(df: pd.DataFrame, root: Union[str, Path], date_column: str = 'date',
+          replace: bool = False) -> Path:
+    """
+    Dataframe'i kaynak ve aya göre bölümlü Parquet olarak yazar
+
+    Varsayılan olarak yeni parça dosyaları mevcut veri setine eklenir.
+    replace=True ile veri seti geçici dizine yazılıp eskisinin yerine
+    taşınır; okuyucular yarım yazılmış bir veri seti görmez.
+
+    Args:
+        df: Yazılacak kayıtlar (source ve date_column kolonları bölüm için kullanılır)
+        root: Veri seti kök dizini
+        date_column: Ay bölümünün türetileceği kolon
+        replace: Mevcut veri seti tamamen değiştirilsin mi
+
+    Returns:
+        Veri seti kök dizini
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    root = Path(root)
+    root.parent.mkdir(parents=True, exist_ok=True)
+
+    df = df.copy()
+    if 'source' in df.columns:
+        df['source'] = df['source'].astype(object).fillna(UNKNOWN_PARTITION).astype(str)
+    else:
+        df['source'] = UNKNOWN_PARTITION
+    if date_column in df.columns:
+        df['month'] = month_of(df[date_column])
+    else:
+        df['month'] = UNKNOWN_PARTITION
+
+    target = root.with_name(f".{root.name}.{uuid.uuid4().hex[:8]}.tmp") if replace else root
+    try:
+        ds.write_dataset(
+            pa.Table.from_pandas(df, preserve_index=False), target,
+            format='parquet', partitioning=_partitioning(),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore'
+        )
+        if replace:
+            _swap(target, root)
+    except Exception:
+        if replace:
+            shutil.rmtree(target, ignore_errors=True)
+        raise
+
+    logger.info(f"Veri seti yazıldı: {root} ({len(df)} kayıt)")
+    return root
+
+
+def _swap(new_dir: Path, root: Path) -> None:
+    """Yeni yazılan dizini eski veri setinin yerine taşır"""
+    old_dir = root.with_name(f".{root.name}.{uuid.uuid4().hex[:8]}.old")
+    if root.exists():
+        os.replace(root, old_dir)
+    os.replace(new_dir, root)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def _filter(source: Optional[Union[str, Sequence[str]]] = None,
+            since: Optional[str] = None, until: Optional[str] = None,
+            date_column: str = 'date'):
+    """
+    Filtrelerden pyarrow ifadesi üretir
+
+    Kaynak ve ay koşulları bölüm dizinlerine uygulanır (eşleşmeyen dizinler
+    hiç okunmaz); since/until ayrıca satır düzeyinde date_column'a uygulanır.
+    """
+    import pyarrow.dataset as ds
+
+    conditions = []
+    if source is not None:
+        sources = [source] if isinstance(source, str) else list(source)
+        conditions.append(ds.field('source').isin(sources))
+    if since is not None:
+        conditions.append(ds.field('month') >= since[:7])
+        conditions.append(ds.field(date_column) >= since)
+    if until is not None:
+        conditions.append(ds.field('month') <= until[:7])
+        conditions.append(ds.field(date_column) < until)
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def _dataset(root: Union[str, Path]):
+    import pyarrow.dataset as ds
+    return ds.dataset(str(root), format='parquet', partitioning=_partitioning())
+
+
+def columns(root: Union[str, Path]) -> List[str]:
+    """
+    Veri setindeki kolonlar (bölüm kolonları dahil)
+
+    Returns:
+        Kolon adları; veri seti yoksa boş liste
+    """
+    if not is_dataset(root):
+        return []
+    return list(_dataset(root).schema.names)
+
+
+def _to_pandas(table) -> pd.DataFrame:
+    """Bölüm kolonları categorical olarak döner"""
+    df = table.to_pandas()
+    partitions = {column: 'category' for column in PARTITION_COLUMNS if column in df.columns}
+    return df.astype(partitions) if partitions else df
+
+
+def read(root: Union[str, Path], columns: Optional[List[str]] = None,
+         date_column: str = 'date', **filters) -> pd.DataFrame:
+    """
+    Veri setini (veya bir dilimini) okur
+
+    Args:
+        root: Veri seti kök dizini
+        columns: Okunacak kolonlar (None: tümü); diğer kolonlar diskten okunmaz
+        date_column: since/until filtresinin uygulandığı kolon
+        **filters: source (tek değer veya liste), since (ISO, dahil), until (ISO, hariç)
+
+    Returns:
+        Kayıtlar
+    """
+    table = _dataset(root).to_table(columns=columns, filter=_filter(date_column=date_column, **filters))
+    return _to_pandas(table)
+
+
+def iter_batches(root: Union[str, Path], batch_size: int = 100000,
+                 columns: Optional[List[str]] = None, date_column: str = 'date',
+                 **filters) -> Iterator[pd.DataFrame]:
+    """
+    Veri setini parça parça okur (tüm dilim belleğe alınmaz)
+
+    Args:
+        root: Veri seti kök dizini
+        batch_size: Parça başına en fazla satır
+        columns: Okunacak kolonlar (None: tümü)
+        date_column: since/until filtresinin uygulandığı kolon
+        **filters: read ile aynı filtreler
+
+    Yields:
+        Boş olmayan dataframe parçaları
+    """
+    import pyarrow as pa
+
+    scanner = _dataset(root).scanner(
+        columns=columns, filter=_filter(date_column=date_column, **filters), batch_size=batch_size
+    )
+    # Her bölüm dosyası ayrı (küçük) batch'ler üretir; batch_size'a kadar birleştirilir
+    pending, pending_rows = [], 0
+    for batch in scanner.to_batches():
+        if not batch.num_rows:
+            continue
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= batch_size:
+            yield _to_pandas(pa.Table.from_batches(pending))
+            pending, pending_rows = [], 0
+    if pending:
+        yield _to_pandas(pa.Table.from_batches(pending))
+
+
+def summary(root: Union[str, Path], by: Sequence[str] = PARTITION_COLUMNS,
+            date_column: str = 'date', **filters) -> List[Dict[str, Any]]:
+    """
+    Kayıt sayılarını gruplar halinde döndürür
+
+    Sadece gruplama kolonları okunur; metin kolonları diskten hiç okunmaz.
+
+    Args:
+        root: Veri seti kök dizini
+        by: Gruplama kolonları (ör. source, month, category)
+        date_column: since/until filtresinin uygulandığı kolon
+        **filters: read ile aynı filtreler
+
+    Returns:
+        Her grup için kolon değerleri ve 'count' (çoktan aza)
+    """
+    by = list(by)
+    table = _dataset(root).to_table(columns=by, filter=_filter(date_column=date_column, **filters))
+    counts = table.group_by(by).aggregate([([], 'count_all')]).rename_columns(by + ['count'])
+    return counts.sort_by([('count', 'descending')]).to_pylist()
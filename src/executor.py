@@ -0,0 +1,109 @@
+"""
+Executor modülü - CPU yoğun inference işlerini event loop dışında çalıştırır
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class InferenceSaturatedError(Exception):
+    """Inference kuyruğu dolu olduğunda fırlatılır (HTTP 503)"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Inference kuyruğu dolu, {retry_after} saniye sonra tekrar deneyin")
+        self.retry_after = retry_after
+
+
+class InferenceExecutor:
+    """
+    Sınırlı thread havuzu ve kuyruk derinliği limiti olan inference executor'ı
+
+    Senkron tahmin fonksiyonları havuzda çalışır, böylece büyük batch'ler
+    event loop'u (ve /health gibi hafif endpoint'leri) bloklamaz. Çalışan ve
+    bekleyen iş sayısı ``max_workers + max_queue_depth`` değerine ulaştığında
+    yeni işler kabul edilmez ve InferenceSaturatedError fırlatılır. Bir iş,
+    bekleyen istek iptal edilse bile (ör. istemci bağlantıyı kopardı) havuzdaki
+    thread gerçekten bitene kadar sayılmaya devam eder.
+    """
+
+    def __init__(self, max_workers: int = 4, max_queue_depth: int = 64,
+                 retry_after_seconds: int = 1):
+        """
+        Args:
+            max_workers: Havuzdaki thread sayısı
+            max_queue_depth: Boş thread bekleyebilecek maksimum iş sayısı
+            retry_after_seconds: Doygunlukta istemciye önerilen bekleme süresi
+        """
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.retry_after_seconds = retry_after_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='inference')
+        # Event loop'ta artırılır, işi bitiren thread'de azaltılır
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Çalışan + kuyrukta bekleyen iş sayısı"""
+        return self._pending
+
+    @property
+    def queue_depth(self) -> int:
+        """Boş thread bekleyen iş sayısı"""
+        return max(self._pending - self.max_workers, 0)
+
+    def check_capacity(self) -> None:
+        """
+        Kuyruk doluysa hata fırlatır
+
+        Raises:
+            InferenceSaturatedError: Kuyruk limiti aşıldığında
+        """
+        if self._pending >= self.max_workers + self.max_queue_depth:
+            raise InferenceSaturatedError(self.retry_after_seconds)
+
+    async def run(self, func: Callable, *args: Any) -> Any:
+        """
+        Fonksiyonu havuzda çalıştırır ve sonucunu bekler
+
+        Args:
+            func: Senkron fonksiyon
+            *args: Fonksiyon argümanları
+
+        Returns:
+            Fonksiyonun dönüş değeri
+
+        Raises:
+            InferenceSaturatedError: Kuyruk limiti aşıldığında
+        """
+        self.check_capacity()
+
+        with self._pending_lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._release()
+            raise
+        # İptal edilen coroutine değil, thread'deki iş bitince azaltılır
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future = None) -> None:
+        """Biten (veya başlamadan iptal edilen) işi sayaçtan düşer"""
+        with self._pending_lock:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        """Havuzu kapatır"""
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> dict:
+        """Havuz durumu"""
+        return {
+            'max_workers': self.max_workers,
+            'max_queue_depth': self.max_queue_depth,
+            'pending': self._pending,
+            'queue_depth': self.queue_depth
+        }
@@ -0,0 +1,154 @@
+"""
+Özellik cache modülü - Aynı veri ve vektörleştirici ayarlarıyla hesaplanan özellik matrisini diskte saklar
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+import joblib
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+import sklearn
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Özellik çıkarımı (normalizasyon, ek özellikler, birleştirme) değişince artırılır
+FEATURE_CACHE_VERSION = 1
+
+
+def dataset_fingerprint(data_path: Path, params: Dict[str, Any]) -> str:
+    """
+    Veri dosyası içeriği ve özellik ayarlarından cache anahtarı üretir
+
+    Args:
+        data_path: Eğitim verisi dosyası veya bölümlü veri seti dizini
+        params: Vektörleştirici ayarları (JSON'a çevrilebilir)
+
+    Returns:
+        sha256 hex özeti
+    """
+    digest = hashlib.sha256()
+    if data_path.is_dir():
+        # Veri seti: bölüm dizini + dosya içeriği. Parça dosya adları her
+        # yazımda rastgele olduğundan anahtara girmez (gizli/geçici dosyalar hariç)
+        entries = sorted(
+            (path.parent.relative_to(data_path).as_posix(), _hash_file(path, hashlib.sha256()).hexdigest())
+            for path in data_path.rglob('*')
+            if path.is_file() and not any(part.startswith(('.', '_')) for part in path.relative_to(data_path).parts)
+        )
+        for partition, file_digest in entries:
+            digest.update(f"{partition}:{file_digest}\n".encode('utf-8'))
+    else:
+        _hash_file(data_path, digest)
+
+    settings = {
+        'params': params,
+        'feature_cache_version': FEATURE_CACHE_VERSION,
+        'sklearn': sklearn.__version__
+    }
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _hash_file(path: Path, digest):
+    """Dosya içeriğini 1 MB'lık bloklarla özete ekler"""
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            digest.update(block)
+    return digest
+
+
+def load(cache_dir: Path, key: str) -> Optional[Tuple[sp.csr_matrix, pd.Series, Any, Any, Dict]]:
+    """
+    Cache'lenmiş özellikleri okur
+
+    Args:
+        cache_dir: Cache kök dizini
+        key: dataset_fingerprint çıktısı
+
+    Returns:
+        (X, y, tfidf, scaler, meta) veya cache yoksa/okunamazsa None
+    """
+    entry_dir = cache_dir / key
+    if not (entry_dir / 'meta.json').exists():
+        return None
+
+    try:
+        with open(entry_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        X = sp.load_npz(entry_dir / 'features.npz').tocsr()
+        y = pd.Series(np.load(entry_dir / 'labels.npy', allow_pickle=False), name=meta.get('target_name'))
+        transformers = joblib.load(entry_dir / 'transformers.pkl')
+    except Exception as e:
+        logger.warning(f"Özellik cache'i okunamadı, yeniden hesaplanacak ({key[:12]}): {e}")
+        return None
+
+    # LRU temizliği için son kullanım zamanı
+    os.utime(entry_dir)
+    return X, y, transformers['tfidf'], transformers['scaler'], meta
+
+
+def save(cache_dir: Path, key: str, X: sp.spmatrix, y: pd.Series, tfidf: Any, scaler: Any,
+         meta: Dict, max_entries: int = 5) -> Path:
+    """
+    Özellikleri cache'e yazar
+
+    Dosyalar geçici dizine yazılıp dizin os.replace ile yerine taşınır;
+    yarım kalan yazım okuyuculara görünmez.
+
+    Args:
+        cache_dir: Cache kök dizini
+        key: dataset_fingerprint çıktısı
+        X: Özellik matrisi
+        y: Hedef değişken
+        tfidf: Fit edilmiş TF-IDF vektörleştirici
+        scaler: Fit edilmiş sayısal özellik scaler'ı
+        meta: Ek bilgiler (ör. veri boyutu)
+        max_entries: Tutulacak en fazla cache girdisi (en eski kullanılanlar silinir)
+
+    Returns:
+        Cache girdisinin dizini
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    entry_dir = cache_dir / key
+    tmp_dir = cache_dir / f".{key}.{uuid.uuid4().hex[:8]}.tmp"
+    tmp_dir.mkdir()
+
+    try:
+        sp.save_npz(tmp_dir / 'features.npz', sp.csr_matrix(X), compressed=False)
+        np.save(tmp_dir / 'labels.npy', y.to_numpy(dtype=str), allow_pickle=False)
+        joblib.dump({'tfidf': tfidf, 'scaler': scaler}, tmp_dir / 'transformers.pkl')
+        with open(tmp_dir / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump({**meta, 'target_name': y.name, 'shape': list(X.shape),
+                       'created_at': pd.Timestamp.now().isoformat()}, f, indent=2, ensure_ascii=False)
+
+        if entry_dir.exists():
+            shutil.rmtree(tmp_dir)
+        else:
+            os.replace(tmp_dir, entry_dir)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    _prune(cache_dir, max_entries)
+    logger.info(f"Özellik cache'i yazıldı: {entry_dir}")
+    return entry_dir
+
+
+def _prune(cache_dir: Path, max_entries: int) -> None:
+    """En uzun süredir kullanılmayan girdileri siler"""
+    entries = sorted(
+        (path for path in cache_dir.iterdir() if path.is_dir() and not path.name.startswith('.')),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True
+    )
+    for path in entries[max_entries:]:
+        shutil.rmtree(path, ignore_errors=True)
@@ -1,87 +1,453 @@
 """
 Inference modülü - Model tahmin işlemleri
 """
+import hashlib
 import joblib
+import json
 import logging
 import re
-import pandas as pd
+import threading
 import numpy as np
-from typing import Dict, List, Optional, Union
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
 from scipy.sparse import hstack, csr_matrix
-from src.config import MODEL_CONFIG, BUSINESS_RULES
+from src.config import MODEL_CONFIG, BUSINESS_RULES, CACHE_CONFIG
+from src.cache import PredictionCache, copy_result
+from src import model_versions
+from src import text as text_utils
+from src.scoring import predict_with_proba, scores_to_labels, scores_to_proba
+from src.metrics import PREDICTION_STAGE_SECONDS, PREDICTED_TEXTS_TOTAL
 
 logger = logging.getLogger(__name__)
 
+class NumpyInferenceEngine:
+    """
+    Eğitilmiş TF-IDF + LogisticRegression modelinin NumPy ile çalışan
+    hafif sunum motoru
+    
+    ``ComplaintClassificationPipeline.export_engine`` tarafından yazılan
+    artifact'i okur; sklearn nesne grafiğini ve doğrulama katmanlarını
+    yüklemeden tokenize eder, sıralı sözlükte kolon indekslerini bulur ve
+    seyrek çarpımı doğrudan yapar. Diziler salt okunur mmap olarak açılır,
+    böylece uvicorn worker'ları modelin tek bir fiziksel kopyasını paylaşır.
+    """
+    
+    def __init__(self, arrays: Dict[str, np.ndarray], meta: Dict):
+        """
+        Args:
+            arrays: terms, term_columns, idf, coef, intercept, scaler_mean,
+                scaler_scale, classes
+            meta: Tokenizer ve TF-IDF ayarları
+        """
+        self.terms = arrays['terms']  # sıralı
+        self.term_columns = arrays['term_columns']
+        self.idf = arrays['idf']
+        self.coef = arrays['coef']  # (n_features, n_outputs)
+        self.intercept = arrays['intercept']
+        self.scaler_mean = arrays['scaler_mean']
+        self.scaler_scale = arrays['scaler_scale']
+        self.classes_ = arrays['classes']
+        
+        self.n_terms = len(self.terms)
+        self.multinomial = meta['multinomial']
+        self.lowercase = meta['lowercase']
+        self.token_pattern = re.compile(meta['token_pattern'])
+        self.ngram_range = tuple(meta['ngram_range'])
+        self.sublinear_tf = meta['sublinear_tf']
+        self.norm = meta['norm']
+    
+    @classmethod
+    def load(cls, engine_dir: Path) -> 'NumpyInferenceEngine':
+        """
+        Artifact dizininden motoru yükler
+        
+        Args:
+            engine_dir: export_engine çıktısının bulunduğu dizin
+            
+        Returns:
+            Yüklenmiş motor
+        """
+        with open(engine_dir / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        
+        arrays = {
+            name: np.load(engine_dir / f'{name}.npy', mmap_mode='r', allow_pickle=False)
+            for name in meta['arrays']
+        }
+        # Küçük sınıf dizisi bellekte tutulur; etiketler bağımsız kopya olmalı
+        arrays['classes'] = np.array(arrays['classes'])
+        
+        return cls(arrays, meta)
+    
+    def _ngrams(self, text: str) -> List[str]:
+        """sklearn'ün word analyzer'ı ile aynı n-gram listesini üretir"""
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_pattern.findall(text)
+        
+        min_n, max_n = self.ngram_range
+        if max_n == 1:
+            return tokens
+        
+        ngrams = list(tokens) if min_n == 1 else []
+        for n in range(max(min_n, 2), max_n + 1):
+            ngrams.extend(' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+        
+        return ngrams
+    
+    def transform(self, cleaned_texts: List[str]) -> csr_matrix:
+        """
+        Metinlerin TF-IDF matrisini üretir (TfidfVectorizer.transform ile aynı)
+        
+        Args:
+            cleaned_texts: Ön işlenmiş metinler
+            
+        Returns:
+            (n, n_terms) seyrek TF-IDF matrisi
+        """
+        n_rows = len(cleaned_texts)
+        lengths = []
+        ngrams = []
+        counts = []
+        
+        for cleaned_text in cleaned_texts:
+            counter = Counter(self._ngrams(cleaned_text))
+            ngrams.extend(counter.keys())
+            counts.extend(counter.values())
+            lengths.append(len(counter))
+        
+        # Sıralı terim dizisinde toplu arama
+        row_ids = np.repeat(np.arange(n_rows), lengths)
+        if ngrams and self.n_terms:
+            lookup = np.array(ngrams, dtype=str)
+            positions = np.searchsorted(self.terms, lookup)
+            np.minimum(positions, self.n_terms - 1, out=positions)
+            found = self.terms[positions] == lookup
+        else:
+            positions = np.zeros(len(ngrams), dtype=np.intp)
+            found = np.zeros(len(ngrams), dtype=bool)
+        
+        columns = self.term_columns[positions[found]]
+        values = np.array(counts, dtype=float)[found]
+        row_ids = row_ids[found]
+        indptr = np.zeros(n_rows + 1, dtype=np.intp)
+        np.cumsum(np.bincount(row_ids, minlength=n_rows), out=indptr[1:])
+        
+        if self.sublinear_tf:
+            values = np.log(values) + 1.0
+        values *= self.idf[columns]
+        
+        # Satır normalizasyonu
+        if self.norm in ('l1', 'l2'):
+            if self.norm == 'l2':
+                norms = np.sqrt(np.bincount(row_ids, weights=values * values, minlength=n_rows))
+            else:
+                norms = np.bincount(row_ids, weights=np.abs(values), minlength=n_rows)
+            norms[norms == 0] = 1.0
+            values /= norms[row_ids]
+        
+        return csr_matrix((values, columns, indptr), shape=(n_rows, self.n_terms))
+    
+    def scale(self, numerical: np.ndarray) -> np.ndarray:
+        """
+        Sayısal özellikleri standartlaştırır (StandardScaler.transform ile aynı)
+        
+        Args:
+            numerical: (n, 2) text_length / word_count matrisi
+            
+        Returns:
+            Ölçeklenmiş matris
+        """
+        return (np.asarray(numerical, dtype=float) - self.scaler_mean) / self.scaler_scale
+    
+    def score(self, text_features: csr_matrix, scaled_numerical: np.ndarray) -> np.ndarray:
+        """
+        Hazır özelliklerden karar skorlarını hesaplar
+        
+        Args:
+            text_features: transform çıktısı
+            scaled_numerical: scale çıktısı
+            
+        Returns:
+            sklearn decision_function ile aynı biçimde skorlar
+        """
+        scores = text_features @ self.coef[:self.n_terms]
+        
+        # Sayısal özellikler TF-IDF kolonlarından sonra gelir
+        scores += scaled_numerical @ self.coef[self.n_terms:]
+        scores += self.intercept
+        
+        return scores.ravel() if scores.shape[1] == 1 else scores
+    
+    def decision_function(self, cleaned_texts: List[str], numerical: np.ndarray) -> np.ndarray:
+        """
+        Karar skorlarını hesaplar
+        
+        Args:
+            cleaned_texts: Ön işlenmiş metinler
+            numerical: (n, 2) text_length / word_count matrisi
+            
+        Returns:
+            sklearn decision_function ile aynı biçimde skorlar
+        """
+        return self.score(self.transform(cleaned_texts), self.scale(numerical))
+    
+    def predict_with_proba(self, cleaned_texts: List[str],
+                           numerical: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Etiketleri ve olasılıkları tek geçişte hesaplar
+        
+        Args:
+            cleaned_texts: Ön işlenmiş metinler
+            numerical: (n, 2) text_length / word_count matrisi
+            
+        Returns:
+            (etiketler, olasılık matrisi)
+        """
+        scores = self.decision_function(cleaned_texts, numerical)
+        return scores_to_labels(scores, self.classes_), scores_to_proba(scores, self.multinomial)
+
+@dataclass(frozen=True)
+class ModelState:
+    """
+    Tek bir model sürümünün sunum bileşenleri
+    
+    Değiştirilemez; yeniden yüklemede yeni bir nesne oluşturulup tek bir
+    referans ataması ile devreye alınır. Her istek başında alınan state
+    isteğin sonuna kadar aynı sürümü kullanır.
+    """
+    model_version: str
+    categories: np.ndarray
+    engine: Optional[NumpyInferenceEngine] = None
+    model: Any = None
+    tfidf: Any = None
+    scaler: Any = None
+
 class ComplaintClassifier:
     """
     Müşteri şikayet kategorilendirme sınıfı
     """
     
+    # Yeni sürüm devreye alınmadan önce ısınma için kullanılan metin
+    WARMUP_TEXT = "Siparişim bir haftadır kargoda bekliyor, müşteri hizmetlerine ulaşamıyorum."
+    
     def __init__(self):
         """Model ve bileşenleri yükler"""
-        self.model = None
-        self.tfidf = None
-        self.scaler = None
-        self.categories = None
-        self._load_model()
-    
-    def _load_model(self):
-        """Eğitilmiş model ve bileşenleri yükler"""
-        try:
-            logger.info("Model yükleniyor...")
+        self.cache = PredictionCache(
+            max_size=CACHE_CONFIG["max_size"],
+            ttl_seconds=CACHE_CONFIG["ttl_seconds"]
+        )
+        self._reload_lock = threading.Lock()
+        self._watcher: Optional[threading.Thread] = None
+        self._stop_watcher = threading.Event()
+        self.state = self._load_model()
+    
+    # Geriye dönük uyumluluk için aktif state alanları
+    @property
+    def model(self):
+        return self.state.model
+    
+    @property
+    def tfidf(self):
+        return self.state.tfidf
+    
+    @property
+    def scaler(self):
+        return self.state.scaler
+    
+    @property
+    def engine(self) -> Optional[NumpyInferenceEngine]:
+        return self.state.engine
+    
+    @property
+    def categories(self) -> np.ndarray:
+        return self.state.categories
+    
+    @property
+    def model_version(self) -> str:
+        return self.state.model_version
+    
+    def reload_model(self) -> bool:
+        """
+        Aktif model sürümünü arka planda yükleyip atomik olarak devreye alır
+        
+        Yeni sürüm yüklenip ısıtılırken istekler eski sürümle devam eder;
+        geçiş tek bir referans atamasıdır. Yükleme başarısız olursa eski
+        sürüm kullanılmaya devam eder. Geçişten hemen sonra tahmin cache'i
+        temizlenir; eski sürümün kayıtları yeni modelin cache alanını
+        doldurmaz (anahtarlar sürümü içerdiğinden eski sonuç dönmez).
+        
+        Returns:
+            Yeni sürüm devreye alındıysa True
+        """
+        with self._reload_lock:
+            try:
+                state = self._load_state()
+                self._warmup(state)
+            except Exception as e:
+                logger.error(f"Model yeniden yükleme hatası, mevcut sürüm korunuyor: {e}")
+                return False
+            
+            previous_version = self.state.model_version
+            self.state = state
+            self.cache.clear()
+        
+        logger.info(f"Model yeniden yüklendi. Sürüm: {previous_version} -> {state.model_version}")
+        return True
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Aktif sürüm işaretçisi değiştiyse modeli yeniden yükler
+        
+        Returns:
+            Yeni sürüm devreye alındıysa True
+        """
+        version = model_versions.current_version()
+        if version is None or version == self.state.model_version:
+            return False
+        return self.reload_model()
+    
+    def start_watcher(self, poll_seconds: float) -> None:
+        """
+        Aktif sürüm işaretçisini izleyen arka plan thread'ini başlatır
+        
+        Args:
+            poll_seconds: Kontrol aralığı (saniye)
+        """
+        if poll_seconds <= 0 or (self._watcher is not None and self._watcher.is_alive()):
+            return
+        
+        def watch():
+            while not self._stop_watcher.wait(poll_seconds):
+                try:
+                    self.reload_if_changed()
+                except Exception as e:
+                    logger.error(f"Model izleyici hatası: {e}")
+        
+        self._stop_watcher.clear()
+        self._watcher = threading.Thread(target=watch, name='model-watcher', daemon=True)
+        self._watcher.start()
+    
+    def stop_watcher(self) -> None:
+        """İzleyici thread'ini durdurur"""
+        self._stop_watcher.set()
+    
+    @staticmethod
+    def _compute_model_version(paths: List[Path]) -> str:
+        """Model dosyalarının boyut ve değişiklik zamanından sürüm üretir"""
+        digest = hashlib.blake2b(digest_size=8)
+        for path in sorted(paths):
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        return digest.hexdigest()
+    
+    def _load_state(self) -> ModelState:
+        """
+        Aktif sürümün bileşenlerini yükler
+        
+        Returns:
+            Yeni model state'i
             
-            # Model dosyalarının varlığını kontrol et
+        Raises:
+            FileNotFoundError: Model dosyaları bulunamazsa
+        """
+        version = model_versions.current_version()
+        if version is not None:
+            model_dir = MODEL_CONFIG["versions_dir"] / version
+            engine_dir = model_dir / MODEL_CONFIG["engine_dir"].name
+            model_path = model_dir / MODEL_CONFIG["model_path"].name
+            tfidf_path = model_dir / MODEL_CONFIG["tfidf_path"].name
+            scaler_path = model_dir / MODEL_CONFIG["scaler_path"].name
+        else:
+            # Sürüm işaretçisi yoksa eski düz dizin yapısı
+            engine_dir = MODEL_CONFIG["engine_dir"]
             model_path = MODEL_CONFIG["model_path"]
             tfidf_path = MODEL_CONFIG["tfidf_path"]
             scaler_path = MODEL_CONFIG["scaler_path"]
-            
-            if not all([model_path.exists(), tfidf_path.exists(), scaler_path.exists()]):
-                logger.warning("Model dosyaları bulunamadı. Mock model kullanılıyor.")
-                self._setup_mock_model()
-                return
-            
-            # Model bileşenlerini yükle
-            self.model = joblib.load(MODEL_CONFIG["model_path"])
-            self.tfidf = joblib.load(MODEL_CONFIG["tfidf_path"])
-            self.scaler = joblib.load(MODEL_CONFIG["scaler_path"])
-            
-            # Kategorileri al
-            self.categories = self.model.classes_
-            
-            logger.info(f"Model başarıyla yüklendi. Kategoriler: {list(self.categories)}")
-            
+        
+        # Dışa aktarılmış NumPy motoru varsa sklearn nesnelerini yükleme
+        if (engine_dir / 'meta.json').exists():
+            engine = NumpyInferenceEngine.load(engine_dir)
+            state = ModelState(
+                model_version=version or self._compute_model_version(list(engine_dir.iterdir())),
+                categories=engine.classes_,
+                engine=engine
+            )
+            logger.info(f"NumPy inference motoru yüklendi. Kategoriler: {list(state.categories)}")
+            return state
+        
+        # Model dosyalarının varlığını kontrol et
+        if not all([model_path.exists(), tfidf_path.exists(), scaler_path.exists()]):
+            raise FileNotFoundError("Model dosyaları bulunamadı")
+        
+        # Model bileşenlerini yükle
+        model = joblib.load(model_path)
+        state = ModelState(
+            model_version=version or self._compute_model_version([model_path, tfidf_path, scaler_path]),
+            categories=model.classes_,
+            model=model,
+            tfidf=joblib.load(tfidf_path),
+            scaler=joblib.load(scaler_path)
+        )
+        
+        logger.info(f"Model başarıyla yüklendi. Kategoriler: {list(state.categories)}")
+        return state
+    
+    def _load_model(self) -> ModelState:
+        """Eğitilmiş model ve bileşenleri yükler, yoksa mock modele düşer"""
+        try:
+            logger.info("Model yükleniyor...")
+            return self._load_state()
+        
+        except FileNotFoundError:
+            logger.warning("Model dosyaları bulunamadı. Mock model kullanılıyor.")
+            return self._setup_mock_model()
+        
         except Exception as e:
             logger.error(f"Model yükleme hatası: {e}")
             logger.info("Fallback olarak mock model kullanılıyor.")
-            self._setup_mock_model()
+            return self._setup_mock_model()
+    
+    def _warmup(self, state: ModelState) -> None:
+        """Yeni sürümü devreye almadan önce bir tahminle ısıtır (mmap sayfaları, ilk çağrı maliyetleri)"""
+        cleaned = [text_utils.normalize_text(self.WARMUP_TEXT)]
+        self._predict_arrays(state, [self.WARMUP_TEXT], cleaned)
     
-    def _setup_mock_model(self):
+    def _setup_mock_model(self) -> ModelState:
         """Mock model kurulumu - demo amaçlı"""
         from sklearn.feature_extraction.text import TfidfVectorizer
-        from sklearn.linear_model import LogisticRegression
         from sklearn.preprocessing import StandardScaler
-        import numpy as np
         
         # Mock kategoriler
-        self.categories = np.array(BUSINESS_RULES["supported_categories"])
+        categories = np.array(BUSINESS_RULES["supported_categories"])
         
         # Mock TF-IDF vectorizer
-        self.tfidf = TfidfVectorizer(max_features=100, vocabulary={'demo': 0})
+        tfidf = TfidfVectorizer(max_features=100, vocabulary={'demo': 0})
         
         # Mock scaler
-        self.scaler = StandardScaler()
-        self.scaler.mean_ = np.array([50, 10])  # mean for text_length, word_count
-        self.scaler.scale_ = np.array([25, 5])   # std for text_length, word_count
-        self.scaler.n_features_in_ = 2
+        scaler = StandardScaler()
+        scaler.mean_ = np.array([50, 10])  # mean for text_length, word_count
+        scaler.scale_ = np.array([25, 5])   # std for text_length, word_count
+        scaler.n_features_in_ = 2
         
         # Mock model - her zaman ilk kategoriyi döndürür
-        self.model = type('MockModel', (), {
-            'classes_': self.categories,
-            'predict': lambda self, X: [self.categories[0]] * X.shape[0],
-            'predict_proba': lambda self, X: np.array([[0.8] + [0.02] * (len(self.categories) - 2) + [0.06] for _ in range(X.shape[0])])
+        model = type('MockModel', (), {
+            'classes_': categories,
+            'predict': lambda self, X: [self.classes_[0]] * X.shape[0],
+            'predict_proba': lambda self, X: np.array([[0.8] + [0.02] * (len(self.classes_) - 2) + [0.06] for _ in range(X.shape[0])])
         })()
         
         logger.info("Mock model kuruldu - Demo modu aktif")
+        
+        return ModelState(
+            model_version="mock",
+            categories=categories,
+            model=model,
+            tfidf=tfidf,
+            scaler=scaler
+        )
     
     def preprocess_text(self, text: str) -> str:
         """
@@ -93,15 +459,7 @@ class ComplaintClassifier:
         Returns:
             Temizlenmiş metin
         """
-        if pd.isna(text) or text == "":
-            return ""
-        
-        # Temel temizleme
-        text = text.lower()
-        text = re.sub(r'[^a-zğüşıöçĞÜŞIİÖÇ\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return text_utils.normalize_text(text)
     
     def extract_features(self, text: str) -> csr_matrix:
         """
@@ -113,20 +471,161 @@ class ComplaintClassifier:
         Returns:
             Birleştirilmiş özellik matrisi
         """
+        return self.extract_features_batch([text])
+    
+    def extract_features_batch(self, texts: List[str],
+                               cleaned_texts: Optional[List[str]] = None,
+                               state: Optional[ModelState] = None) -> csr_matrix:
+        """
+        Metin listesinden tek seferde özellik matrisi çıkarır
+        
+        Args:
+            texts: Özellik çıkarılacak metinler
+            cleaned_texts: Önceden hesaplanmış ön işlenmiş metinler (opsiyonel)
+            state: Kullanılacak model state'i (varsayılan: aktif state)
+            
+        Returns:
+            Her satırı bir metne karşılık gelen birleştirilmiş özellik matrisi
+        """
+        if state is None:
+            state = self.state
+        
         # Metin özellikleri (TF-IDF)
-        cleaned_text = self.preprocess_text(text)
-        text_features = self.tfidf.transform([cleaned_text])
+        if cleaned_texts is None:
+            with PREDICTION_STAGE_SECONDS.time(stage='preprocessing'):
+                cleaned_texts = text_utils.normalize_texts(texts)
+        with PREDICTION_STAGE_SECONDS.time(stage='tfidf'):
+            text_features = state.tfidf.transform(cleaned_texts)
         
         # Sayısal özellikler
-        text_length = len(text)
-        word_count = len(text.split())
-        numerical_features = self.scaler.transform([[text_length, word_count]])
+        with PREDICTION_STAGE_SECONDS.time(stage='scaling'):
+            numerical = np.array(
+                [[len(text), len(text.split())] for text in texts], dtype=float
+            )
+            numerical_features = state.scaler.transform(numerical)
         
         # Özellikleri birleştir
-        combined_features = hstack([text_features, csr_matrix(numerical_features)])
+        combined_features = hstack(
+            [text_features, csr_matrix(numerical_features)], format='csr'
+        )
         
         return combined_features
     
+    def _predict_arrays(self, state: ModelState, texts: List[str],
+                        cleaned_texts: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Doğrulanmış metinler için etiket ve olasılıkları hesaplar
+        
+        Args:
+            state: Kullanılacak model state'i
+            texts: Tahmin edilecek metinler
+            cleaned_texts: Ön işlenmiş metinler
+            
+        Returns:
+            (etiketler, olasılık matrisi)
+        """
+        if state.engine is not None:
+            engine = state.engine
+            with PREDICTION_STAGE_SECONDS.time(stage='tfidf'):
+                text_features = engine.transform(cleaned_texts)
+            with PREDICTION_STAGE_SECONDS.time(stage='scaling'):
+                scaled = engine.scale(np.array(
+                    [[len(text), len(text.split())] for text in texts], dtype=float
+                ))
+            with PREDICTION_STAGE_SECONDS.time(stage='scoring'):
+                scores = engine.score(text_features, scaled)
+                return scores_to_labels(scores, engine.classes_), scores_to_proba(scores, engine.multinomial)
+        
+        features = self.extract_features_batch(texts, cleaned_texts, state)
+        with PREDICTION_STAGE_SECONDS.time(stage='scoring'):
+            return predict_with_proba(state.model, features)
+    
+    def predict_validated(self, texts: List[str]) -> List[Dict]:
+        """
+        Doğrulanmış (validate_text'ten geçmiş) metinleri cache üzerinden
+        tahmin eder
+        
+        Cache'te bulunmayan metinler tekilleştirilip tek bir model
+        çağrısında işlenir. Aktif model state'i bir kez alınır; eşzamanlı
+        bir yeniden yükleme bu çağrının sonuçlarını etkilemez.
+        
+        Args:
+            texts: Doğrulanmış metinler
+            
+        Returns:
+            Her metin için tahmin sonucu
+        """
+        state = self.state
+        
+        with PREDICTION_STAGE_SECONDS.time(stage='preprocessing'):
+            cleaned_texts = text_utils.normalize_texts(texts)
+        results: List[Optional[Dict]] = [None] * len(texts)
+        keys = [
+            self.cache.make_key(state.model_version, cleaned, len(text), len(text.split()))
+            for text, cleaned in zip(texts, cleaned_texts)
+        ]
+        
+        # Aynı anahtara sahip metinler için tek satır hesaplanır
+        missing: Dict[str, List[int]] = {}
+        for i, key in enumerate(keys):
+            if key in missing:
+                missing[key].append(i)
+                continue
+            results[i] = self.cache.get(key)
+            if results[i] is None:
+                missing[key] = [i]
+        
+        if missing:
+            first_indices = [indices[0] for indices in missing.values()]
+            predictions, probabilities = self._predict_arrays(
+                state,
+                [texts[i] for i in first_indices],
+                [cleaned_texts[i] for i in first_indices]
+            )
+            with PREDICTION_STAGE_SECONDS.time(stage='serialization'):
+                for row, indices in enumerate(missing.values()):
+                    i = indices[0]
+                    result = self._build_result(state, texts[i], predictions[row], probabilities[row])
+                    self.cache.set(keys[i], result)
+                    for j in indices:
+                        results[j] = copy_result(result)
+        
+        PREDICTED_TEXTS_TOTAL.inc(len(missing), source='model')
+        PREDICTED_TEXTS_TOTAL.inc(len(texts) - len(missing), source='cache')
+        
+        return results
+    
+    def validate_text(self, text: str) -> None:
+        """
+        Metni iş kurallarına göre doğrular
+        
+        Args:
+            text: Doğrulanacak metin
+            
+        Raises:
+            ValueError: Metin uzunluk sınırlarının dışındaysa
+        """
+        limits = BUSINESS_RULES["text_limits"]
+        
+        if not text or len(text.strip()) < limits["min_length"]:
+            raise ValueError(f"Metin çok kısa. Minimum {limits['min_length']} karakter gerekli.")
+        
+        if len(text) > limits["max_length"]:
+            raise ValueError(f"Metin çok uzun. Maksimum {limits['max_length']} karakter.")
+    
+    def _build_result(self, state: ModelState, text: str, prediction: str,
+                      probabilities: np.ndarray) -> Dict:
+        """Tek bir metin için tahmin sonucunu oluşturur"""
+        return {
+            'prediction': prediction,
+            'confidence': float(probabilities.max()),
+            'all_probabilities': {
+                cat: float(prob) for cat, prob in zip(state.categories, probabilities)
+            },
+            'text_length': len(text),
+            'word_count': len(text.split())
+        }
+    
     def predict_single(self, text: str) -> Dict:
         """
         Tek metin için tahmin yapar
@@ -139,36 +638,12 @@ class ComplaintClassifier:
         """
         try:
             # Giriş validasyonu
-            if not text or len(text.strip()) < BUSINESS_RULES["text_limits"]["min_length"]:
-                raise ValueError(f"Metin çok kısa. Minimum {BUSINESS_RULES['text_limits']['min_length']} karakter gerekli.")
-            
-            if len(text) > BUSINESS_RULES["text_limits"]["max_length"]:
-                raise ValueError(f"Metin çok uzun. Maksimum {BUSINESS_RULES['text_limits']['max_length']} karakter.")
-            
-            # Özellik çıkarma
-            features = self.extract_features(text)
+            self.validate_text(text)
             
             # Tahmin
-            prediction = self.model.predict(features)[0]
-            probabilities = self.model.predict_proba(features)[0]
-            
-            # Güven skoru
-            confidence = probabilities.max()
-            
-            # Tüm olasılıklar
-            all_probabilities = {
-                cat: float(prob) for cat, prob in zip(self.categories, probabilities)
-            }
-            
-            result = {
-                'prediction': prediction,
-                'confidence': float(confidence),
-                'all_probabilities': all_probabilities,
-                'text_length': len(text),
-                'word_count': len(text.split())
-            }
+            result = self.predict_validated([text])[0]
             
-            logger.info(f"Tahmin yapıldı: {prediction} (güven: {confidence:.3f})")
+            logger.info(f"Tahmin yapıldı: {result['prediction']} (güven: {result['confidence']:.3f})")
             
             return result
             
@@ -180,26 +655,51 @@ class ComplaintClassifier:
         """
         Çoklu metin için tahmin yapar
         
+        Geçerli metinlerden cache'te bulunmayanlar tek bir özellik
+        matrisinde birleştirilir ve model bir kez çalıştırılır. Geçersiz metinler kendi ``text_index``
+        değerleriyle hata sonucu olarak döner.
+        
         Args:
             texts: Tahmin edilecek metinler listesi
             
         Returns:
             Tahmin sonuçları listesi
         """
-        results = []
+        results: List[Optional[Dict]] = [None] * len(texts)
+        valid_indices = []
         
         for i, text in enumerate(texts):
             try:
-                result = self.predict_single(text)
-                result['text_index'] = i
-                results.append(result)
+                self.validate_text(text)
+                valid_indices.append(i)
             except Exception as e:
                 logger.error(f"Metin {i} tahmin hatası: {e}")
-                results.append({
+                results[i] = {
                     'text_index': i,
                     'error': str(e),
                     'success': False
-                })
+                }
+        
+        if valid_indices:
+            valid_texts = [texts[i] for i in valid_indices]
+            
+            try:
+                valid_results = self.predict_validated(valid_texts)
+                
+                for result, i in zip(valid_results, valid_indices):
+                    result['text_index'] = i
+                    results[i] = result
+                
+                logger.info(f"Toplu tahmin yapıldı: {len(valid_indices)} metin")
+                
+            except Exception as e:
+                logger.error(f"Toplu tahmin hatası: {e}")
+                for i in valid_indices:
+                    results[i] = {
+                        'text_index': i,
+                        'error': str(e),
+                        'success': False
+                    }
         
         return results
     
@@ -0,0 +1,259 @@
+"""
+Toplu sınıflandırma işleri - Büyük dosyaları arka planda parça parça işler
+"""
+import csv
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import uuid
+import pandas as pd
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional
+from src.locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+# Sonuç dosyalarının sütunları
+RESULT_COLUMNS = ["text_index", "prediction", "confidence", "text_length", "word_count", "error"]
+
+
+class BulkJobManager:
+    """
+    Disk üzerinde durum tutan toplu sınıflandırma iş yöneticisi
+
+    Her iş ``jobs_dir/<job_id>/`` altında girdi dosyası, ``state.json`` ve
+    her tamamlanan parça için bir ``part-XXXXX.csv`` dosyası tutar. Durum
+    her parçadan sonra atomik olarak yazıldığı için API yeniden başlatılınca
+    yarım kalan işler son tamamlanan parçadan devam eder. İşler tek bir arka
+    plan thread'inde sırayla çalışır. Birden fazla API worker'ı aynı dizini
+    paylaştığında bir iş, iş dizinindeki ``worker.lock`` kilidini alan tek
+    süreç tarafından işlenir; kilidi canlı başka bir süreç tutan işler atlanır.
+    """
+
+    def __init__(self, jobs_dir: Path, predict_batch: Callable[[List[str]], List[Dict]],
+                 chunk_size: int = 5000):
+        """
+        Args:
+            jobs_dir: İş dizinlerinin kök dizini
+            predict_batch: Metin listesi için tahmin sonuçları döndüren fonksiyon
+            chunk_size: Parça başına satır sayısı
+        """
+        self.jobs_dir = jobs_dir
+        self.predict_batch = predict_batch
+        self.chunk_size = chunk_size
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Arka plan thread'ini başlatır ve yarım kalan işleri sıraya alır"""
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+
+        for state_path in sorted(self.jobs_dir.glob('*/state.json')):
+            state = self._read_state(state_path.parent.name)
+            if state and state['status'] in ('queued', 'running'):
+                logger.info(f"Yarım kalan iş devam ettiriliyor: {state['job_id']} "
+                            f"({state['completed_chunks']} parça tamamlanmış)")
+                self._queue.put(state['job_id'])
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._worker, name='bulk-jobs', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Mevcut parça bittikten sonra thread'i durdurur"""
+        self._stop.set()
+        self._queue.put(None)
+
+    def create_job(self, filename: str, source: BinaryIO) -> Dict:
+        """
+        Yeni iş oluşturur ve sıraya alır
+
+        Args:
+            filename: Yüklenen dosyanın adı
+            source: Dosya içeriği (ikili akış)
+
+        Returns:
+            İş durumu
+
+        Raises:
+            ValueError: Dosyada 'text' sütunu yoksa (iş oluşturulmaz)
+        """
+        job_id = uuid.uuid4().hex
+        job_dir = self.jobs_dir / job_id
+        job_dir.mkdir(parents=True)
+
+        with open(job_dir / 'input.csv', 'wb') as f:
+            shutil.copyfileobj(source, f)
+
+        # Başlık iş sıraya alınmadan doğrulanır; hatalı dosya worker'a ulaşmaz
+        try:
+            pd.read_csv(job_dir / 'input.csv', usecols=['text'], nrows=0, encoding='utf-8')
+        except ValueError:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise ValueError("CSV dosyasında 'text' sütunu bulunamadı")
+
+        state = {
+            'job_id': job_id,
+            'filename': filename,
+            'status': 'queued',
+            'chunk_size': self.chunk_size,
+            'total_rows': None,
+            'processed_rows': 0,
+            'completed_chunks': 0,
+            'error': None,
+            'created_at': pd.Timestamp.now().isoformat(),
+            'finished_at': None
+        }
+        self._write_state(state)
+        self._queue.put(job_id)
+
+        logger.info(f"Toplu iş oluşturuldu: {job_id} ({filename})")
+        return state
+
+    def get_job(self, job_id: str) -> Optional[Dict]:
+        """
+        İş durumunu getirir
+
+        Args:
+            job_id: İş kimliği
+
+        Returns:
+            İlerleme bilgisi eklenmiş durum veya None
+        """
+        state = self._read_state(job_id)
+        if state is None:
+            return None
+
+        total = state['total_rows']
+        state['progress'] = state['processed_rows'] / total if total else (
+            1.0 if state['status'] == 'completed' else 0.0
+        )
+        return state
+
+    def iter_results(self, job_id: str) -> Iterator[str]:
+        """
+        Tamamlanmış işin sonuçlarını CSV satırları olarak akıtır
+
+        Args:
+            job_id: İş kimliği
+
+        Yields:
+            Başlık satırı ve parça dosyalarının içerikleri
+        """
+        yield ",".join(RESULT_COLUMNS) + "\n"
+
+        for part_path in sorted(self._job_dir(job_id).glob('part-*.csv')):
+            with open(part_path, 'r', encoding='utf-8') as f:
+                while True:
+                    block = f.read(1 << 20)
+                    if not block:
+                        break
+                    yield block
+
+    def _job_dir(self, job_id: str) -> Path:
+        """İş dizini (dizin dışına çıkan kimlikler reddedilir)"""
+        if not job_id.isalnum():
+            raise ValueError(f"Geçersiz iş kimliği: {job_id}")
+        return self.jobs_dir / job_id
+
+    def _read_state(self, job_id: str) -> Optional[Dict]:
+        """state.json dosyasını okur"""
+        try:
+            state_path = self._job_dir(job_id) / 'state.json'
+        except ValueError:
+            return None
+        if not state_path.exists():
+            return None
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_state(self, state: Dict) -> None:
+        """state.json dosyasını atomik olarak yazar"""
+        state_path = self._job_dir(state['job_id']) / 'state.json'
+        tmp_path = state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, state_path)
+
+    def _read_chunks(self, input_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Girdi dosyasının 'text' sütununu parça parça okur"""
+        return pd.read_csv(input_path, usecols=['text'], dtype={'text': str},
+                           chunksize=chunk_size, encoding='utf-8')
+
+    def _write_part(self, job_dir: Path, chunk_index: int, results: List[Dict]) -> None:
+        """Parça sonucunu atomik olarak yazar"""
+        part_path = job_dir / f'part-{chunk_index:05d}.csv'
+        tmp_path = part_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS, extrasaction='ignore')
+            writer.writerows(results)
+        os.replace(tmp_path, part_path)
+
+    def _process(self, job_id: str) -> None:
+        """İşi son tamamlanan parçadan itibaren çalıştırır"""
+        state = self._read_state(job_id)
+        job_dir = self._job_dir(job_id)
+        input_path = job_dir / 'input.csv'
+        chunk_size = state['chunk_size']
+
+        state['status'] = 'running'
+        if state['total_rows'] is None:
+            state['total_rows'] = sum(len(chunk) for chunk in self._read_chunks(input_path, chunk_size))
+        self._write_state(state)
+
+        with self._read_chunks(input_path, chunk_size) as reader:
+            for chunk_index, chunk in enumerate(reader):
+                if chunk_index < state['completed_chunks']:
+                    continue
+                if self._stop.is_set():
+                    logger.info(f"Toplu iş durduruldu, yeniden başlatmada devam edecek: {job_id}")
+                    return
+
+                offset = chunk_index * chunk_size
+                results = self.predict_batch(chunk['text'].fillna('').tolist())
+                for result in results:
+                    result['text_index'] += offset
+
+                self._write_part(job_dir, chunk_index, results)
+
+                state['completed_chunks'] = chunk_index + 1
+                state['processed_rows'] = offset + len(results)
+                self._write_state(state)
+
+        state['status'] = 'completed'
+        state['finished_at'] = pd.Timestamp.now().isoformat()
+        self._write_state(state)
+        logger.info(f"Toplu iş tamamlandı: {job_id}, {state['processed_rows']} satır")
+
+    def _worker(self) -> None:
+        """Sıradaki işleri çalıştıran arka plan döngüsü"""
+        while not self._stop.is_set():
+            job_id = self._queue.get()
+            if job_id is None:
+                break
+
+            claim = FileLock(self._job_dir(job_id) / 'worker.lock')
+            if not claim.acquire():
+                logger.info(f"Toplu iş başka bir süreçte çalışıyor, atlandı: {job_id}")
+                continue
+
+            try:
+                # Kilit beklenirken iş başka bir süreçte bitmiş olabilir
+                state = self._read_state(job_id)
+                if state is None or state['status'] not in ('queued', 'running'):
+                    continue
+                self._process(job_id)
+            except Exception as e:
+                logger.error(f"Toplu iş hatası ({job_id}): {e}")
+                state = self._read_state(job_id)
+                if state is not None:
+                    state['status'] = 'failed'
+                    state['error'] = str(e)
+                    state['finished_at'] = pd.Timestamp.now().isoformat()
+                    self._write_state(state)
+            finally:
+                claim.release()
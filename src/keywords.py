@@ -0,0 +1,266 @@
+"""
+Anahtar kelime modülü - Kural tabanlı kategorilendirme için Aho-Corasick eşleştirici
+"""
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+
+class KeywordMatcher:
+    """
+    Kategori → anahtar kelime tablosundan derlenen çoklu desen eşleştirici
+
+    Tüm anahtar kelimeler tek bir Aho-Corasick otomatına derlenir; metin
+    anahtar kelime sayısından bağımsız olarak tek geçişte taranır ve iç içe
+    / örtüşen eşleşmeler (ör. "kargo" ve "kargo firması") birlikte bulunur.
+    Geçişler her durum için önceden hesaplandığından (DFA) tarama sırasında
+    failure link'leri izlenmez.
+
+    Küçük tablolarda (en fazla SCAN_MAX_KEYWORDS anahtar kelime) otomat
+    kurulmaz; metin her anahtar kelime için C seviyesinde ``keyword in text``
+    ile taranır. Ölçümde ~36 karakterlik şikayetlerde 9-10 kelimelik
+    tablolar ``in`` ile ~2 kat hızlı, 44 kelimelik tablo ise otomatla ~1.5
+    kat hızlıdır (kesişim uzun metinlerde ~70 kelimeye çıkar).
+
+    Puanlama önceki ``keyword in text`` döngüleriyle aynıdır: kategori puanı,
+    metinde geçen farklı anahtar kelimelerinin ağırlıkları toplamıdır; aynı
+    kelimenin tekrarı puanı artırmaz. Metin ``str.lower()`` ile küçültülür.
+    """
+
+    # Bu sayıya kadar anahtar kelime içeren tablolar otomat yerine ``in`` ile taranır
+    SCAN_MAX_KEYWORDS = 24
+
+    def __init__(self, keyword_table: Mapping[str, Iterable[str]],
+                 weights: Optional[Mapping[str, float]] = None):
+        """
+        Args:
+            keyword_table: Kategori → anahtar kelimeler (sıra, eşitlikte önceliği belirler)
+            weights: Kategori → anahtar kelime ağırlığı (varsayılan 1.0)
+        """
+        weights = weights or {}
+        self.labels: Tuple[str, ...] = tuple(keyword_table)
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(
+            keyword.lower() for keywords in keyword_table.values() for keyword in keywords
+        ))
+        keyword_ids = {keyword: i for i, keyword in enumerate(self.keywords)}
+
+        # Anahtar kelime → (kategori indeksi, ağırlık) listesi; bir kelime birden çok kategoride olabilir
+        self._keyword_labels: List[Tuple[Tuple[int, float], ...]] = [() for _ in self.keywords]
+        for label_index, (label, keywords) in enumerate(keyword_table.items()):
+            weight = float(weights.get(label, 1.0))
+            for keyword in keywords:
+                self._keyword_labels[keyword_ids[keyword.lower()]] += ((label_index, weight),)
+
+        # first_label için tablo sırasıyla pozitif ağırlıklı kategorilerin kelimeleri
+        self._label_keywords: Tuple[Tuple[int, Tuple[str, ...]], ...] = tuple(
+            (label_index, tuple(keyword.lower() for keyword in keywords))
+            for label_index, (label, keywords) in enumerate(keyword_table.items())
+            if float(weights.get(label, 1.0)) > 0
+        )
+
+        self._scan = len(self.keywords) <= self.SCAN_MAX_KEYWORDS
+        if self._scan:
+            self._transitions, self._outputs = [], []
+        else:
+            self._transitions, self._outputs = self._build(self.keywords)
+
+    @staticmethod
+    def _build(keywords: Sequence[str]) -> Tuple[List[Dict[str, int]], List[Tuple[int, ...]]]:
+        """
+        Trie, failure link'ler ve tam geçiş tablosunu kurar
+
+        Returns:
+            Durum başına geçiş sözlüğü ve o durumda biten anahtar kelime id'leri
+        """
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for keyword_id, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    outputs.append(())
+                    goto[state][char] = next_state
+                state = next_state
+            outputs[state] += (keyword_id,)
+
+        # Genişlik öncelikli sırada failure link'ler ve geçişler: her durum
+        # kendi kenarlarına ek olarak failure durumunun geçişlerini devralır
+        fail = [0] * len(goto)
+        transitions: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            transitions[state] = {**transitions[fail[state]], **goto[state]}
+            for char, next_state in goto[state].items():
+                fail[next_state] = transitions[fail[state]].get(char, 0)
+                outputs[next_state] += outputs[fail[next_state]]
+                queue.append(next_state)
+
+        return transitions, outputs
+
+    def _match_ids(self, text: str) -> Set[int]:
+        """Metinde geçen anahtar kelimelerin id'leri (tek geçiş veya küçük tabloda ``in``)"""
+        if self._scan:
+            lowered = text.lower()
+            return {keyword_id for keyword_id, keyword in enumerate(self.keywords) if keyword in lowered}
+
+        transitions, outputs = self._transitions, self._outputs
+        matched: Set[int] = set()
+        state = 0
+        for char in text.lower():
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                matched.update(outputs[state])
+        return matched
+
+    def _score_ids(self, matched: Set[int]) -> List[float]:
+        """Eşleşen anahtar kelimelerden kategori puanları (labels sırasıyla)"""
+        scores = [0.0] * len(self.labels)
+        for keyword_id in matched:
+            for label_index, weight in self._keyword_labels[keyword_id]:
+                scores[label_index] += weight
+        return scores
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        """
+        Metinde geçen anahtar kelimeler
+
+        Args:
+            text: Taranacak metin
+
+        Returns:
+            Eşleşen anahtar kelimeler
+        """
+        return {self.keywords[keyword_id] for keyword_id in self._match_ids(text)}
+
+    def matched_labels(self, text: str) -> Set[str]:
+        """
+        En az bir anahtar kelimesi metinde geçen kategoriler
+
+        Args:
+            text: Taranacak metin
+
+        Returns:
+            Kategori adları
+        """
+        return {
+            self.labels[label_index]
+            for keyword_id in self._match_ids(text)
+            for label_index, _ in self._keyword_labels[keyword_id]
+        }
+
+    def first_label(self, text: str, default: str) -> str:
+        """
+        Tablo sırasına göre anahtar kelimesi metinde geçen ilk kategori
+
+        İlk kategorinin bir anahtar kelimesi bulununca tarama erken biter.
+
+        Args:
+            text: Taranacak metin
+            default: Hiçbir kategori eşleşmezse dönen değer
+
+        Returns:
+            Kategori adı
+        """
+        if self._scan:
+            lowered = text.lower()
+            for label_index, keywords in self._label_keywords:
+                if any(keyword in lowered for keyword in keywords):
+                    return self.labels[label_index]
+            return default
+
+        transitions, outputs, keyword_labels = self._transitions, self._outputs, self._keyword_labels
+        best = len(self.labels)
+        state = 0
+        for char in text.lower():
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                for keyword_id in outputs[state]:
+                    for label_index, weight in keyword_labels[keyword_id]:
+                        if weight > 0 and label_index < best:
+                            best = label_index
+                # İlk kategori eşleştiyse metnin kalanına bakmaya gerek yok
+                if best == 0:
+                    break
+        return self.labels[best] if best < len(self.labels) else default
+
+    def scores(self, text: str) -> Dict[str, float]:
+        """
+        Kategori puanları
+
+        Args:
+            text: Taranacak metin
+
+        Returns:
+            Kategori → puan (tüm kategoriler, tablo sırasıyla)
+        """
+        return dict(zip(self.labels, self._score_ids(self._match_ids(text))))
+
+    def scores_batch(self, texts: Iterable[str]) -> List[Dict[str, float]]:
+        """
+        Çoklu metin için kategori puanları
+
+        Args:
+            texts: Taranacak metinler
+
+        Returns:
+            Her metin için kategori → puan
+        """
+        return [self.scores(text) for text in texts]
+
+    def categorize(self, text: str, unknown: str = "Bilinmeyen",
+                   full_confidence_score: float = 3.0) -> Tuple[str, float]:
+        """
+        En yüksek puanlı kategori ve güven skoru
+
+        Eşitlikte tabloda önce gelen kategori seçilir.
+
+        Args:
+            text: Kategorilendirilecek metin
+            unknown: Hiç anahtar kelime eşleşmezse dönen kategori
+            full_confidence_score: Güvenin 1.0 olduğu puan
+
+        Returns:
+            (kategori, güven) - eşleşme yoksa (unknown, 0.0)
+        """
+        return self._categorize_ids(self._match_ids(text), unknown, full_confidence_score)
+
+    def categorize_batch(self, texts: Iterable[str], unknown: str = "Bilinmeyen",
+                         full_confidence_score: float = 3.0) -> List[Tuple[str, float]]:
+        """
+        Çoklu metin kategorilendirme (ör. bir sayfadaki tüm şikayetler)
+
+        Aynı metin batch içinde bir kez taranır.
+
+        Args:
+            texts: Kategorilendirilecek metinler
+            unknown: Hiç anahtar kelime eşleşmezse dönen kategori
+            full_confidence_score: Güvenin 1.0 olduğu puan
+
+        Returns:
+            Girdiyle aynı sırada (kategori, güven) listesi
+        """
+        seen: Dict[str, Tuple[str, float]] = {}
+        results = []
+        for text in texts:
+            result = seen.get(text)
+            if result is None:
+                result = seen[text] = self._categorize_ids(
+                    self._match_ids(text), unknown, full_confidence_score
+                )
+            results.append(result)
+        return results
+
+    def _categorize_ids(self, matched: Set[int], unknown: str,
+                        full_confidence_score: float) -> Tuple[str, float]:
+        """Eşleşen anahtar kelimelerden (kategori, güven)"""
+        if not matched:
+            return unknown, 0.0
+
+        scores = self._score_ids(matched)
+        best = max(range(len(scores)), key=scores.__getitem__)
+        if scores[best] <= 0:
+            return unknown, 0.0
+        return self.labels[best], min(scores[best] / full_confidence_score, 1.0)
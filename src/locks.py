@@ -0,0 +1,76 @@
+"""
+Kilit modülü - Süreçler (API worker'ları) arası dosya kilidi
+"""
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """
+    Dosya üzerinde süreçler arası özel (exclusive) kilit
+
+    Kilit işletim sistemi tarafından tutulur ve sahibi süreç sonlanınca
+    (çökme dahil) kendiliğinden bırakılır; bu yüzden canlı olmayan bir
+    sürecin bıraktığı kilit dosyası hiçbir şeyi engellemez ve temizlik
+    gerekmez. Kilit dosyasına sahibin PID'i yazılır (sadece bilgi amaçlı).
+    Aynı süreçteki iki FileLock örneği de birbirini dışlar.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Args:
+            path: Kilit dosyası (yoksa oluşturulur)
+        """
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    @property
+    def locked(self) -> bool:
+        """Kilit bu örnekte tutuluyor mu"""
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        """
+        Beklemeden kilidi almayı dener
+
+        Returns:
+            Kilit alındıysa True, başka bir süreç tutuyorsa False
+        """
+        if self._fd is not None:
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == 'nt':
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        """Kilidi bırakır (tutulmuyorsa bir şey yapmaz)"""
+        if self._fd is None:
+            return
+        fd, self._fd = self._fd, None
+        try:
+            if os.name == 'nt':
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
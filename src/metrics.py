@@ -0,0 +1,276 @@
+"""
+Metrik modülü - Prometheus metin formatında sayaç, gösterge ve histogramlar
+"""
+import bisect
+from abc import ABC, abstractmethod
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Prometheus istemci kütüphanesinin varsayılan kovaları (saniye)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+# Tahmin aşamaları milisaniye altında sürdüğü için daha ince kovalar
+STAGE_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """Sayıyı Prometheus formatında yazar"""
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Etiketleri {ad="değer",...} biçiminde yazar"""
+    if not names:
+        return ''
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return '{' + ','.join(pairs) + '}'
+
+
+class _Metric(ABC):
+    """Etiketli metriklerin ortak tabanı"""
+
+    metric_type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Args:
+            name: Metrik adı
+            documentation: HELP satırı
+            labelnames: Etiket adları
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Etiket değerlerini sabit sıralı demete çevirir"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} etiketleri {self.labelnames} olmalı, verilen: {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        """HELP/TYPE satırları ve örnekler"""
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.metric_type}']
+        lines.extend(self._samples())
+        return lines
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """Metriğin örnek satırları"""
+
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç"""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Sayacı artırır"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        """Etiket demeti → değer kopyası"""
+        with self._lock:
+            return dict(self._values)
+
+    def _samples(self) -> List[str]:
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+            for key, value in sorted(self.values().items())
+        ]
+
+
+class Gauge(Counter):
+    """Artıp azalabilen gösterge"""
+
+    metric_type = 'gauge'
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        """Göstergeyi azaltır"""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        """Göstergeye değer atar"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """Kümülatif kovalı süre histogramı"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            name: Metrik adı
+            documentation: HELP satırı
+            labelnames: Etiket adları
+            buckets: Artan sırada kova üst sınırları (+Inf otomatik eklenir)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Etiket demeti → (kova sayaçları (kümülatif değil), toplam, adet)
+        self._series: Dict[LabelValues, List] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Bir ölçüm ekler"""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Bloğun süresini ölçüp kaydeder"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def snapshot(self, **labels: str) -> Optional[Dict]:
+        """
+        Bir serinin özeti
+
+        Returns:
+            count, sum, mean ve kovalardan tahmin edilen p50/p95/p99 (seri yoksa None)
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                return None
+            counts, total, count = list(series[0]), series[1], series[2]
+
+        return {
+            'count': count,
+            'sum': total,
+            'mean': total / count if count else 0.0,
+            'p50': self._quantile(counts, count, 0.50),
+            'p95': self._quantile(counts, count, 0.95),
+            'p99': self._quantile(counts, count, 0.99)
+        }
+
+    def label_values(self) -> List[LabelValues]:
+        """Gözlem yapılmış etiket demetleri"""
+        with self._lock:
+            return sorted(self._series)
+
+    def _quantile(self, counts: List[int], count: int, q: float) -> float:
+        """Kova içinde doğrusal interpolasyonla yüzdelik tahmini (histogram_quantile gibi)"""
+        if not count:
+            return 0.0
+
+        rank = q * count
+        cumulative = 0
+        for i, bucket_count in enumerate(counts):
+            if cumulative + bucket_count >= rank:
+                if i == len(self.buckets):
+                    # +Inf kovası: bilinen en büyük sınır döner
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i]
+                fraction = (rank - cumulative) / bucket_count if bucket_count else 0.0
+                return lower + (upper - lower) * fraction
+            cumulative += bucket_count
+
+        return self.buckets[-1]
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            series = {key: (list(value[0]), value[1], value[2]) for key, value in self._series.items()}
+
+        lines = []
+        for key in sorted(series):
+            counts, total, count = series[key]
+            cumulative = 0
+            for upper, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames + ('le',), key + (_format_value(upper),))
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class MetricsRegistry:
+    """Metrik kayıt defteri"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Metriği kaydeder"""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metrik zaten kayıtlı: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Tüm metrikleri Prometheus metin formatında (0.0.4) yazar
+
+        Returns:
+            /metrics yanıt gövdesi
+        """
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+REGISTRY = MetricsRegistry()
+
+# Uygulama metrikleri
+PREDICTION_STAGE_SECONDS = REGISTRY.register(Histogram(
+    'complaintiq_prediction_stage_seconds',
+    'ComplaintClassifier tahmin aşamalarının süresi (batch başına)',
+    labelnames=('stage',), buckets=STAGE_BUCKETS
+))
+PREDICTED_TEXTS_TOTAL = REGISTRY.register(Counter(
+    'complaintiq_predicted_texts_total',
+    'Tahmin edilen metin sayısı (model: hesaplanan, cache: cache veya batch içi tekrardan dönen)',
+    labelnames=('source',)
+))
+HTTP_REQUESTS_TOTAL = REGISTRY.register(Counter(
+    'complaintiq_http_requests_total',
+    'Endpoint ve durum koduna göre HTTP istek sayısı',
+    labelnames=('method', 'endpoint', 'status')
+))
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(Gauge(
+    'complaintiq_http_requests_in_flight',
+    'Endpoint başına işlenmekte olan HTTP istekleri',
+    labelnames=('method', 'endpoint')
+))
+HTTP_REQUEST_DURATION_SECONDS = REGISTRY.register(Histogram(
+    'complaintiq_http_request_duration_seconds',
+    'Endpoint başına HTTP istek süresi (yanıt gövdesi dahil)',
+    labelnames=('method', 'endpoint')
+))
@@ -0,0 +1,108 @@
+"""
+Model sürüm modülü - Sürümlü model dizinleri ve atomik aktif sürüm işaretçisi
+"""
+import logging
+import os
+import shutil
+import uuid
+import pandas as pd
+from pathlib import Path
+from typing import List, Optional
+from src.config import MODEL_CONFIG, MODELS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def current_version() -> Optional[str]:
+    """
+    Aktif model sürümünü okur
+
+    Returns:
+        Sürüm adı veya işaretçi yoksa None
+    """
+    pointer_path = MODEL_CONFIG["current_version_path"]
+    try:
+        version = pointer_path.read_text(encoding='utf-8').strip()
+    except FileNotFoundError:
+        return None
+    return version or None
+
+
+def current_model_dir() -> Path:
+    """
+    Aktif sürümün dizini
+
+    Returns:
+        versions/<sürüm> dizini; işaretçi yoksa eski düz yapı için MODELS_DIR
+    """
+    version = current_version()
+    if version is None:
+        return MODELS_DIR
+    return MODEL_CONFIG["versions_dir"] / version
+
+
+def new_version_dir() -> Path:
+    """
+    Yeni sürüm için boş dizin oluşturur
+
+    Returns:
+        versions/<zaman damgası>-<kısa id> dizini
+    """
+    version = f"{pd.Timestamp.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+    version_dir = MODEL_CONFIG["versions_dir"] / version
+    version_dir.mkdir(parents=True)
+    return version_dir
+
+
+def publish_version(version_dir: Path) -> str:
+    """
+    Sürümü aktif yapar
+
+    İşaretçi dosyası geçici dosyaya yazılıp os.replace ile değiştirilir;
+    okuyucular her zaman eski ya da yeni sürümün tam adını görür. Ardından
+    eski sürümler prune_versions ile temizlenir.
+
+    Args:
+        version_dir: Tamamen yazılmış sürüm dizini
+
+    Returns:
+        Aktif sürüm adı
+    """
+    pointer_path = MODEL_CONFIG["current_version_path"]
+    tmp_path = pointer_path.with_name(f"{pointer_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(version_dir.name, encoding='utf-8')
+    os.replace(tmp_path, pointer_path)
+    prune_versions()
+    return version_dir.name
+
+
+def prune_versions(keep: Optional[int] = None) -> List[str]:
+    """
+    Aktif sürümden eski sürüm dizinlerini, en yeni ``keep`` tanesi hariç siler
+
+    Aktif sürüm ve ondan yeni dizinler (ör. başka bir süreçte yazılmakta olan
+    sürüm) hiç silinmez. Eski sürümü hâlâ mmap ile kullanan worker'lar
+    etkilenmez; dosyalar son eşleme kapanana kadar diskte kalır.
+
+    Args:
+        keep: Aktif sürüm dışında saklanacak eski sürüm sayısı (varsayılan: MODEL_CONFIG)
+
+    Returns:
+        Silinen sürüm adları
+    """
+    if keep is None:
+        keep = MODEL_CONFIG["keep_versions"]
+    current = current_version()
+    versions_dir = MODEL_CONFIG["versions_dir"]
+    if current is None or not versions_dir.is_dir():
+        return []
+
+    # Sürüm adları zaman damgasıyla başladığından ad sırası yaş sırasıdır
+    older = sorted(path.name for path in versions_dir.iterdir()
+                   if path.is_dir() and path.name < current)
+    removed = older[:max(len(older) - keep, 0)]
+    for version in removed:
+        shutil.rmtree(versions_dir / version, ignore_errors=True)
+    if removed:
+        logger.info(f"Eski model sürümleri silindi: {', '.join(removed)}")
+    return removed
@@ -5,29 +5,101 @@ Türkiye'ye özel veri toplama ve işleme entegrasyonu
 import pandas as pd
 import numpy as np
 import logging
+import itertools
 import joblib
 import json
+import os
+import re
+import threading
+import time
 from pathlib import Path
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.linear_model import LogisticRegression
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.model_selection import train_test_split, cross_val_score, StratifiedKFold
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
 from sklearn.preprocessing import StandardScaler
 from scipy.sparse import hstack, csr_matrix
-import re
-from typing import Tuple, Dict, Any, List, Optional
-from src.config import DATA_PATHS, MODELS_DIR, BUSINESS_RULES
+from pandas.api.types import union_categoricals
+from typing import Tuple, Dict, Any, Iterable, Iterator, List, Optional, Callable
+from src.config import DATA_PATHS, BUSINESS_RULES, DATABASE_CONFIG, DATASET_CONFIG, ONLINE_LEARNING_CONFIG, TRAINING_CONFIG
+from src.scoring import predict_with_proba, is_multinomial
+from src import dataset, feature_cache, model_versions
+from src.storage import ComplaintStore, sqlite_path_from_url
+from src.keywords import KeywordMatcher
+from src import text as text_utils
 
 logger = logging.getLogger(__name__)
 
+# (aşama adı, 0-1 arası ilerleme)
+ProgressCallback = Callable[[str, float], None]
+
+# Eğitim için gereken kolonlar
+TRAINING_COLUMNS = ['complaint_text', 'complaint_category']
+
+# Az sayıda farklı değer alan kolonlar (categorical tipte tutulur)
+CATEGORICAL_COLUMNS = [
+    'complaint_category', 'complaint_category_new', 'product_type', 'complaint_channel',
+    'priority_level', 'resolution_status', 'source'
+]
+
+def _data_format(data_path) -> str:
+    """Dosya uzantısından veri formatı (csv, parquet, arrow; dizinler için dataset)"""
+    if dataset.is_dataset(data_path):
+        return 'dataset'
+    suffix = Path(data_path).suffix.lower()
+    if suffix in ('.parquet', '.pq'):
+        return 'parquet'
+    if suffix in ('.feather', '.arrow', '.ipc'):
+        return 'arrow'
+    return 'csv'
+
+def _csv_read_options(columns: Optional[List[str]]) -> Dict[str, Any]:
+    """read_csv için kolon seçimi ve tipler"""
+    options = {'dtype': {column: 'category' for column in CATEGORICAL_COLUMNS}}
+    if columns is not None:
+        wanted = set(columns)
+        options['usecols'] = lambda column: column in wanted
+    return options
+
+def _with_categorical_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """CATEGORICAL_COLUMNS'taki kolonları categorical tipe çevirir"""
+    conversions = {
+        column: 'category' for column in CATEGORICAL_COLUMNS
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype)
+    }
+    return df.astype(conversions) if conversions else df
+
+def _check_filters(data_format: str, data_filters: Optional[Dict[str, Any]]) -> None:
+    """Dilim filtreleri sadece bölümlü veri setlerinde desteklenir"""
+    if data_filters and data_format != 'dataset':
+        raise ValueError("Veri filtreleri sadece bölümlü Parquet veri seti dizinlerinde kullanılabilir")
+
+def _no_data_error(data_path: Any = None) -> ValueError:
+    """Veri dosyası boş veya filtreye uyan kayıt yoksa fırlatılan hata"""
+    source = f": {data_path}" if data_path is not None else ""
+    return ValueError(f"Eğitim için veri bulunamadı (dosya boş veya filtreye uyan kayıt yok){source}")
+
+def _check_columns(df: pd.DataFrame, columns: Optional[List[str]]) -> None:
+    """İstenen kolonların okunduğunu doğrular"""
+    missing = [column for column in columns or [] if column not in df.columns]
+    if missing:
+        raise ValueError(f"Veri dosyasında eksik kolonlar: {missing}")
+
 class TurkeyDataCollector:
     """
     🇹🇷 Türkiye'ye özel müşteri şikayet veri toplama sınıfı
     """
     
-    def __init__(self):
-        """Data collector başlatma"""
-        self.collected_data = []
+    def __init__(self, store: Optional[ComplaintStore] = None):
+        """
+        Data collector başlatma
+        
+        Args:
+            store: Şikayet deposu (varsayılan: DATABASE_CONFIG["url"])
+        """
+        if store is None:
+            store = ComplaintStore(sqlite_path_from_url(DATABASE_CONFIG["url"]))
+        self.store = store
         self.categories = {
             "Ürün Kalite Sorunu": ["kalite", "bozuk", "çürük", "hasarlı", "malzeme"],
             "Yanlış Ürün": ["yanlış", "farklı", "başka", "istedigim"],
@@ -42,40 +114,19 @@ class TurkeyDataCollector:
             "Hizmet Kalite Sorunu": ["hizmet", "kalite", "personel"],
             "Teknik/Uygulama Sorunu": ["teknik", "uygulama", "yazılım", "hata"]
         }
+        self.keyword_matcher = KeywordMatcher(self.categories)
     
     def categorize_text(self, text: str) -> Tuple[str, float]:
         """Metni otomatik kategorize etme"""
-        text_lower = text.lower()
-        scores = {}
-        
-        for category, keywords in self.categories.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
-            scores[category] = score
-        
-        if max(scores.values()) > 0:
-            predicted_category = max(scores, key=scores.get)
-            confidence = min(scores[predicted_category] / 3.0, 1.0)
-            return predicted_category, confidence
-        else:
-            return "Bilinmeyen", 0.0
+        return self.keyword_matcher.categorize(text)
     
     def clean_text(self, text: str) -> str:
         """Metin temizleme"""
-        if not text:
-            return ""
-        
-        text = re.sub(r'\s+', ' ', text)
-        text = re.sub(r'[^\w\s.,!?ğüşıöçĞÜŞIİÖÇ]', '', text)
-        text = text.strip()
-        
-        if len(text) < 5:
-            return ""
-        
-        return text
+        return text_utils.clean_text(text, min_length=5)
     
-    def add_complaint(self, text: str, source: str = "manual", 
-                     category: Optional[str] = None) -> Dict[str, Any]:
-        """Şikayet ekleme"""
+    def build_complaint(self, text: str, source: str = "manual",
+                        category: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Ham metinden şikayet kaydı oluşturur (kısa metinler için None)"""
         cleaned_text = self.clean_text(text)
         if not cleaned_text:
             return None
@@ -85,27 +136,65 @@ class TurkeyDataCollector:
         else:
             confidence = 1.0
         
-        complaint = {
+        return {
             'text': cleaned_text,
             'category': category,
             'confidence': confidence,
             'source': source,
             'date': pd.Timestamp.now().isoformat()
         }
-        
-        self.collected_data.append(complaint)
+    
+    def add_complaint(self, text: str, source: str = "manual", 
+                     category: Optional[str] = None) -> Dict[str, Any]:
+        """Şikayet ekleme (aynı metin ikinci kez kaydedilmez)"""
+        complaint = self.build_complaint(text, source, category)
+        if complaint is not None:
+            self.store.add(complaint)
         return complaint
     
-    def get_dataframe(self) -> pd.DataFrame:
-        """Toplanan veriyi DataFrame'e çevir"""
-        if not self.collected_data:
-            return pd.DataFrame()
+    def add_complaints(self, complaints: List[Dict[str, Any]],
+                       default_source: str = "manual") -> List[Optional[Dict[str, Any]]]:
+        """
+        Şikayetleri tek transaction'da ekler
+        
+        Args:
+            complaints: [{'text': '...', 'category': '...', 'source': '...'}, ...]
+            default_source: source verilmeyen kayıtlar için kaynak
+            
+        Returns:
+            Girdiyle aynı sırada kayıtlar (kısa metinler için None)
+        """
+        built = [
+            self.build_complaint(
+                text=complaint.get('text', ''),
+                source=complaint.get('source', default_source),
+                category=complaint.get('category')
+            )
+            for complaint in complaints
+        ]
+        inserted = self.store.add_many(complaint for complaint in built if complaint is not None)
+        logger.info(f"{inserted} yeni şikayet kaydedildi")
+        return built
+    
+    def get_dataframe(self, source: Optional[str] = None, category: Optional[str] = None,
+                      since: Optional[str] = None, until: Optional[str] = None) -> pd.DataFrame:
+        """
+        Toplanan veriyi DataFrame'e çevir
         
-        df = pd.DataFrame(self.collected_data)
-        df = df.drop_duplicates(subset=['text'], keep='first')
+        Args:
+            source: Veri kaynağı filtresi
+            category: Kategori filtresi
+            since: Bu tarihten (ISO, dahil) itibaren
+            until: Bu tarihe (ISO, hariç) kadar
+            
+        Returns:
+            Şikayetler (kayıt yoksa boş DataFrame)
+        """
+        df = self.store.to_dataframe(source=source, category=category, since=since, until=until)
+        if df.empty:
+            return pd.DataFrame()
         
         logger.info(f"Toplam veri: {len(df)} kayıt")
-        logger.info(f"Kategori dağılımı:\n{df['category'].value_counts()}")
         
         return df
 
@@ -114,6 +203,15 @@ class ComplaintClassificationPipeline:
     Müşteri şikayet kategorilendirme pipeline'ı
     """
     
+    # TF-IDF ayarları (özellik cache anahtarının parçası)
+    TFIDF_PARAMS = {
+        'max_features': 5000,
+        'ngram_range': (1, 2),
+        'min_df': 2,
+        'max_df': 0.95,
+        'sublinear_tf': True
+    }
+    
     def __init__(self):
         """Pipeline bileşenleri"""
         self.tfidf_vectorizer = None
@@ -122,12 +220,20 @@ class ComplaintClassificationPipeline:
         self.categories = None
         self.is_trained = False
     
-    def load_data(self, data_path: str = None) -> pd.DataFrame:
+    def load_data(self, data_path: str = None,
+                  columns: Optional[List[str]] = TRAINING_COLUMNS,
+                  data_filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
         """
         Veri setini yükler
         
+        CSV, Parquet ve Arrow/Feather dosyalarını ve kaynak/ay bölümlü
+        Parquet veri seti dizinlerini okur. Sadece istenen kolonlar okunur;
+        tekrar eden etiket kolonları categorical tipe çevrilir.
+        
         Args:
-            data_path: Veri dosyası yolu
+            data_path: Veri dosyası veya veri seti dizini yolu
+            columns: Okunacak kolonlar (None: tümü)
+            data_filters: Veri seti dilimi (source, since, until; sadece dizinler için)
             
         Returns:
             Yüklenen dataframe
@@ -136,13 +242,86 @@ class ComplaintClassificationPipeline:
             data_path = DATA_PATHS["complaints_data"]
         
         logger.info(f"Veri yükleniyor: {data_path}")
-        df = pd.read_csv(data_path)
+        
+        data_format = _data_format(data_path)
+        _check_filters(data_format, data_filters)
+        if data_format == 'dataset':
+            df = dataset.read(data_path, columns=columns, **(data_filters or {}))
+        elif data_format == 'parquet':
+            df = pd.read_parquet(data_path, columns=columns)
+        elif data_format == 'arrow':
+            df = pd.read_feather(data_path, columns=columns)
+        else:
+            try:
+                df = pd.read_csv(data_path, **_csv_read_options(columns))
+            except pd.errors.EmptyDataError:
+                raise _no_data_error(data_path) from None
+        if df.empty:
+            raise _no_data_error(data_path)
+        df = _with_categorical_dtypes(df)
+        _check_columns(df, columns)
         
         logger.info(f"Veri boyutu: {df.shape}")
         logger.info(f"Kategoriler: {df['complaint_category'].value_counts().to_dict()}")
         
         return df
     
+    def iter_data(self, data_path: str = None, chunk_size: Optional[int] = None,
+                  columns: Optional[List[str]] = TRAINING_COLUMNS,
+                  data_filters: Optional[Dict[str, Any]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Veri setini parça parça okur (tüm dosya belleğe alınmaz)
+        
+        Args:
+            data_path: Veri dosyası veya veri seti dizini yolu
+            chunk_size: Parça başına satır (varsayılan: TRAINING_CONFIG["load_chunk_size"])
+            columns: Okunacak kolonlar (None: tümü)
+            data_filters: Veri seti dilimi (source, since, until; sadece dizinler için)
+            
+        Yields:
+            Tipleri load_data ile aynı olan dataframe parçaları
+        """
+        if data_path is None:
+            data_path = DATA_PATHS["complaints_data"]
+        if chunk_size is None:
+            chunk_size = TRAINING_CONFIG["load_chunk_size"]
+        
+        logger.info(f"Veri parça parça okunuyor: {data_path} ({chunk_size} satır)")
+        
+        data_format = _data_format(data_path)
+        _check_filters(data_format, data_filters)
+        if data_format == 'dataset':
+            frames = dataset.iter_batches(data_path, chunk_size, columns=columns, **(data_filters or {}))
+        elif data_format == 'parquet':
+            import pyarrow.parquet as pq
+            batches = pq.ParquetFile(data_path).iter_batches(batch_size=chunk_size, columns=columns)
+            frames = (batch.to_pandas() for batch in batches)
+        elif data_format == 'arrow':
+            import pyarrow as pa
+            # Bellek eşlemeli okuma: parçalar dosyadan kopyalanmadan dilimlenir
+            table = pa.ipc.open_file(pa.memory_map(str(data_path))).read_all()
+            if columns is not None:
+                table = table.select([column for column in columns if column in table.column_names])
+            frames = (batch.to_pandas() for batch in table.to_batches(max_chunksize=chunk_size))
+        else:
+            frames = None
+        
+        if frames is not None:
+            for chunk in frames:
+                chunk = _with_categorical_dtypes(chunk)
+                _check_columns(chunk, columns)
+                yield chunk
+            return
+        
+        try:
+            reader = pd.read_csv(data_path, chunksize=chunk_size, **_csv_read_options(columns))
+        except pd.errors.EmptyDataError:
+            raise _no_data_error(data_path) from None
+        with reader:
+            for chunk in reader:
+                _check_columns(chunk, columns)
+                yield chunk
+    
     def preprocess_text(self, text: str) -> str:
         """
         Metin ön işleme
@@ -153,77 +332,113 @@ class ComplaintClassificationPipeline:
         Returns:
             Temizlenmiş metin
         """
-        if pd.isna(text) or text == "":
-            return ""
-        
-        # Temel temizleme
-        text = text.lower()
-        text = re.sub(r'[^a-zğüşıöçĞÜŞIİÖÇ\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return text_utils.normalize_text(text)
     
     def prepare_features(self, df: pd.DataFrame) -> Tuple[Any, pd.Series]:
         """
         Özellik hazırlama
         
         Args:
-            df: Input dataframe
+            df: Input dataframe (değiştirilmez)
             
         Returns:
             Özellik matrisi ve hedef değişken
         """
-        logger.info("Özellikler hazırlanıyor...")
+        return self.prepare_features_from_chunks([df])
+    
+    def prepare_features_from_chunks(self, chunks: Iterable[pd.DataFrame]) -> Tuple[Any, pd.Series]:
+        """
+        Dataframe parçalarından özellik hazırlama (out-of-core)
         
-        # Metin temizleme
-        df['cleaned_text'] = df['complaint_text'].apply(self.preprocess_text)
+        Parçalar tek geçişte tüketilir: temizlenmiş metinler doğrudan
+        TF-IDF'e akıtılır, her parçadan yalnızca uzunluk, kelime sayısı ve
+        etiket tutulur. Ham metin kolonu hiçbir zaman bütünüyle bellekte
+        olmaz. Sonuç prepare_features ile aynıdır.
+        
+        Args:
+            chunks: complaint_text ve complaint_category kolonlu dataframe'ler (ör. iter_data)
+            
+        Returns:
+            Özellik matrisi ve hedef değişken (categorical)
+            
+        Raises:
+            ValueError: Hiç kayıt yoksa (boş dosya veya filtreye uyan kayıt yok)
+        """
+        logger.info("Özellikler hazırlanıyor...")
         
-        # Ek özellikler
-        df['text_length'] = df['complaint_text'].str.len()
-        df['word_count'] = df['complaint_text'].str.split().str.len()
+        numerical_parts, label_parts = [], []
+        
+        # Boş parçalar atlanır; hiç kayıt yoksa TF-IDF'e girmeden hata verilir
+        chunks = (chunk for chunk in chunks if len(chunk))
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            raise _no_data_error()
+        
+        def cleaned_texts() -> Iterator[str]:
+            for chunk in itertools.chain([first_chunk], chunks):
+                texts = chunk['complaint_text']
+                
+                # Ek özellikler
+                numerical_parts.append(np.column_stack([
+                    texts.str.len().to_numpy(dtype=float),
+                    texts.str.split().str.len().to_numpy(dtype=float)
+                ]))
+                label_parts.append(pd.Categorical(chunk['complaint_category']))
+                
+                # Metin temizleme
+                yield from text_utils.normalize_texts(texts.tolist())
         
         # TF-IDF vektörleştirme
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=5000,
-            ngram_range=(1, 2),
-            min_df=2,
-            max_df=0.95,
-            sublinear_tf=True
-        )
+        self.tfidf_vectorizer = TfidfVectorizer(**self.TFIDF_PARAMS)
         
-        X_text = self.tfidf_vectorizer.fit_transform(df['cleaned_text'])
+        X_text = self.tfidf_vectorizer.fit_transform(cleaned_texts())
         
         # Sayısal özellikler
         self.feature_scaler = StandardScaler()
-        X_numerical = self.feature_scaler.fit_transform(
-            df[['text_length', 'word_count']].values
-        )
+        X_numerical = self.feature_scaler.fit_transform(np.concatenate(numerical_parts))
         
-        # Özellikleri birleştir
-        X_combined = hstack([X_text, csr_matrix(X_numerical)])
-        y = df['complaint_category']
+        # Özellikleri birleştir (split, fit ve CV fold'ları satır indekslediği için tek seferde CSR)
+        X_combined = hstack([X_text, csr_matrix(X_numerical)], format='csr')
+        y = pd.Series(union_categoricals(label_parts), name='complaint_category')
         
         logger.info(f"Özellik matrisi boyutu: {X_combined.shape}")
         
         return X_combined, y
     
-    def train_model(self, X: Any, y: pd.Series) -> Dict[str, Any]:
+    def train_model(self, X: Any, y: pd.Series, cv_mode: Optional[str] = None,
+                    n_jobs: Optional[int] = None) -> Dict[str, Any]:
         """
         Model eğitimi
         
+        Cross-validation fold'ları hazır özellik matrisini paylaşır (TF-IDF
+        yeniden hesaplanmaz) ve n_jobs süreçte paralel çalışır. Büyük veri
+        setlerinde CV örneklenebilir veya kapatılabilir.
+        
         Args:
             X: Özellik matrisi
             y: Hedef değişken
+            cv_mode: full, sampled, none veya auto (varsayılan: TRAINING_CONFIG)
+            n_jobs: CV için paralel süreç sayısı (varsayılan: TRAINING_CONFIG)
             
         Returns:
-            Eğitim sonuçları
+            Eğitim sonuçları (aşama süreleri 'stage_seconds' altında)
         """
+        if cv_mode is None:
+            cv_mode = TRAINING_CONFIG["cv_mode"]
+        if cv_mode not in ('full', 'sampled', 'none', 'auto'):
+            raise ValueError(f"Geçersiz cv_mode: {cv_mode}")
+        if n_jobs is None:
+            n_jobs = TRAINING_CONFIG["n_jobs"]
+        
         logger.info("Model eğitimi başlatılıyor...")
+        stage_seconds = {}
         
         # Train/test split
+        start = time.perf_counter()
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=0.2, random_state=42, stratify=y
         )
+        stage_seconds['split'] = time.perf_counter() - start
         
         # Model
         self.model = LogisticRegression(
@@ -236,29 +451,52 @@ class ComplaintClassificationPipeline:
         )
         
         # Eğitim
+        start = time.perf_counter()
         self.model.fit(X_train, y_train)
         self.categories = self.model.classes_
         self.is_trained = True
+        stage_seconds['fit'] = time.perf_counter() - start
         
         # Performans değerlendirme
+        start = time.perf_counter()
         y_pred = self.model.predict(X_test)
         accuracy = accuracy_score(y_test, y_pred)
+        stage_seconds['evaluate'] = time.perf_counter() - start
         
         # Cross-validation
-        cv = StratifiedKFold(n_splits=5, shuffle=True, random_state=42)
-        cv_scores = cross_val_score(self.model, X_train, y_train, cv=cv, scoring='accuracy')
+        if cv_mode == 'auto':
+            cv_mode = 'sampled' if len(y_train) > TRAINING_CONFIG["cv_sample_size"] else 'full'
+        
+        cv_mean = cv_std = None
+        cv_size = 0
+        if cv_mode != 'none':
+            start = time.perf_counter()
+            X_cv, y_cv = X_train, y_train
+            if cv_mode == 'sampled' and len(y_train) > TRAINING_CONFIG["cv_sample_size"]:
+                X_cv, _, y_cv, _ = train_test_split(
+                    X_train, y_train, train_size=TRAINING_CONFIG["cv_sample_size"],
+                    random_state=42, stratify=y_train
+                )
+            cv = StratifiedKFold(n_splits=TRAINING_CONFIG["cv_folds"], shuffle=True, random_state=42)
+            cv_scores = cross_val_score(self.model, X_cv, y_cv, cv=cv, scoring='accuracy', n_jobs=n_jobs)
+            cv_mean, cv_std, cv_size = cv_scores.mean(), cv_scores.std(), len(y_cv)
+            stage_seconds['cross_validation'] = time.perf_counter() - start
         
         results = {
             'test_accuracy': accuracy,
-            'cv_mean': cv_scores.mean(),
-            'cv_std': cv_scores.std(),
+            'cv_mode': cv_mode,
+            'cv_size': cv_size,
+            'cv_mean': cv_mean,
+            'cv_std': cv_std,
             'classification_report': classification_report(y_test, y_pred),
-            'confusion_matrix': confusion_matrix(y_test, y_pred),
+            'confusion_matrix': confusion_matrix(y_test, y_pred).tolist(),
             'test_size': len(y_test),
-            'train_size': len(y_train)
+            'train_size': len(y_train),
+            'stage_seconds': stage_seconds
         }
         
         logger.info(f"Model eğitimi tamamlandı. Test doğruluğu: {accuracy:.4f}")
+        logger.info("Eğitim aşama süreleri: " + ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in stage_seconds.items()))
         
         return results
     
@@ -266,14 +504,19 @@ class ComplaintClassificationPipeline:
         """
         Model kaydetme
         
+        Dizin verilmezse model yeni bir sürüm dizinine (models/versions/<sürüm>)
+        yazılır ve tüm dosyalar yazıldıktan sonra aktif sürüm yapılır;
+        çalışan API bu sürümü yeniden başlatılmadan devreye alır.
+        
         Args:
-            output_dir: Kayıt dizini
+            output_dir: Kayıt dizini (verilirse sürüm işaretçisi değişmez)
             
         Returns:
             Kaydedilen dosya yolları
         """
-        if output_dir is None:
-            output_dir = MODELS_DIR
+        publish = output_dir is None
+        if publish:
+            output_dir = model_versions.new_version_dir()
         
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -308,29 +551,98 @@ class ComplaintClassificationPipeline:
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
         
+        # Sunum için NumPy motoru
+        engine_dir = self.export_engine(output_dir / 'inference_engine')
+        
         paths = {
             'model': str(model_path),
             'tfidf': str(tfidf_path),
             'scaler': str(scaler_path),
-            'metadata': str(metadata_path)
+            'metadata': str(metadata_path),
+            'engine': str(engine_dir)
         }
         
+        if publish:
+            paths['version'] = model_versions.publish_version(output_dir)
+        
         logger.info(f"Model kaydedildi: {paths}")
         
         return paths
     
+    def export_engine(self, engine_dir: Path) -> Path:
+        """
+        Sunum için sklearn'den bağımsız kompakt model artifact'i yazar
+        
+        Sözlük (sıralı terimler ve kolon indeksleri), idf vektörü, katsayı
+        matrisi, intercept ve scaler ortalama/ölçek değerleri ayrı ``.npy``
+        dosyaları, tokenizer ayarları JSON olarak kaydedilir. Diziler
+        ``mmap_mode='r'`` ile açılabildiği için aynı makinedeki worker'lar
+        tek bir fiziksel kopyayı page cache üzerinden paylaşır.
+        inference modülündeki NumpyInferenceEngine bu dizini okur.
+        
+        Args:
+            engine_dir: Artifact dizini
+            
+        Returns:
+            Artifact dizini
+        """
+        if not self.is_trained:
+            raise ValueError("Model henüz eğitilmemiş!")
+        
+        tfidf = self.tfidf_vectorizer
+        if tfidf.analyzer != 'word' or tfidf.preprocessor is not None or tfidf.tokenizer is not None:
+            raise ValueError("Sadece varsayılan word analyzer dışa aktarılabilir")
+        
+        engine_dir.mkdir(parents=True, exist_ok=True)
+        
+        n_terms = len(tfidf.vocabulary_)
+        sorted_vocabulary = sorted(tfidf.vocabulary_.items())
+        
+        scaler = self.feature_scaler
+        n_numeric = scaler.n_features_in_
+        
+        arrays = {
+            # searchsorted ile arama için sabit genişlikli, sıralı terimler
+            'terms': np.array([term for term, _ in sorted_vocabulary], dtype=str),
+            'term_columns': np.array([column for _, column in sorted_vocabulary], dtype=np.intp),
+            'idf': tfidf.idf_ if tfidf.use_idf else np.ones(n_terms),
+            'coef': np.ascontiguousarray(self.model.coef_.T),
+            'intercept': np.asarray(self.model.intercept_, dtype=float),
+            'scaler_mean': scaler.mean_ if scaler.with_mean else np.zeros(n_numeric),
+            'scaler_scale': scaler.scale_ if scaler.with_std else np.ones(n_numeric),
+            'classes': np.asarray(self.model.classes_).astype(str)
+        }
+        for name, array in arrays.items():
+            np.save(engine_dir / f'{name}.npy', np.ascontiguousarray(array), allow_pickle=False)
+        
+        meta = {
+            'multinomial': is_multinomial(self.model),
+            'lowercase': tfidf.lowercase,
+            'token_pattern': tfidf.token_pattern,
+            'ngram_range': list(tfidf.ngram_range),
+            'sublinear_tf': tfidf.sublinear_tf,
+            'norm': tfidf.norm,
+            'arrays': sorted(arrays)
+        }
+        with open(engine_dir / 'meta.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+        
+        logger.info(f"Inference motoru dışa aktarıldı: {engine_dir}")
+        
+        return engine_dir
+    
     def load_model(self, model_dir: Path = None) -> bool:
         """
         Model yükleme
         
         Args:
-            model_dir: Model dizini
+            model_dir: Model dizini (varsayılan: aktif sürüm)
             
         Returns:
             Yükleme başarısı
         """
         if model_dir is None:
-            model_dir = MODELS_DIR
+            model_dir = model_versions.current_model_dir()
         
         try:
             logger.info("Pipeline modeli yükleniyor...")
@@ -390,8 +702,9 @@ class ComplaintClassificationPipeline:
         features = hstack([text_features, csr_matrix(numerical_features)])
         
         # Tahmin
-        prediction = self.model.predict(features)[0]
-        probabilities = self.model.predict_proba(features)[0]
+        predictions, probabilities = predict_with_proba(self.model, features)
+        prediction = predictions[0]
+        probabilities = probabilities[0]
         
         # Sonuç
         result = {
@@ -436,50 +749,310 @@ class ComplaintClassificationPipeline:
         
         return results
     
-    def run_full_pipeline(self, data_path: str = None, save_model: bool = True) -> Dict[str, Any]:
+    def run_full_pipeline(self, data_path: str = None, save_model: bool = True,
+                          progress_callback: Optional[ProgressCallback] = None,
+                          use_feature_cache: Optional[bool] = None,
+                          data_filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Tam pipeline çalıştırma
         
+        Aynı veri dosyası ve TF-IDF ayarlarıyla daha önce hesaplanan özellik
+        matrisi cache'te varsa veri okuma ve özellik hazırlama atlanır.
+        
         Args:
-            data_path: Veri dosyası yolu
+            data_path: Veri dosyası veya bölümlü veri seti dizini yolu
             save_model: Model kaydedilsin mi
+            progress_callback: Her aşama başında (aşama adı, 0-1 ilerleme) ile çağrılır
+            use_feature_cache: Özellik cache'i kullanılsın mı (varsayılan: TRAINING_CONFIG)
+            data_filters: Sadece bu dilimle eğit, ör. {'source': 'sikayetvar', 'since': '2024-01'}
             
         Returns:
             Pipeline sonuçları
         """
         logger.info("Tam pipeline çalıştırılıyor...")
         
-        # 1. Veri yükleme
-        df = self.load_data(data_path)
+        def report(stage: str, progress: float):
+            if progress_callback is not None:
+                progress_callback(stage, progress)
         
-        # 2. Özellik hazırlama
-        X, y = self.prepare_features(df)
+        if data_path is None:
+            data_path = DATA_PATHS["complaints_data"]
+        if use_feature_cache is None:
+            use_feature_cache = TRAINING_CONFIG["feature_cache"]
+        
+        stage_seconds = {}
+        cached = None
+        cache_key = None
+        
+        if use_feature_cache:
+            start = time.perf_counter()
+            params = {**self.TFIDF_PARAMS, 'data_filters': data_filters} if data_filters else self.TFIDF_PARAMS
+            cache_key = feature_cache.dataset_fingerprint(Path(data_path), params)
+            cached = feature_cache.load(TRAINING_CONFIG["feature_cache_dir"], cache_key)
+            stage_seconds['feature_cache_lookup'] = time.perf_counter() - start
+        
+        if cached is not None:
+            # 1-2. Özellikler cache'ten
+            X, y, self.tfidf_vectorizer, self.feature_scaler, cache_meta = cached
+            data_shape = tuple(cache_meta['data_shape'])
+            logger.info(f"Özellik matrisi cache'ten yüklendi ({cache_key[:12]}): {X.shape}")
+        else:
+            # 1-2. Veri parça parça okunup özelliklere dönüştürülür
+            report('load_data', 0.1)
+            report('prepare_features', 0.2)
+            start = time.perf_counter()
+            loaded = {'rows': 0, 'columns': 0}
+            
+            def counted(chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+                # Okunan verinin gerçek boyutu (parçalar tek geçişte tüketilir)
+                for chunk in chunks:
+                    loaded['rows'] += len(chunk)
+                    loaded['columns'] = max(loaded['columns'], chunk.shape[1])
+                    yield chunk
+            
+            X, y = self.prepare_features_from_chunks(
+                counted(self.iter_data(data_path, data_filters=data_filters))
+            )
+            data_shape = (loaded['rows'], loaded['columns'])
+            stage_seconds['load_and_prepare_features'] = time.perf_counter() - start
+            logger.info(f"Veri boyutu: {data_shape}")
+            logger.info(f"Kategoriler: {y.value_counts().to_dict()}")
+            
+            if cache_key is not None:
+                feature_cache.save(
+                    TRAINING_CONFIG["feature_cache_dir"], cache_key, X, y,
+                    self.tfidf_vectorizer, self.feature_scaler, {'data_shape': list(data_shape)},
+                    max_entries=TRAINING_CONFIG["feature_cache_max_entries"]
+                )
         
         # 3. Model eğitimi
+        report('train_model', 0.4)
+        start = time.perf_counter()
         training_results = self.train_model(X, y)
+        stage_seconds['train_model'] = time.perf_counter() - start
         
         # 4. Model kaydetme
         saved_paths = {}
         if save_model:
+            report('save_model', 0.9)
+            start = time.perf_counter()
             saved_paths = self.save_model()
+            stage_seconds['save_model'] = time.perf_counter() - start
         
         # Pipeline özeti
         pipeline_summary = {
-            'data_shape': df.shape,
+            'data_shape': data_shape,
+            'feature_cache': 'hit' if cached is not None else ('miss' if cache_key is not None else 'disabled'),
             'features_shape': X.shape,
             'categories': self.categories.tolist(),
             'training_results': training_results,
             'saved_paths': saved_paths,
+            'stage_seconds': stage_seconds,
             'status': 'success'
         }
         
-        logger.info("Pipeline başarıyla tamamlandı!")
+        logger.info("Pipeline başarıyla tamamlandı! Aşama süreleri: "
+                    + ", ".join(f"{stage}={seconds:.2f}s" for stage, seconds in stage_seconds.items()))
         
         return pipeline_summary
 
+class OnlineComplaintClassifier:
+    """
+    Artımlı öğrenen şikayet sınıflandırıcı
+    
+    Durumsuz HashingVectorizer ve SGDClassifier(log_loss) kullanır; sözlük
+    veya yeniden fit gerektirmediği için yeni etiketli şikayetler
+    ``partial_fit`` ile milisaniyeler içinde modele eklenir. Sınıflar
+    BUSINESS_RULES'taki 12 kategoriye sabittir. Kalite için tam TF-IDF +
+    LogisticRegression eğitimi (/train) ayrıca çalıştırılmaya devam eder.
+    """
+    
+    def __init__(self, model_path: Path = None, n_features: int = 2 ** 18,
+                 save_every: int = 200):
+        """
+        Args:
+            model_path: Modelin kaydedileceği dosya
+            n_features: Hash uzayının boyutu
+            save_every: Kaç yeni örnekte bir diske kaydedileceği
+        """
+        self.model_path = model_path
+        self.save_every = save_every
+        self.classes = np.array(BUSINESS_RULES["supported_categories"])
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm='l2'
+        )
+        self.model = self._new_model()
+        self.n_samples_seen = 0
+        self._unsaved = 0
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _new_model() -> SGDClassifier:
+        return SGDClassifier(loss='log_loss', alpha=1e-5, random_state=42)
+    
+    @property
+    def is_ready(self) -> bool:
+        """En az bir örnekle eğitildi mi"""
+        return self.n_samples_seen > 0
+    
+    def featurize(self, texts: List[str]) -> csr_matrix:
+        """
+        Metinleri hash özelliklerine çevirir
+        
+        Args:
+            texts: Ham metinler
+            
+        Returns:
+            (n, n_features) seyrek matris
+        """
+        return self.vectorizer.transform(text_utils.normalize_texts(texts))
+    
+    def map_labels(self, texts: List[str], labels: List[Optional[str]]) -> Tuple[List[str], List[str]]:
+        """
+        Etiketleri 12 kategoriye eşler, eşlenemeyenleri atar
+        
+        Args:
+            texts: Metinler
+            labels: Etiketler (9'lu İngilizce veya 12'li Türkçe kategoriler)
+            
+        Returns:
+            Eğitilebilir (metinler, etiketler)
+        """
+        known = set(self.classes)
+        kept_texts, kept_labels = [], []
+        for text, label in zip(texts, labels):
+            if not label:
+                continue
+            label = expand_categories_9_to_12(text, label)
+            if label in known:
+                kept_texts.append(text)
+                kept_labels.append(label)
+        return kept_texts, kept_labels
+    
+    def partial_fit(self, texts: List[str], labels: List[Optional[str]]) -> int:
+        """
+        Modeli yeni örneklerle günceller
+        
+        Args:
+            texts: Metinler
+            labels: Etiketler
+            
+        Returns:
+            Modele eklenen örnek sayısı
+        """
+        texts, labels = self.map_labels(texts, labels)
+        if not texts:
+            return 0
+        
+        X = self.featurize(texts)
+        with self._lock:
+            self.model.partial_fit(X, labels, classes=self.classes)
+            self.n_samples_seen += len(texts)
+            self._unsaved += len(texts)
+            should_save = self.model_path is not None and self._unsaved >= self.save_every
+        
+        if should_save:
+            self.save()
+        
+        return len(texts)
+    
+    def predict(self, text: str) -> Dict[str, Any]:
+        """
+        Tahmin yapma
+        
+        Args:
+            text: Tahmin edilecek metin
+            
+        Returns:
+            Tahmin sonucu
+        """
+        if not self.is_ready:
+            raise ValueError("Online model henüz eğitilmemiş!")
+        
+        X = self.featurize([text])
+        with self._lock:
+            probabilities = self.model.predict_proba(X)[0]
+            classes = self.model.classes_
+        
+        best = int(probabilities.argmax())
+        return {
+            'prediction': classes[best],
+            'confidence': float(probabilities[best]),
+            'all_probabilities': {
+                cat: float(prob) for cat, prob in zip(classes, probabilities)
+            },
+            'text_length': len(text),
+            'word_count': len(text.split())
+        }
+    
+    def save(self) -> None:
+        """Modeli diske atomik olarak kaydeder"""
+        if self.model_path is None:
+            return
+        
+        with self._lock:
+            state = {
+                'model': self.model,
+                'n_samples_seen': self.n_samples_seen,
+                'n_features': self.vectorizer.n_features
+            }
+            tmp_path = self.model_path.with_suffix('.tmp')
+            self.model_path.parent.mkdir(parents=True, exist_ok=True)
+            joblib.dump(state, tmp_path)
+            os.replace(tmp_path, self.model_path)
+            self._unsaved = 0
+        
+        logger.info(f"Online model kaydedildi: {self.n_samples_seen} örnek")
+    
+    def load(self) -> bool:
+        """
+        Kaydedilmiş modeli yükler
+        
+        Returns:
+            Yükleme başarısı
+        """
+        if self.model_path is None or not self.model_path.exists():
+            return False
+        
+        try:
+            state = joblib.load(self.model_path)
+            if state['n_features'] != self.vectorizer.n_features:
+                logger.warning("Online model hash boyutu farklı, yeni model ile başlanıyor")
+                return False
+            
+            with self._lock:
+                self.model = state['model']
+                self.n_samples_seen = state['n_samples_seen']
+                self._unsaved = 0
+            
+            logger.info(f"Online model yüklendi: {self.n_samples_seen} örnek")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Online model yükleme hatası: {e}")
+            return False
+    
+    def stats(self) -> Dict[str, Any]:
+        """Online model durumu"""
+        return {
+            'enabled': ONLINE_LEARNING_CONFIG["enabled"],
+            'ready': self.is_ready,
+            'n_samples_seen': self.n_samples_seen,
+            'unsaved_samples': self._unsaved,
+            'n_features': self.vectorizer.n_features
+        }
+
 # Pipeline instance
 pipeline = ComplaintClassificationPipeline()
 data_collector = TurkeyDataCollector()
+online_classifier = OnlineComplaintClassifier(
+    model_path=ONLINE_LEARNING_CONFIG["model_path"],
+    n_features=ONLINE_LEARNING_CONFIG["n_features"],
+    save_every=ONLINE_LEARNING_CONFIG["save_every"]
+)
 
 def run_pipeline(data_path: str = None, save: bool = True) -> Dict[str, Any]:
     """
@@ -494,6 +1067,36 @@ def run_pipeline(data_path: str = None, save: bool = True) -> Dict[str, Any]:
     """
     return pipeline.run_full_pipeline(data_path, save)
 
+# 9→12 genişletme: alt kategoriler sırayla denenir, ilk eşleşen seçilir; eşleşme yoksa varsayılan
+CATEGORY_EXPANSION_RULES = {
+    "Delivery Issues": ({
+        "Kargo Gecikmesi": ["gecik", "geç", "zaman", "teslimat"],
+        "Kargo Firması Problemi": ["kurye", "dağıtım", "kargo firması", "şube", "teslim edilemedi"],
+    }, "Kargo Gecikmesi"),
+    "Product Quality": ({
+        "Ürün Kalite Sorunu": ["kalite", "bozuk", "kusur"],
+        "Paketleme/Ambalaj Problemi": ["paket", "ambalaj", "kutu", "ezik"],
+        "Ürün Açıklaması Yanıltıcı": ["açıklama", "fotoğraf", "yanıltıcı"],
+    }, "Ürün Kalite Sorunu"),
+}
+
+# Metne bakılmadan eşlenen kategoriler
+CATEGORY_DIRECT_MAPPING = {
+    "Customer Service": "Müşteri Hizmetleri Sorunu",
+    "Technical Support": "Teknik/Uygulama Sorunu",
+    "Return/Refund": "İade/Değişim Sorunu",
+    "Billing Issues": "Ödeme/Fatura Sorunu",
+    "Website Issues": "Teknik/Uygulama Sorunu",
+    "Service Outage": "Hizmet Kalite Sorunu",
+    "Fraud Issues": "Ödeme/Fatura Sorunu",
+}
+
+# Alt kategori tabloları küçük olduğundan eşleştiriciler C seviyesinde `in` taraması kullanır
+_EXPANSION_MATCHERS = {
+    category: KeywordMatcher(keyword_table)
+    for category, (keyword_table, _) in CATEGORY_EXPANSION_RULES.items()
+}
+
 def expand_categories_9_to_12(text: str, category: str) -> str:
     """
     9 İngilizce kategoriyi 12 Türkçe kategoriye genişlet
@@ -505,81 +1108,106 @@ def expand_categories_9_to_12(text: str, category: str) -> str:
     Returns:
         Genişletilmiş kategori
     """
-    text_lower = text.lower()
-
-    # Delivery Issues mapping
-    if category == "Delivery Issues":
-        if any(keyword in text_lower for keyword in ["gecik", "geç", "zaman", "teslimat"]):
-            return "Kargo Gecikmesi"
-        elif any(keyword in text_lower for keyword in ["kurye", "dağıtım", "kargo firması", "şube", "teslim edilemedi"]):
-            return "Kargo Firması Problemi"
-        else:
-            return "Kargo Gecikmesi"  # default
-
-    # Product Quality mapping
-    elif category == "Product Quality":
-        if any(keyword in text_lower for keyword in ["kalite", "bozuk", "kusur"]):
-            return "Ürün Kalite Sorunu"
-        elif any(keyword in text_lower for keyword in ["paket", "ambalaj", "kutu", "ezik"]):
-            return "Paketleme/Ambalaj Problemi"
-        elif any(keyword in text_lower for keyword in ["açıklama", "fotoğraf", "yanıltıcı"]):
-            return "Ürün Açıklaması Yanıltıcı"
-        else:
-            return "Ürün Kalite Sorunu"  # default
-
-    # Direct mappings
-    elif category == "Customer Service":
-        return "Müşteri Hizmetleri Sorunu"
-    elif category == "Technical Support":
-        return "Teknik/Uygulama Sorunu"
-    elif category == "Return/Refund":
-        return "İade/Değişim Sorunu"
-    elif category == "Billing Issues":
-        return "Ödeme/Fatura Sorunu"
-    elif category == "Website Issues":
-        return "Teknik/Uygulama Sorunu"
-    elif category == "Service Outage":
-        return "Hizmet Kalite Sorunu"
-    elif category == "Fraud Issues":
-        return "Ödeme/Fatura Sorunu"
-
-    # Default fallback
-    return category
-
-def collect_and_train(complaints: List[Dict[str, str]], save: bool = True) -> Dict[str, Any]:
+    matcher = _EXPANSION_MATCHERS.get(category)
+    if matcher is not None:
+        default = CATEGORY_EXPANSION_RULES[category][1]
+        return matcher.first_label(text, default)
+
+    # Bilinmeyen kategoriler olduğu gibi kalır
+    return CATEGORY_DIRECT_MAPPING.get(category, category)
+
+def expand_categories_9_to_12_batch(texts: pd.Series, categories: pd.Series) -> pd.Series:
+    """
+    expand_categories_9_to_12'nin kolon bazlı (vektörize) karşılığı
+
+    Satır başına Python çağrısı yerine her alt kategori için küçük harfli
+    metin kolonunda tek bir str.contains maskesi hesaplanır; sonuçlar
+    satır bazlı fonksiyonla birebir aynıdır.
+
+    Args:
+        texts: Şikayet metinleri
+        categories: Orijinal kategoriler (texts ile aynı index)
+
+    Returns:
+        Genişletilmiş kategoriler
+    """
+    expanded = categories.astype(object).replace(CATEGORY_DIRECT_MAPPING)
+
+    for category, (keyword_table, default) in CATEGORY_EXPANSION_RULES.items():
+        in_category = (categories == category).to_numpy()
+        if not in_category.any():
+            continue
+
+        # object dtype: küçültme str.lower() ile yapılır (Arrow tabanlı string
+        # dtype 'İ' harfini farklı küçülttüğü için satır bazlı sonuçtan sapar)
+        lowered = texts[in_category].astype(str).astype(object).str.lower()
+        labels = np.full(len(lowered), default, dtype=object)
+        undecided = np.ones(len(lowered), dtype=bool)
+        # Öncelik sırasıyla: bir satıra ilk eşleşen alt kategori atanır
+        for label, keywords in keyword_table.items():
+            pattern = '|'.join(re.escape(keyword) for keyword in keywords)
+            matched = lowered.str.contains(pattern, regex=True).to_numpy() & undecided
+            labels[matched] = label
+            undecided &= ~matched
+        expanded[in_category] = labels
+
+    return expanded
+
+def collect_complaints(complaints: List[Dict[str, str]]) -> pd.DataFrame:
+    """
+    Şikayetleri collector'a ekler
+
+    Args:
+        complaints: Şikayet listesi [{'text': '...', 'category': '...'}, ...]
+
+    Returns:
+        Toplanan tüm şikayetler
+    """
+    logger.info(f"Veri toplama başlıyor: {len(complaints)} şikayet")
+
+    data_collector.add_complaints(complaints)
+
+    return data_collector.get_dataframe()
+
+def collect_and_train(complaints: List[Dict[str, str]], save: bool = True,
+                      progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Any]:
     """
     Şikayetleri topla ve modeli eğit
 
     Args:
         complaints: Şikayet listesi [{'text': '...', 'category': '...'}, ...]
         save: Model kaydedilsin mi
+        progress_callback: Aşama ilerlemesi için geri çağırma (opsiyonel)
 
     Returns:
         Pipeline sonuçları
     """
-    logger.info(f"Veri toplama başlıyor: {len(complaints)} şikayet")
+    df = collect_complaints(complaints)
+    return train_on_collected(df, save, progress_callback)
 
-    # Şikayetleri collector'a ekle
-    for complaint in complaints:
-        data_collector.add_complaint(
-            text=complaint.get('text', ''),
-            source=complaint.get('source', 'manual'),
-            category=complaint.get('category')
-        )
+def train_on_collected(df: pd.DataFrame, save: bool = True,
+                       progress_callback: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Toplanmış şikayetlerle modeli eğit
 
-    # DataFrame'e çevir
-    df = data_collector.get_dataframe()
+    Args:
+        df: get_collected_data çıktısı (text, category, source, ...)
+        save: Model kaydedilsin mi
+        progress_callback: Aşama ilerlemesi için geri çağırma (opsiyonel)
 
+    Returns:
+        Pipeline sonuçları
+    """
     if df.empty:
         logger.error("Hiç veri toplanamadı!")
         return {'status': 'error', 'message': 'No data collected'}
 
-    # 9→12 label genişletme
-    df['category_new'] = df.apply(lambda row: expand_categories_9_to_12(row['text'], row['category']), axis=1)
+    if progress_callback is not None:
+        progress_callback('save_data', 0.0)
 
-    # Veriyi kaydet
-    output_path = Path(DATA_PATHS.get("complaints_data", "data/raw/complaints.csv"))
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # 9→12 label genişletme
+    df = df.copy()
+    df['category_new'] = expand_categories_9_to_12_batch(df['text'], df['category'])
 
     # Kolon adlarını rename et
     df_renamed = df.rename(columns={
@@ -588,11 +1216,12 @@ def collect_and_train(complaints: List[Dict[str, str]], save: bool = True) -> Di
         'category_new': 'complaint_category_new'
     })
 
-    df_renamed.to_csv(output_path, index=False, encoding='utf-8')
+    # Veriyi kaynak/ay bölümlü Parquet veri seti olarak kaydet (önceki eğitim verisinin yerine)
+    output_path = dataset.write(df_renamed, DATASET_CONFIG["training_dir"], replace=True)
     logger.info(f"Veri kaydedildi: {output_path}")
 
     # Pipeline çalıştır
-    return pipeline.run_full_pipeline(str(output_path), save)
+    return pipeline.run_full_pipeline(str(output_path), save, progress_callback)
 
 def add_complaint_to_dataset(text: str, category: Optional[str] = None, 
                             source: str = "manual") -> Dict[str, Any]:
@@ -609,6 +1238,21 @@ def add_complaint_to_dataset(text: str, category: Optional[str] = None,
     """
     return data_collector.add_complaint(text, source, category)
 
-def get_collected_data() -> pd.DataFrame:
-    """Toplanan tüm veriyi al"""
-    return data_collector.get_dataframe()
\ No newline at end of file
+def add_complaints_to_dataset(complaints: List[Dict[str, Any]],
+                              default_source: str = "batch") -> List[Optional[Dict[str, Any]]]:
+    """
+    Şikayetleri toplu ekle
+    
+    Args:
+        complaints: Şikayet listesi
+        default_source: source verilmeyen kayıtlar için kaynak
+        
+    Returns:
+        Girdiyle aynı sırada eklenen şikayetler (kısa metinler için None)
+    """
+    return data_collector.add_complaints(complaints, default_source)
+
+def get_collected_data(source: Optional[str] = None, category: Optional[str] = None,
+                       since: Optional[str] = None, until: Optional[str] = None) -> pd.DataFrame:
+    """Toplanan veriyi (opsiyonel filtrelerle) al"""
+    return data_collector.get_dataframe(source, category, since, until)
\ No newline at end of file
@@ -0,0 +1,219 @@
+"""
+Hız sınırlama modülü - Host bazlı token bucket (thread ve asyncio ortak kullanımlı)
+"""
+import asyncio
+import email.utils
+import threading
+import time
+import logging
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+from src.config import SCRAPER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After başlığını saniyeye çevirir
+
+    Args:
+        value: Saniye ("120") veya HTTP tarihi ("Wed, 21 Oct 2015 07:28:00 GMT")
+
+    Returns:
+        Beklenecek saniye (geçmiş tarih için 0) veya okunamazsa None
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def host_key(url_or_host: str) -> str:
+    """URL'den host (URL değilse değerin kendisi; ör. platform adı)"""
+    if '://' in url_or_host:
+        return urlsplit(url_or_host).netloc
+    return url_or_host
+
+
+class TokenBucket:
+    """
+    Token bucket hız sınırlayıcı
+
+    Token'lar saniyede ``rate`` hızla ``capacity``'ye kadar birikir; her
+    istek bir token harcar. Bekleme yalnızca bütçe tükendiğinde olur. Token
+    rezervasyonu kısa bir kilitle yapıldığından aynı bucket thread'ler ve
+    asyncio task'ları arasında paylaşılabilir; bekleme kilit dışında
+    (time.sleep veya asyncio.sleep ile) yapılır ve sırayı korur.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Saniye başına istek
+            capacity: Art arda beklemeden yapılabilecek istek sayısı (burst)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate pozitif olmalı: {rate}")
+        self.rate = float(rate)
+        self.capacity = max(float(capacity), 1.0)
+        self._tokens = self.capacity
+        # Son dolum zamanı; block() sonrası gelecekte olabilir (o ana kadar dolum yok)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Bir token ayırır ve kullanılabilir olana kadar beklenecek süreyi döndürür"""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            # Token borçlanılır (negatif bakiye): sonraki istekler sıraya girer
+            self._tokens -= 1.0
+            deficit = -self._tokens if self._tokens < 0 else 0.0
+            return self._updated + deficit / self.rate - now
+
+    def acquire(self) -> float:
+        """
+        Token alır; gerekiyorsa thread'i bekletir
+
+        Returns:
+            Beklenen saniye
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Token alır; gerekiyorsa task'ı bekletir (event loop bloklanmaz)
+
+        Returns:
+            Beklenen saniye
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def block(self, seconds: float) -> None:
+        """
+        Bucket'ı belirtilen süre durdurur (ör. 429 Retry-After)
+
+        Bu süre içinde yeni token verilmez; mevcut bakiye de sıfırlanır ki
+        süre bitiminde biriken burst ile sunucu yeniden zorlanmasın.
+        """
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, time.monotonic() + seconds)
+
+
+class RateLimiter:
+    """
+    Host bazlı token bucket kayıt defteri
+
+    Her host (veya platform adı) kendi bucket'ını kullanır; farklı host'lar
+    birbirini beklemez. Tek bir örnek thread'ler ve asyncio task'ları
+    arasında paylaşılabilir.
+    """
+
+    def __init__(self, calls_per_minute: float = 30, burst: float = 1,
+                 per_host: Optional[Mapping[str, float]] = None):
+        """
+        Args:
+            calls_per_minute: Host başına varsayılan dakikalık istek sayısı
+            burst: Art arda beklemeden yapılabilecek istek sayısı
+            per_host: Host → dakikalık istek sayısı (varsayılandan farklı olanlar)
+        """
+        self.calls_per_minute = calls_per_minute
+        self.burst = burst
+        self.per_host: Dict[str, float] = dict(per_host or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url_or_host: str = '') -> TokenBucket:
+        """
+        Host'un bucket'ı (ilk kullanımda oluşturulur)
+
+        Args:
+            url_or_host: URL, host veya platform adı ('' = ortak bucket)
+        """
+        host = host_key(url_or_host)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    calls_per_minute = self.per_host.get(host, self.calls_per_minute)
+                    bucket = self._buckets[host] = TokenBucket(calls_per_minute / 60.0, self.burst)
+        return bucket
+
+    def wait(self, url_or_host: str = '') -> float:
+        """
+        İstekten önce çağrılır; host'un bütçesi tükendiyse bekletir
+
+        Returns:
+            Beklenen saniye
+        """
+        return self.bucket(url_or_host).acquire()
+
+    async def wait_async(self, url_or_host: str = '') -> float:
+        """wait'in asyncio sürümü"""
+        return await self.bucket(url_or_host).acquire_async()
+
+    def block(self, url_or_host: str, seconds: float) -> None:
+        """Host'a yapılacak istekleri belirtilen süre durdurur"""
+        logger.warning(f"{host_key(url_or_host) or 'varsayılan'} için istekler {seconds:.1f} sn durduruldu")
+        self.bucket(url_or_host).block(seconds)
+
+    def retry_after(self, url_or_host: str, headers: Mapping[str, str],
+                    default: float = 5.0) -> float:
+        """
+        Yanıttaki Retry-After başlığına göre host'u durdurur
+
+        Args:
+            url_or_host: İsteğin URL'si veya host'u
+            headers: Yanıt başlıkları
+            default: Başlık yoksa / okunamazsa beklenecek saniye
+
+        Returns:
+            Uygulanan bekleme süresi
+        """
+        seconds = parse_retry_after(headers.get('Retry-After'))
+        if seconds is None:
+            seconds = default
+        self.block(url_or_host, seconds)
+        return seconds
+
+
+_default_limiter: Optional[RateLimiter] = None
+_default_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Süreç genelinde paylaşılan limiter (SCRAPER_CONFIG ayarlarıyla)
+
+    Aynı host'a giden tüm scraper'lar aynı bütçeyi kullanır.
+    """
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_lock:
+            if _default_limiter is None:
+                _default_limiter = RateLimiter(
+                    calls_per_minute=SCRAPER_CONFIG["calls_per_minute"],
+                    burst=SCRAPER_CONFIG["burst"]
+                )
+    return _default_limiter
@@ -0,0 +1,101 @@
+"""
+Skorlama modülü - Doğrusal model çıktılarından tek geçişte etiket ve olasılık üretimi
+"""
+import numpy as np
+from typing import Any, Tuple
+from scipy.special import expit, softmax
+
+
+def is_multinomial(model: Any) -> bool:
+    """
+    Modelin olasılıkları softmax ile mi (multinomial) yoksa OvR
+    normalizasyonu ile mi ürettiğini belirler
+
+    Args:
+        model: Eğitilmiş LogisticRegression benzeri model
+
+    Returns:
+        Softmax kullanılıyorsa True
+    """
+    multi_class = getattr(model, 'multi_class', 'auto')
+
+    if multi_class in ('ovr', 'warn'):
+        return False
+    if multi_class == 'multinomial':
+        return True
+
+    # 'auto' / 'deprecated': sklearn ile aynı karar kuralı
+    return len(model.classes_) > 2 and getattr(model, 'solver', 'lbfgs') != 'liblinear'
+
+
+def scores_to_proba(scores: np.ndarray, multinomial: bool) -> np.ndarray:
+    """
+    Karar skorlarını olasılıklara çevirir (sklearn predict_proba ile aynı)
+
+    Args:
+        scores: decision_function çıktısı, (n,) veya (n, k)
+        multinomial: Softmax kullanılsın mı
+
+    Returns:
+        (n, k) olasılık matrisi
+    """
+    scores = np.asarray(scores, dtype=float)
+
+    if multinomial:
+        if scores.ndim == 1:
+            scores = np.c_[-scores, scores]
+        return softmax(scores, axis=1)
+
+    prob = expit(scores)
+    if prob.ndim == 1:
+        return np.vstack([1 - prob, prob]).T
+
+    # OvR normalizasyonu, liblinear'ın predict_probability'si gibi
+    prob /= prob.sum(axis=1).reshape((prob.shape[0], -1))
+    return prob
+
+
+def scores_to_labels(scores: np.ndarray, classes: np.ndarray) -> np.ndarray:
+    """
+    Karar skorlarından etiketleri seçer
+
+    Args:
+        scores: decision_function çıktısı, (n,) veya (n, k)
+        classes: Model sınıfları
+
+    Returns:
+        Tahmin edilen etiketler
+    """
+    classes = np.asarray(classes)
+    scores = np.asarray(scores)
+
+    if scores.ndim == 1:
+        return classes[(scores > 0).astype(int)]
+    return classes[scores.argmax(axis=1)]
+
+
+def predict_with_proba(model: Any, features: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Modeli tek kez çalıştırarak etiketleri ve olasılıkları döndürür
+
+    decision_function bir kez hesaplanır; etiket argmax ile, olasılıklar
+    aynı skor dizisinden türetilir. decision_function sunmayan modellerde
+    (ör. demo modu) predict_proba kullanılır.
+
+    Args:
+        model: Eğitilmiş model
+        features: Özellik matrisi
+
+    Returns:
+        (etiketler, olasılık matrisi)
+    """
+    if not hasattr(model, 'decision_function'):
+        probabilities = np.asarray(model.predict_proba(features))
+        labels = np.asarray(model.classes_)[probabilities.argmax(axis=1)]
+        return labels, probabilities
+
+    scores = model.decision_function(features)
+    probabilities = scores_to_proba(scores, is_multinomial(model))
+    labels = scores_to_labels(scores, model.classes_)
+
+    return labels, probabilities
@@ -0,0 +1,167 @@
+"""
+Async Scraping Engine
+Pooled HTTP client with bounded per-host concurrency and a central per-host rate limiter
+"""
+
+import asyncio
+import random
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlsplit
+import httpx
+from .base import BaseScraper, ScrapedComplaint
+from .. import rate_limiter
+from ..config import SCRAPER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class AsyncScrapeEngine:
+    """
+    Shared async HTTP engine for all scrapers
+
+    One pooled httpx.AsyncClient is used for every host. Requests to the same
+    host are limited to ``max_per_host`` in flight and draw from that host's
+    token bucket in the shared RateLimiter; different hosts proceed
+    independently, so many hosts are fetched in parallel within each host's
+    budget. Politeness waits happen only here, around actual HTTP requests,
+    and only when a host's budget is exhausted.
+    """
+
+    def __init__(self, max_connections: int = None, max_per_host: int = None,
+                 limiter: rate_limiter.RateLimiter = None, timeout: float = None,
+                 max_retries: int = None, transport: httpx.AsyncBaseTransport = None):
+        self.max_connections = max_connections or SCRAPER_CONFIG["max_connections"]
+        self.max_per_host = max_per_host or SCRAPER_CONFIG["max_per_host"]
+        self.limiter = limiter or rate_limiter.get_rate_limiter()
+        self.timeout = timeout or SCRAPER_CONFIG["timeout_seconds"]
+        self.max_retries = SCRAPER_CONFIG["max_retries"] if max_retries is None else max_retries
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+
+    async def __aenter__(self) -> "AsyncScrapeEngine":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazily created pooled client"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                timeout=self.timeout,
+                follow_redirects=True,
+                transport=self._transport
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _slots(self, url: str) -> asyncio.Semaphore:
+        """Per-host in-flight request limit"""
+        host = urlsplit(url).netloc
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+        return slots
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return min(2 ** attempt + random.uniform(0, 1), 30.0)
+
+    async def fetch(self, url: str, params: Dict = None, headers: Dict = None,
+                    method: str = "GET") -> Optional[httpx.Response]:
+        """
+        Fetch a URL within its host's budget
+
+        Retries on 429/5xx (honoring Retry-After) and transport errors.
+
+        Returns:
+            Successful response, or None after max_retries
+        """
+        slots = self._slots(url)
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self.stats['retries'] += 1
+
+            async with slots:
+                await self.limiter.wait_async(url)
+                self.stats['requests'] += 1
+                try:
+                    response = await self.client.request(method, url, params=params, headers=headers)
+                except httpx.TransportError as e:
+                    logger.warning(f"Request failed ({url}, attempt {attempt + 1}): {e}")
+                    # The whole host backs off, not just this request
+                    self.limiter.block(url, self._backoff(attempt))
+                else:
+                    if response.is_success:
+                        return response
+                    if response.status_code not in RETRY_STATUSES:
+                        logger.warning(f"Request to {url} returned {response.status_code}")
+                        break
+                    logger.warning(f"{url} returned {response.status_code}")
+                    self.limiter.retry_after(url, response.headers, default=self._backoff(attempt))
+        else:
+            logger.error(f"Max attempts ({self.max_retries + 1}) reached for {url}")
+
+        self.stats['failures'] += 1
+        return None
+
+    async def fetch_all(self, urls: Iterable[str], headers: Dict = None) -> List[Optional[httpx.Response]]:
+        """Fetch URLs concurrently (each within its host's budget), in input order"""
+        return await asyncio.gather(*(self.fetch(url, headers=headers) for url in urls))
+
+
+async def scrape_all(jobs: Iterable[Tuple[BaseScraper, Dict]],
+                     engine: AsyncScrapeEngine = None) -> Dict[str, List[ScrapedComplaint]]:
+    """
+    Run several scrapers concurrently on one engine
+
+    Args:
+        jobs: (scraper, ascrape keyword arguments) pairs
+        engine: Shared engine (created and closed here if not given)
+
+    Returns:
+        Platform name -> scraped complaints
+    """
+    jobs = list(jobs)
+    owns_engine = engine is None
+    engine = engine or AsyncScrapeEngine()
+
+    try:
+        results = await asyncio.gather(
+            *(scraper.ascrape(engine, **kwargs) for scraper, kwargs in jobs),
+            return_exceptions=True
+        )
+    finally:
+        if owns_engine:
+            await engine.aclose()
+
+    scraped: Dict[str, List[ScrapedComplaint]] = {}
+    for (scraper, _), result in zip(jobs, results):
+        if isinstance(result, Exception):
+            logger.error(f"{scraper.platform_name} async scraping failed: {result}")
+            result = []
+        scraped.setdefault(scraper.platform_name, []).extend(result)
+    return scraped
+
+
+def run_scrape_all(jobs: Iterable[Tuple[BaseScraper, Dict]], **engine_options) -> Dict[str, List[ScrapedComplaint]]:
+    """Blocking wrapper around scrape_all for synchronous callers"""
+    async def run():
+        async with AsyncScrapeEngine(**engine_options) as engine:
+            return await scrape_all(jobs, engine)
+
+    return asyncio.run(run())
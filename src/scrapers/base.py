@@ -3,10 +3,13 @@ Base Scraper Interface
 Scraping framework for customer complaints from various platforms
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 import logging
 from dataclasses import dataclass
+import requests
+from .utils import ScraperUtils
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +46,27 @@ class BaseScraper(ABC):
         """Scrape complaints based on query"""
         pass
 
+    async def ascrape(self, engine, query: str = None, max_results: int = 100) -> List[ScrapedComplaint]:
+        """
+        Scrape complaints through a shared AsyncScrapeEngine
+
+        Scrapers that fetch over HTTP override this to issue their requests
+        through the engine; the default runs the blocking scrape() in a thread.
+        """
+        return await asyncio.to_thread(self.scrape, query, max_results)
+
+    def fetch(self, url: str, **kwargs) -> Optional[requests.Response]:
+        """
+        GET a URL with the scraper's session through the shared rate limiter
+
+        This is the only place blocking scrapers wait: politeness delays are
+        applied per host around actual HTTP requests, never while parsing.
+
+        Returns:
+            Successful response, or None after retries
+        """
+        return ScraperUtils.rate_limited_request(self.session, 'GET', url, **kwargs)
+
     @abstractmethod
     def get_complaint_details(self, complaint_id: str) -> Optional[ScrapedComplaint]:
         """Get detailed information for a specific complaint"""
@@ -65,9 +65,6 @@ class GoogleMapsScraper(BaseScraper):
                     if review and self.validate_complaint(review):
                         reviews.append(review)
 
-                    # Rate limiting
-                    time.sleep(random.uniform(0.5, 1.5))
-
                 except Exception as e:
                     logger.error(f"Error parsing review: {e}")
                     continue
@@ -79,6 +76,52 @@ class GoogleMapsScraper(BaseScraper):
             logger.error(f"Google Maps scraping failed: {e}")
             return []
 
+    async def ascrape(self, engine, query: str = None, max_results: int = 100,
+                      place_id: str = None) -> List[ScrapedComplaint]:
+        """Scrape reviews from Google Maps through the async engine"""
+        if not place_id and not query:
+            logger.error("Either place_id or query must be provided")
+            return []
+
+        place_details = await self._aget_place_details(engine, place_id, query)
+        if not place_details:
+            return []
+
+        place_name = place_details.get('name', 'Unknown')
+        reviews_data = self._scrape_reviews(place_details.get('place_id'), max_results)
+
+        reviews = []
+        for review_data in reviews_data:
+            review = self._parse_review(review_data, place_name)
+            if review and self.validate_complaint(review):
+                reviews.append(review)
+
+        logger.info(f"Scraped {len(reviews)} reviews from Google Maps")
+        return reviews
+
+    async def _aget_place_details(self, engine, place_id: str = None, query: str = None) -> Optional[dict]:
+        """Get place details from Google Maps through the async engine"""
+        if place_id:
+            url = self.api_url
+            params = {'place_id': place_id, 'key': 'YOUR_API_KEY', 'language': 'tr'}
+        else:
+            url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+            params = {'query': query, 'key': 'YOUR_API_KEY', 'language': 'tr'}
+
+        response = await engine.fetch(url, params=params, headers=self.headers)
+        if response is None:
+            return None
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.error(f"Error getting place details: {e}")
+            return None
+
+        if place_id:
+            return data.get('result', {})
+        return data['results'][0] if data.get('results') else None
+
     def _get_place_details(self, place_id: str = None, query: str = None) -> Optional[dict]:
         """Get place details from Google Maps"""
         try:
@@ -97,8 +140,9 @@ class GoogleMapsScraper(BaseScraper):
                     'key': 'YOUR_API_KEY',
                     'language': 'tr'
                 }
-                response = self.session.get(search_url, params=params)
-                response.raise_for_status()
+                response = self.fetch(search_url, params=params)
+                if response is None:
+                    return None
                 data = response.json()
 
                 if data.get('results'):
@@ -106,8 +150,9 @@ class GoogleMapsScraper(BaseScraper):
                 else:
                     return None
 
-            response = self.session.get(self.api_url, params=params)
-            response.raise_for_status()
+            response = self.fetch(self.api_url, params=params)
+            if response is None:
+                return None
             data = response.json()
 
             return data.get('result', {})
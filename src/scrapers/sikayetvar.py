@@ -3,11 +3,10 @@
 Scrapes customer complaints from Şikayetvar platform
 """
 
+import asyncio
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Optional
-import time
-import random
 from datetime import datetime
 from .base import BaseScraper, ScrapedComplaint
 from ..config import BUSINESS_RULES
@@ -40,31 +39,14 @@ class SikayetvarScraper(BaseScraper):
 
     def scrape(self, query: str = None, max_results: int = 100) -> List[ScrapedComplaint]:
         """Scrape complaints from Şikayetvar"""
-        complaints = []
-
         try:
             # Build search URL
             params = {'q': query} if query else {}
-            response = self.session.get(self.search_url, params=params)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Find complaint items
-            complaint_items = soup.find_all('div', class_='complaint-item', limit=max_results)
-
-            for item in complaint_items:
-                try:
-                    complaint = self._parse_complaint_item(item)
-                    if complaint and self.validate_complaint(complaint):
-                        complaints.append(complaint)
-
-                    # Rate limiting
-                    time.sleep(random.uniform(0.5, 1.5))
+            response = self.fetch(self.search_url, params=params)
+            if response is None:
+                return []
 
-                except Exception as e:
-                    logger.error(f"Error parsing complaint item: {e}")
-                    continue
+            complaints = self._parse_search_page(response.text, max_results)
 
             logger.info(f"Scraped {len(complaints)} complaints from Şikayetvar")
             return complaints
@@ -73,6 +55,30 @@ class SikayetvarScraper(BaseScraper):
             logger.error(f"Şikayetvar scraping failed: {e}")
             return []
 
+    async def ascrape(self, engine, query: str = None, max_results: int = 100) -> List[ScrapedComplaint]:
+        """Scrape complaints from Şikayetvar through the async engine"""
+        params = {'q': query} if query else {}
+        response = await engine.fetch(self.search_url, params=params, headers=self.headers)
+        if response is None:
+            return []
+
+        # Parse off the event loop so other hosts' requests keep flowing
+        complaints = await asyncio.to_thread(self._parse_search_page, response.text, max_results)
+        logger.info(f"Scraped {len(complaints)} complaints from Şikayetvar")
+        return complaints
+
+    def _parse_search_page(self, html: str, max_results: int) -> List[ScrapedComplaint]:
+        """Parse all complaint items on a downloaded search page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        complaints = []
+
+        for item in soup.find_all('div', class_='complaint-item', limit=max_results):
+            complaint = self._parse_complaint_item(item)
+            if complaint and self.validate_complaint(complaint):
+                complaints.append(complaint)
+
+        return complaints
+
     def _parse_complaint_item(self, item) -> Optional[ScrapedComplaint]:
         """Parse individual complaint item"""
         try:
@@ -158,8 +164,9 @@ class SikayetvarScraper(BaseScraper):
         """Get detailed complaint information"""
         try:
             url = f"{self.base_url}/{complaint_id}"
-            response = self.session.get(url)
-            response.raise_for_status()
+            response = self.fetch(url)
+            if response is None:
+                return None
 
             soup = BeautifulSoup(response.text, 'html.parser')
 
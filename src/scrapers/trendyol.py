@@ -3,10 +3,10 @@ Trendyol Scraper Implementation
 Scrapes customer reviews and complaints from Trendyol platform
 """
 
+import asyncio
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Optional
-import time
 import random
 from datetime import datetime
 from .base import BaseScraper, ScrapedComplaint
@@ -48,35 +48,13 @@ class TrendyolScraper(BaseScraper):
         try:
             # Search for products
             search_params = {'q': query} if query else {'q': 'şikayet'}
-            response = self.session.get(self.search_url, params=search_params)
-            response.raise_for_status()
+            response = self.fetch(self.search_url, params=search_params)
+            if response is None:
+                return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Find product items
-            product_items = soup.find_all('div', class_='p-card-wrppr', limit=10)  # Limit to 10 products
-
-            for product_item in product_items:
-                try:
-                    # Get product URL
-                    product_url_elem = product_item.find('a', class_='p-card-chld')
-                    if not product_url_elem:
-                        continue
-
-                    product_url = product_url_elem['href']
-                    if not product_url.startswith('http'):
-                        product_url = f"{self.base_url}{product_url}"
-
-                    # Get product reviews
-                    product_complaints = self._scrape_product_reviews(product_url, max_results // len(product_items))
-                    complaints.extend(product_complaints)
-
-                    # Rate limiting between products
-                    time.sleep(random.uniform(1.0, 2.0))
-
-                except Exception as e:
-                    logger.error(f"Error processing product: {e}")
-                    continue
+            product_urls = self._parse_product_urls(response.text)
+            for product_url in product_urls:
+                complaints.extend(self._scrape_product_reviews(product_url, max_results // len(product_urls)))
 
             logger.info(f"Scraped {len(complaints)} complaints from Trendyol")
             return complaints
@@ -85,41 +63,71 @@ class TrendyolScraper(BaseScraper):
             logger.error(f"Trendyol scraping failed: {e}")
             return []
 
-    def _scrape_product_reviews(self, product_url: str, max_reviews: int = 10) -> List[ScrapedComplaint]:
-        """Scrape reviews for a specific product"""
-        complaints = []
-
-        try:
-            # Get product page
-            response = self.session.get(product_url)
-            response.raise_for_status()
+    async def ascrape(self, engine, query: str = None, max_results: int = 100) -> List[ScrapedComplaint]:
+        """Scrape reviews from Trendyol through the async engine (product pages fetched concurrently)"""
+        search_params = {'q': query} if query else {'q': 'şikayet'}
+        response = await engine.fetch(self.search_url, params=search_params, headers=self.headers)
+        if response is None:
+            return []
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+        product_urls = self._parse_product_urls(response.text)
+        if not product_urls:
+            return []
 
-            # Find review section
-            review_section = soup.find('div', class_='reviews')
-            if not review_section:
-                return complaints
+        max_reviews = max_results // len(product_urls)
+        pages = await engine.fetch_all(product_urls, headers=self.headers)
 
-            # Find review items
-            review_items = review_section.find_all('div', class_='review-item', limit=max_reviews)
+        complaints = []
+        for product_url, page in zip(product_urls, pages):
+            if page is None:
+                continue
+            # Parse off the event loop so other requests keep flowing
+            complaints.extend(await asyncio.to_thread(self._parse_reviews_page, page.text, product_url, max_reviews))
+
+        logger.info(f"Scraped {len(complaints)} complaints from Trendyol")
+        return complaints
+
+    def _parse_product_urls(self, html: str) -> List[str]:
+        """Product page URLs from a downloaded search page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        product_urls = []
+
+        for product_item in soup.find_all('div', class_='p-card-wrppr', limit=10):
+            product_url_elem = product_item.find('a', class_='p-card-chld')
+            if not product_url_elem or not product_url_elem.get('href'):
+                continue
+
+            product_url = product_url_elem['href']
+            if not product_url.startswith('http'):
+                product_url = f"{self.base_url}{product_url}"
+            product_urls.append(product_url)
+
+        return product_urls
+
+    def _parse_reviews_page(self, html: str, product_url: str, max_reviews: int) -> List[ScrapedComplaint]:
+        """Negative (1-2 star) reviews from a downloaded product page"""
+        soup = BeautifulSoup(html, 'html.parser')
+        review_section = soup.find('div', class_='reviews')
+        if not review_section:
+            return []
 
-            for review_item in review_items:
-                try:
-                    complaint = self._parse_review_item(review_item, product_url)
-                    if complaint and self.validate_complaint(complaint):
-                        # Only add negative reviews (1-2 stars)
-                        if complaint.rating and complaint.rating <= 2:
-                            complaints.append(complaint)
+        complaints = []
+        for review_item in review_section.find_all('div', class_='review-item', limit=max_reviews):
+            complaint = self._parse_review_item(review_item, product_url)
+            if complaint and self.validate_complaint(complaint) and complaint.rating and complaint.rating <= 2:
+                complaints.append(complaint)
 
-                    # Rate limiting between reviews
-                    time.sleep(random.uniform(0.3, 0.8))
+        return complaints
 
-                except Exception as e:
-                    logger.error(f"Error parsing review: {e}")
-                    continue
+    def _scrape_product_reviews(self, product_url: str, max_reviews: int = 10) -> List[ScrapedComplaint]:
+        """Scrape reviews for a specific product"""
+        try:
+            # Get product page
+            response = self.fetch(product_url)
+            if response is None:
+                return []
 
-            return complaints
+            return self._parse_reviews_page(response.text, product_url, max_reviews)
 
         except Exception as e:
             logger.error(f"Error scraping product reviews: {e}")
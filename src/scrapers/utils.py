@@ -10,6 +10,8 @@ import logging
 from typing import List, Dict, Optional, Callable
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from .. import rate_limiter
+from .. import text as text_utils
 
 logger = logging.getLogger(__name__)
 
@@ -63,20 +65,22 @@ class ScraperUtils:
         session: requests.Session,
         method: str,
         url: str,
-        min_delay: float = 1.0,
-        max_delay: float = 3.0,
+        limiter: rate_limiter.RateLimiter = None,
+        max_attempts: int = 3,
         **kwargs
     ) -> Optional[requests.Response]:
-        """Make rate-limited request"""
-        attempt = 0
-        max_attempts = 3
+        """
+        Make a request within the host's rate limit
 
-        while attempt < max_attempts:
-            try:
-                # Random delay to avoid detection
-                delay = random.uniform(min_delay, max_delay)
-                time.sleep(delay)
+        Waits only when the host's token bucket is exhausted (shared limiter
+        by default). 429/503 responses block the host for Retry-After; failed
+        requests back the host off exponentially.
+        """
+        limiter = limiter or rate_limiter.get_rate_limiter()
 
+        for attempt in range(1, max_attempts + 1):
+            limiter.wait(url)
+            try:
                 # Rotate user agent
                 kwargs.setdefault('headers', {})
                 kwargs['headers']['User-Agent'] = ScraperUtils.get_random_user_agent()
@@ -84,21 +88,18 @@ class ScraperUtils:
                 response = session.request(method, url, **kwargs)
 
                 # Check for rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 5))
-                    logger.warning(f"Rate limited. Retrying after {retry_after} seconds...")
-                    time.sleep(retry_after)
-                    attempt += 1
+                if response.status_code in (429, 503):
+                    retry_after = limiter.retry_after(url, response.headers)
+                    logger.warning(f"Rate limited ({response.status_code}). Retrying after {retry_after:.1f} seconds...")
                     continue
 
                 response.raise_for_status()
                 return response
 
             except requests.exceptions.RequestException as e:
-                attempt += 1
                 delay = ScraperUtils.exponential_backoff(attempt)
                 logger.warning(f"Request failed (attempt {attempt}/{max_attempts}): {e}. Retrying in {delay:.1f}s...")
-                time.sleep(delay)
+                limiter.block(url, delay)
 
         logger.error(f"Max attempts ({max_attempts}) reached for {url}")
         return None
@@ -160,16 +161,7 @@ class ScraperUtils:
     @staticmethod
     def clean_text(text: str) -> str:
         """Clean and normalize text"""
-        if not text:
-            return ""
-
-        # Remove excessive whitespace
-        text = ' '.join(text.split())
-
-        # Remove special characters (keep basic punctuation)
-        text = re.sub(r'[^\w\s.,!?ğüşıöçĞÜŞIİÖÇ]', '', text)
-
-        return text.strip()
+        return text_utils.clean_text(text)
 
     @staticmethod
     def extract_keywords(text: str, min_length: int = 3) -> List[str]:
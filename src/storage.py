@@ -0,0 +1,321 @@
+"""
+Depolama modülü - Toplanan şikayetler için kalıcı SQLite (WAL) deposu
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+COMPLAINT_COLUMNS = ('id', 'text', 'category', 'confidence', 'source', 'date')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS complaints (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text_hash TEXT NOT NULL,
+    text TEXT NOT NULL,
+    category TEXT,
+    confidence REAL,
+    source TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_complaints_text_hash ON complaints(text_hash);
+CREATE INDEX IF NOT EXISTS idx_complaints_source ON complaints(source, id);
+CREATE INDEX IF NOT EXISTS idx_complaints_category ON complaints(category, id);
+CREATE INDEX IF NOT EXISTS idx_complaints_date ON complaints(date);
+
+-- Kategori dağılımı her istekte tabloyu taramamak için trigger'larla tutulur
+CREATE TABLE IF NOT EXISTS complaint_category_counts (
+    category TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS trg_complaints_count_insert
+AFTER INSERT ON complaints WHEN NEW.category IS NOT NULL
+BEGIN
+    INSERT INTO complaint_category_counts (category, count) VALUES (NEW.category, 1)
+    ON CONFLICT(category) DO UPDATE SET count = count + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_complaints_count_delete
+AFTER DELETE ON complaints WHEN OLD.category IS NOT NULL
+BEGIN
+    UPDATE complaint_category_counts SET count = count - 1 WHERE category = OLD.category;
+END;
+"""
+
+# Sayaç tablosu sonradan eklenen veritabanları için tek seferlik doldurma
+_BACKFILL_CATEGORY_COUNTS = """
+INSERT INTO complaint_category_counts (category, count)
+SELECT category, COUNT(*) FROM complaints
+WHERE category IS NOT NULL AND NOT EXISTS (SELECT 1 FROM complaint_category_counts)
+GROUP BY category
+"""
+
+
+def sqlite_path_from_url(url: str) -> str:
+    """
+    DATABASE_URL değerinden SQLite dosya yolunu çıkarır
+
+    Args:
+        url: sqlite:///./complaints.db biçiminde URL
+
+    Returns:
+        Dosya yolu (veya ':memory:')
+
+    Raises:
+        ValueError: URL SQLite değilse
+    """
+    prefix = 'sqlite:///'
+    if not url.startswith(prefix):
+        raise ValueError(f"Sadece SQLite destekleniyor: {url}")
+    return url[len(prefix):] or ':memory:'
+
+
+def text_hash(text: str) -> str:
+    """Tekilleştirme anahtarı"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ComplaintStore:
+    """
+    Ekleme odaklı, kalıcı şikayet deposu
+
+    Metin hash'i üzerindeki tekil index sayesinde aynı metin ekleme anında
+    (INSERT OR IGNORE) elenir; ilk kayıt korunur. WAL modu okuyucuların
+    yazarları beklememesini sağlar. Her thread kendi bağlantısını kullanır.
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Args:
+            db_path: SQLite dosyası (':memory:' yalnızca tek thread için)
+        """
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connection(self) -> sqlite3.Connection:
+        """Thread'e özel bağlantı (ilk çağrıda şema oluşturulur)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+
+        if self.db_path != ':memory:':
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        connection.row_factory = sqlite3.Row
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+
+        with self._schema_lock:
+            if not self._schema_ready or self.db_path == ':memory:':
+                connection.executescript(_SCHEMA)
+                connection.execute(_BACKFILL_CATEGORY_COUNTS)
+                self._schema_ready = True
+
+        self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _row(complaint: Dict[str, Any]) -> Tuple:
+        return (
+            text_hash(complaint['text']),
+            complaint['text'],
+            complaint.get('category'),
+            complaint.get('confidence'),
+            complaint.get('source', 'manual'),
+            complaint.get('date') or pd.Timestamp.now().isoformat()
+        )
+
+    def add(self, complaint: Dict[str, Any]) -> bool:
+        """
+        Tek şikayet ekler
+
+        Args:
+            complaint: text, category, confidence, source, date alanları
+
+        Returns:
+            Eklendiyse True, aynı metin zaten varsa False
+        """
+        return self.add_many([complaint]) == 1
+
+    def add_many(self, complaints: Iterable[Dict[str, Any]]) -> int:
+        """
+        Şikayetleri tek transaction'da ekler
+
+        Args:
+            complaints: Şikayet kayıtları
+
+        Returns:
+            Eklenen (tekrar olmayan) kayıt sayısı
+        """
+        rows = [self._row(complaint) for complaint in complaints]
+        if not rows:
+            return 0
+
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            # rowcount sadece complaints'e eklenen satırları sayar; sayaç
+            # trigger'ının yazdıkları (total_changes'e dahil) sayılmaz
+            inserted = connection.executemany(
+                'INSERT OR IGNORE INTO complaints (text_hash, text, category, confidence, source, date) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            ).rowcount
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+
+        return inserted
+
+    @staticmethod
+    def _where(source: Optional[str] = None, category: Optional[str] = None,
+               since: Optional[str] = None, until: Optional[str] = None,
+               after_id: Optional[int] = None) -> Tuple[str, List[Any]]:
+        """Filtrelerden WHERE cümlesi üretir"""
+        clauses, params = [], []
+        if source is not None:
+            clauses.append('source = ?')
+            params.append(source)
+        if category is not None:
+            clauses.append('category = ?')
+            params.append(category)
+        if since is not None:
+            clauses.append('date >= ?')
+            params.append(since)
+        if until is not None:
+            clauses.append('date < ?')
+            params.append(until)
+        if after_id is not None:
+            clauses.append('id > ?')
+            params.append(after_id)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ''
+        return where, params
+
+    @staticmethod
+    def _select_list(columns: Sequence[str]) -> str:
+        """Alan listesini doğrular (SQL'e yalnızca bilinen kolon adları girer)"""
+        unknown = set(columns) - set(COMPLAINT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Bilinmeyen alanlar: {sorted(unknown)}")
+        return ', '.join(columns)
+
+    def iter_complaints(self, source: Optional[str] = None, category: Optional[str] = None,
+                        since: Optional[str] = None, until: Optional[str] = None,
+                        after_id: Optional[int] = None, limit: Optional[int] = None,
+                        columns: Sequence[str] = COMPLAINT_COLUMNS) -> Iterator[Dict[str, Any]]:
+        """
+        Filtrelenmiş şikayetleri id sırasıyla, belleğe toplamadan döndürür
+
+        Args:
+            source: Veri kaynağı
+            category: Kategori
+            since: Bu tarihten (ISO, dahil) itibaren
+            until: Bu tarihe (ISO, hariç) kadar
+            after_id: Bu id'den sonraki kayıtlar (cursor)
+            limit: Maksimum kayıt sayısı
+            columns: Döndürülecek alanlar
+
+        Yields:
+            Şikayet kayıtları
+        """
+        where, params = self._where(source, category, since, until, after_id)
+        sql = f"SELECT {self._select_list(columns)} FROM complaints{where} ORDER BY id"
+        if limit is not None:
+            sql += ' LIMIT ?'
+            params.append(limit)
+
+        for row in self._connection().execute(sql, params):
+            yield dict(row)
+
+    def iter_pages(self, page_size: int = 1000, **filters) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Filtrelenmiş şikayetleri id cursor'ı ile sayfa sayfa döndürür
+
+        Her sayfa ayrı bir sorguyla okunur; açık cursor tutulmadığı için
+        sayfalar farklı thread'lerde istenebilir (ör. StreamingResponse).
+
+        Args:
+            page_size: Sayfa başına kayıt sayısı
+            **filters: iter_complaints filtreleri (source, category, since, until, after_id, columns)
+
+        Yields:
+            Boş olmayan kayıt listeleri
+        """
+        columns = filters.pop('columns', COMPLAINT_COLUMNS)
+        after_id = filters.pop('after_id', None)
+        cursor_added = 'id' not in columns
+        query_columns = ('id',) + tuple(columns) if cursor_added else tuple(columns)
+
+        while True:
+            page = self.query(after_id=after_id, limit=page_size, columns=query_columns, **filters)
+            if not page:
+                return
+            after_id = page[-1]['id']
+            if cursor_added:
+                for row in page:
+                    del row['id']
+            yield page
+            if len(page) < page_size:
+                return
+
+    def query(self, **filters) -> List[Dict[str, Any]]:
+        """iter_complaints sonuçlarını liste olarak döndürür"""
+        return list(self.iter_complaints(**filters))
+
+    def count(self, source: Optional[str] = None, category: Optional[str] = None,
+              since: Optional[str] = None, until: Optional[str] = None) -> int:
+        """
+        Filtreye uyan kayıt sayısı
+
+        Returns:
+            Kayıt sayısı
+        """
+        where, params = self._where(source, category, since, until)
+        return self._connection().execute(f'SELECT COUNT(*) FROM complaints{where}', params).fetchone()[0]
+
+    def category_counts(self, source: Optional[str] = None, category: Optional[str] = None,
+                        since: Optional[str] = None, until: Optional[str] = None) -> Dict[str, int]:
+        """
+        Kategori dağılımı
+
+        Filtre yoksa trigger'larla güncel tutulan sayaç tablosundan okunur;
+        filtre varsa sadece filtreye uyan kayıtlar gruplanır.
+
+        Returns:
+            Kategori → kayıt sayısı
+        """
+        if source is None and category is None and since is None and until is None:
+            rows = self._connection().execute(
+                'SELECT category, count FROM complaint_category_counts WHERE count > 0 ORDER BY count DESC'
+            )
+        else:
+            where, params = self._where(source, category, since, until)
+            rows = self._connection().execute(
+                f'SELECT category, COUNT(*) AS count FROM complaints{where} '
+                'GROUP BY category HAVING category IS NOT NULL ORDER BY count DESC', params
+            )
+        return {category: count for category, count in rows}
+
+    def to_dataframe(self, source: Optional[str] = None, category: Optional[str] = None,
+                     since: Optional[str] = None, until: Optional[str] = None,
+                     columns: Sequence[str] = COMPLAINT_COLUMNS) -> pd.DataFrame:
+        """
+        Filtrelenmiş şikayetleri DataFrame olarak okur
+
+        Returns:
+            Şikayetler (kayıt yoksa boş DataFrame)
+        """
+        where, params = self._where(source, category, since, until)
+        return pd.read_sql_query(
+            f"SELECT {self._select_list(columns)} FROM complaints{where} ORDER BY id",
+            self._connection(), params=params
+        )
@@ -0,0 +1,123 @@
+"""
+Metin normalizasyon modülü - Eğitim, inference ve veri toplama için ortak temizleme
+"""
+import re
+import pandas as pd
+from typing import List, Union
+
+# Önceden derlenmiş desenler
+_NON_LETTER_PATTERN = re.compile(r'[^a-zğüşıöçĞÜŞIİÖÇ\s]')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s.,!?ğüşıöçĞÜŞIİÖÇ]')
+
+TextCollection = Union[List[str], pd.Series]
+
+
+def turkish_lower(text: str) -> str:
+    """
+    Türkçe kurallarına göre küçük harfe çevirir (İ→i, I→ı)
+
+    str.lower() 'İ' harfini 'i̇' (i + birleşik nokta), 'I' harfini 'i' yapar.
+    Türkçe metinlerde dict tabanlı str.translate her karakter için tablo
+    araması yaptığından, iki harf yalnızca varsa str.replace ile çevrilir.
+
+    Args:
+        text: Dönüştürülecek metin
+
+    Returns:
+        Küçük harfli metin
+    """
+    if 'I' in text or 'İ' in text:
+        text = text.replace('İ', 'i').replace('I', 'ı')
+    return text.lower()
+
+
+def normalize_text(text: str) -> str:
+    """
+    Model girdisi için metin ön işleme
+
+    Türkçe küçük harfe çevirir, harf dışı karakterleri boşlukla değiştirir
+    ve boşlukları tekilleştirir.
+
+    Args:
+        text: İşlenecek metin
+
+    Returns:
+        Temizlenmiş metin
+    """
+    if not isinstance(text, str):
+        if text is None or pd.isna(text):
+            return ""
+        text = str(text)
+
+    if not text:
+        return ""
+
+    text = _NON_LETTER_PATTERN.sub(' ', turkish_lower(text))
+
+    # split/join, \s+ ile re.sub + strip ile aynı sonucu daha hızlı verir
+    return ' '.join(text.split())
+
+
+def clean_text(text: str, min_length: int = 0) -> str:
+    """
+    Toplanan ham şikayet metnini temizler
+
+    Boşlukları tekilleştirir, temel noktalama dışındaki özel karakterleri
+    siler. ``min_length`` karakterden kısa sonuçlar boş metin olarak döner.
+
+    Args:
+        text: Ham metin
+        min_length: Kabul edilen minimum uzunluk
+
+    Returns:
+        Temizlenmiş metin
+    """
+    if not text:
+        return ""
+
+    # Sondaki strip nedeniyle ' '.join(split()) ile \s+ → ' ' aynı sonucu verir
+    text = ' '.join(text.split())
+    text = _SPECIAL_CHAR_PATTERN.sub('', text)
+    text = text.strip()
+
+    if len(text) < min_length:
+        return ""
+
+    return text
+
+
+def normalize_texts(texts: TextCollection) -> TextCollection:
+    """
+    normalize_text'in toplu versiyonu
+
+    Args:
+        texts: Metin listesi veya pandas Series
+
+    Returns:
+        Girdi ile aynı tipte temizlenmiş metinler (Series için index korunur)
+    """
+    if isinstance(texts, pd.Series):
+        return pd.Series(
+            [normalize_text(text) for text in texts],
+            index=texts.index, name=texts.name, dtype=object
+        )
+    return [normalize_text(text) for text in texts]
+
+
+def clean_texts(texts: TextCollection, min_length: int = 0) -> TextCollection:
+    """
+    clean_text'in toplu versiyonu
+
+    Args:
+        texts: Metin listesi veya pandas Series
+        min_length: Kabul edilen minimum uzunluk
+
+    Returns:
+        Girdi ile aynı tipte temizlenmiş metinler (Series için index korunur)
+    """
+    if isinstance(texts, pd.Series):
+        return pd.Series(
+            [clean_text(text, min_length) for text in texts],
+            index=texts.index, name=texts.name, dtype=object
+        )
+    return [clean_text(text, min_length) for text in texts]
@@ -0,0 +1,345 @@
+"""
+Eğitim işleri modülü - Model eğitimini API sürecinden ayrı bir süreçte çalıştırır
+"""
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import uuid
+import pandas as pd
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from src.locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+# Fork, API'nin thread'leri (inference havuzu, izleyiciler) tutulu kilitlerle
+# kopyalanabileceği için kullanılmaz
+_mp_context = multiprocessing.get_context('spawn')
+
+
+# Sonlanmış iş durumları
+FINISHED_STATUSES = ('completed', 'failed', 'cancelled')
+
+
+class TrainingInProgressError(Exception):
+    """Devam eden bir eğitim varken yeni eğitim istendiğinde fırlatılır (HTTP 409)"""
+
+
+def _run_training(db_path: str, complaints: List[Dict[str, Any]], filters: Dict[str, Any],
+                  save: bool, messages) -> None:
+    """
+    Alt süreçte çalışan eğitim fonksiyonu
+
+    Eğitim verisi API sürecinde okunup pickle'lanmaz; alt süreç istekle
+    gelen şikayetleri depoya ekler ve eğitim verisini depodan kendisi okur.
+
+    Args:
+        db_path: Şikayet deposu (SQLite dosyası)
+        complaints: Eğitimden önce depoya eklenecek şikayetler
+        filters: Depo filtreleri (source, category, since, until)
+        save: Model kaydedilsin (ve yayınlansın) mı
+        messages: Ana sürece ilerleme ve sonuç gönderilen kuyruk
+    """
+    logging.basicConfig(level=logging.INFO)
+    from src.pipeline import TurkeyDataCollector, train_on_collected
+    from src.storage import ComplaintStore
+
+    def report(stage: str, progress: float):
+        messages.put({'type': 'progress', 'stage': stage, 'progress': progress})
+
+    try:
+        collector = TurkeyDataCollector(ComplaintStore(db_path))
+        if complaints:
+            collector.add_complaints(complaints)
+        df = collector.get_dataframe(**filters)
+        messages.put({'type': 'loaded', 'total_complaints': len(df)})
+
+        results = train_on_collected(df, save, progress_callback=report)
+        messages.put({'type': 'result', 'results': results})
+    except Exception as e:
+        messages.put({'type': 'error', 'error': str(e)})
+
+
+def _json_default(value: Any) -> Any:
+    """Eğitim sonuçlarındaki numpy değerlerini ve yolları JSON'a çevirir"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class TrainingJobManager:
+    """
+    Ayrı süreçte çalışan model eğitim işlerinin yöneticisi
+
+    Eğitim (train_test_split, liblinear fit, cross-validation) 'spawn' ile
+    başlatılan bir alt süreçte çalışır; API süreci ve event loop tahmin
+    sunmaya devam eder. İlerleme bir multiprocessing kuyruğuyla izlenir,
+    iptal alt süreci sonlandırır. Model, tüm dosyalar yazıldıktan sonra
+    yayınlandığından yarıda kesilen bir eğitim aktif sürümü bozmaz.
+
+    İş durumları ``jobs_dir/<job_id>.json`` dosyalarında tutulur ve tüm API
+    worker'ları tarafından okunabilir. Aynı anda tek eğitim çalışır: eğitimi
+    başlatan worker, iş bitene kadar ``jobs_dir/training.lock`` kilidini
+    tutar. İptal isteği hangi worker'a gelirse gelsin ``<job_id>.cancel``
+    işaret dosyası yazılır; süreci izleyen worker bunu görüp eğitimi sonlandırır.
+    """
+
+    def __init__(self, jobs_dir: Path, db_path: str, on_complete: Optional[Callable[[], object]] = None,
+                 max_history: int = 20):
+        """
+        Args:
+            jobs_dir: İş durum dosyalarının ve kilidin ortak dizini
+            db_path: Eğitim verisinin okunduğu şikayet deposu (SQLite dosyası)
+            on_complete: Başarılı eğitimden sonra ana süreçte çağrılır (ör. model yeniden yükleme)
+            max_history: Saklanan bitmiş iş sayısı
+        """
+        self.jobs_dir = Path(jobs_dir)
+        self.db_path = str(db_path)
+        self.on_complete = on_complete
+        self.max_history = max_history
+        self._processes: Dict[str, multiprocessing.Process] = {}
+        self._lock = threading.Lock()
+
+    def start(self, complaints: Optional[List[Dict[str, Any]]] = None, save: bool = True,
+              filters: Optional[Dict[str, Any]] = None) -> Dict:
+        """
+        Eğitim işini başlatır
+
+        Eğitim verisi alt süreçte depodan okunur; total_complaints veri
+        yüklenene kadar None'dır. Alt süreç başlatılırken dosya kilidi ve
+        durum dosyası yazıldığı için event loop dışından (ör.
+        run_in_threadpool ile) çağrılmalıdır.
+
+        Args:
+            complaints: Eğitimden önce depoya eklenecek şikayetler
+            save: Model kaydedilsin mi
+            filters: Eğitim verisi için depo filtreleri (source, category, since, until)
+
+        Returns:
+            İş durumu
+
+        Raises:
+            TrainingInProgressError: Herhangi bir worker'da başka bir eğitim çalışıyorsa
+        """
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        training_lock = FileLock(self.jobs_dir / 'training.lock')
+        if not training_lock.acquire():
+            raise TrainingInProgressError("Devam eden bir model eğitimi var")
+
+        try:
+            self._fail_orphaned()
+            job_id = uuid.uuid4().hex
+            job = {
+                'job_id': job_id,
+                'status': 'running',
+                'stage': 'starting',
+                'progress': 0.0,
+                'total_complaints': None,
+                'save_model': save,
+                'results': None,
+                'error': None,
+                'created_at': pd.Timestamp.now().isoformat(),
+                'finished_at': None
+            }
+            self._write_state(job)
+            self._prune()
+
+            messages = _mp_context.Queue()
+            process = _mp_context.Process(
+                target=_run_training, args=(self.db_path, complaints or [], filters or {}, save, messages),
+                name=f'training-{job_id[:8]}', daemon=True
+            )
+            process.start()
+        except BaseException:
+            training_lock.release()
+            raise
+
+        with self._lock:
+            self._processes[job_id] = process
+        threading.Thread(
+            target=self._monitor, args=(job_id, process, messages, training_lock),
+            name=f'training-monitor-{job_id[:8]}', daemon=True
+        ).start()
+
+        logger.info(f"Model eğitimi başlatıldı: {job_id} ({len(complaints or [])} yeni şikayet)")
+        return job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        İş durumunu getirir
+
+        Args:
+            job_id: İş kimliği
+
+        Returns:
+            Durum veya None
+        """
+        job = self._read_state(job_id)
+        if job is not None and job['status'] == 'running' and self._cancel_path(job_id).exists():
+            job['status'] = 'cancelling'
+        return job
+
+    def list_jobs(self) -> List[Dict]:
+        """Saklanan işler (yeniden eskiye)"""
+        if not self.jobs_dir.is_dir():
+            return []
+        jobs = [self.get(path.stem) for path in self.jobs_dir.glob('*.json')]
+        return sorted((job for job in jobs if job is not None),
+                      key=lambda job: job['created_at'], reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[Dict]:
+        """
+        Çalışan eğitimi iptal eder
+
+        İşi izleyen worker (bu veya başka bir süreç) işaret dosyasını en
+        geç bir sonraki yoklamada görür ve eğitim sürecini sonlandırır.
+
+        Args:
+            job_id: İş kimliği
+
+        Returns:
+            Güncel durum veya iş yoksa None
+        """
+        job = self.get(job_id)
+        if job is None or job['status'] != 'running':
+            return job
+
+        self._cancel_path(job_id).touch()
+        logger.info(f"Model eğitimi iptal ediliyor: {job_id}")
+        return self.get(job_id)
+
+    def shutdown(self) -> None:
+        """Bu süreçte çalışan eğitim süreçlerini sonlandırır"""
+        with self._lock:
+            processes = list(self._processes.values())
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    def _state_path(self, job_id: str) -> Path:
+        """Durum dosyası (dizin dışına çıkan kimlikler reddedilir)"""
+        if not job_id.isalnum():
+            raise ValueError(f"Geçersiz iş kimliği: {job_id}")
+        return self.jobs_dir / f'{job_id}.json'
+
+    def _cancel_path(self, job_id: str) -> Path:
+        return self._state_path(job_id).with_suffix('.cancel')
+
+    def _read_state(self, job_id: str) -> Optional[Dict]:
+        """Durum dosyasını okur"""
+        try:
+            state_path = self._state_path(job_id)
+        except ValueError:
+            return None
+        if not state_path.exists():
+            return None
+        with open(state_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_state(self, job: Dict) -> None:
+        """Durum dosyasını atomik olarak yazar (sadece işin sahibi worker yazar)"""
+        state_path = self._state_path(job['job_id'])
+        tmp_path = state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(job, f, indent=2, ensure_ascii=False, default=_json_default)
+        os.replace(tmp_path, state_path)
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._read_state(job_id)
+            job.update(fields)
+            self._write_state(job)
+
+    def _handle(self, job_id: str, message: Dict, outcome: Dict) -> None:
+        """Alt süreçten gelen mesajı işler"""
+        if message['type'] == 'progress':
+            self._update(job_id, stage=message['stage'], progress=message['progress'])
+        elif message['type'] == 'loaded':
+            self._update(job_id, total_complaints=message['total_complaints'])
+        else:
+            outcome.update(message)
+
+    def _monitor(self, job_id: str, process: multiprocessing.Process, messages,
+                 training_lock: FileLock) -> None:
+        """Alt süreç bitene kadar mesajları okur, iptali uygular ve son durumu yazar"""
+        try:
+            self._follow(job_id, process, messages)
+        except Exception as e:
+            logger.error(f"Eğitim izleme hatası ({job_id}): {e}")
+        finally:
+            with self._lock:
+                self._processes.pop(job_id, None)
+            self._cancel_path(job_id).unlink(missing_ok=True)
+            training_lock.release()
+
+        job = self.get(job_id)
+        if job is not None and job['status'] == 'completed' and self.on_complete is not None:
+            try:
+                self.on_complete()
+            except Exception as e:
+                logger.error(f"Eğitim sonrası model yükleme hatası: {e}")
+
+    def _follow(self, job_id: str, process: multiprocessing.Process, messages) -> None:
+        outcome: Dict = {}
+        cancelled = False
+
+        while True:
+            if not cancelled and self._cancel_path(job_id).exists():
+                cancelled = True
+                self._update(job_id, status='cancelling')
+                process.terminate()
+            try:
+                self._handle(job_id, messages.get(timeout=0.5), outcome)
+            except queue.Empty:
+                if not process.is_alive():
+                    break
+
+        # Süreç çıkmadan önce kuyruğa yazılanlar
+        while True:
+            try:
+                self._handle(job_id, messages.get_nowait(), outcome)
+            except queue.Empty:
+                break
+
+        process.join()
+        finished_at = pd.Timestamp.now().isoformat()
+
+        if cancelled:
+            self._update(job_id, status='cancelled', finished_at=finished_at)
+            logger.info(f"Model eğitimi iptal edildi: {job_id}")
+            return
+
+        if outcome.get('type') != 'result':
+            error = outcome.get('error') or f"Eğitim süreci beklenmedik şekilde sonlandı (çıkış kodu {process.exitcode})"
+            self._update(job_id, status='failed', error=error, finished_at=finished_at)
+            logger.error(f"Model eğitimi başarısız: {job_id}: {error}")
+            return
+
+        results = outcome['results']
+        status = 'failed' if results.get('status') == 'error' else 'completed'
+        self._update(job_id, status=status, stage='done', progress=1.0, results=results,
+                     error=results.get('message') if status == 'failed' else None,
+                     finished_at=finished_at)
+        logger.info(f"Model eğitimi bitti: {job_id} ({status})")
+
+    def _fail_orphaned(self) -> None:
+        """
+        Sahibi kalmamış işleri başarısız işaretler (eğitim kilidi tutulurken çağrılır)
+
+        Kilit alınabildiyse çalışıyor görünen bir iş, onu izleyen worker
+        sonlandığı için yarıda kalmıştır.
+        """
+        for job in self.list_jobs():
+            if job['status'] not in FINISHED_STATUSES:
+                self._cancel_path(job['job_id']).unlink(missing_ok=True)
+                self._update(job['job_id'], status='failed', finished_at=pd.Timestamp.now().isoformat(),
+                             error="Eğitimi izleyen API süreci sonlandı")
+
+    def _prune(self) -> None:
+        """En eski bitmiş işlerin durum dosyalarını siler"""
+        finished = [job for job in reversed(self.list_jobs()) if job['status'] in FINISHED_STATUSES]
+        for job in finished[:max(len(finished) - self.max_history, 0)]:
+            self._state_path(job['job_id']).unlink(missing_ok=True)
@@ -0,0 +1,104 @@
+"""
+9→12 kategori genişletmenin kolon bazlı ve satır bazlı sürümlerinin eşdeğerlik testleri
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.pipeline import (
+    CATEGORY_DIRECT_MAPPING, CATEGORY_EXPANSION_RULES,
+    expand_categories_9_to_12, expand_categories_9_to_12_batch
+)
+
+ROWS = [
+    # Delivery Issues: her alt kural, öncelik ve varsayılan
+    ("Siparişim çok gecikti", "Delivery Issues"),
+    ("Kargo geç geldi", "Delivery Issues"),
+    ("Teslimat zamanı belirsiz", "Delivery Issues"),
+    ("Kurye kapıya gelmedi", "Delivery Issues"),
+    ("Dağıtım merkezinde bekliyor", "Delivery Issues"),
+    ("Kargo firması ilgilenmiyor", "Delivery Issues"),
+    ("Paket şubede kaldı", "Delivery Issues"),
+    ("Adres doğru ama teslim edilemedi yazıyor", "Delivery Issues"),
+    ("Kurye çok gecikti", "Delivery Issues"),
+    ("Hiçbir bilgi verilmedi", "Delivery Issues"),
+    # Product Quality: her alt kural, öncelik ve varsayılan
+    ("Ürünün kalitesi çok düşük", "Product Quality"),
+    ("Gelen ürün bozuk çıktı", "Product Quality"),
+    ("Ekranda kusur var", "Product Quality"),
+    ("Paket yırtılmıştı", "Product Quality"),
+    ("Ambalaj açılmıştı", "Product Quality"),
+    ("Kutu ıslaktı", "Product Quality"),
+    ("Ürün ezik geldi", "Product Quality"),
+    ("Açıklama ile ürün uyuşmuyor", "Product Quality"),
+    ("Fotoğraftaki renk değil", "Product Quality"),
+    ("Satıcı yanıltıcı bilgi vermiş", "Product Quality"),
+    ("Bozuk ürün ezik kutuda geldi", "Product Quality"),
+    ("Beklediğim gibi değil", "Product Quality"),
+    # Türkçe büyük harfler: 'I' → 'ı', 'İ' → 'i' + birleşik nokta
+    ("KARGO FİRMASI CEVAP VERMİYOR", "Delivery Issues"),
+    ("KARGO FIRMASI CEVAP VERMIYOR", "Delivery Issues"),
+    ("TESLİMAT YAPILMADI", "Delivery Issues"),
+    ("TESLIMAT YAPILMADI", "Delivery Issues"),
+    ("ADRES DOĞRU AMA TESLİM EDİLEMEDİ", "Delivery Issues"),
+    ("ADRES DOĞRU AMA TESLIM EDILEMEDI", "Delivery Issues"),
+    ("KALİTE BERBAT", "Product Quality"),
+    ("KALITE BERBAT", "Product Quality"),
+    ("AÇIKLAMA YANLIŞ", "Product Quality"),
+    ("YANILTICI FOTOĞRAF", "Product Quality"),
+    # Metne bakılmadan eşlenenler
+    *[("Kargo geç geldi ama asıl sorun başka", category) for category in CATEGORY_DIRECT_MAPPING],
+    # Bilinmeyen kategoriler olduğu gibi kalır
+    ("Kargo gecikti", "Unknown Category"),
+    ("Kargo gecikti", "delivery issues"),
+    ("Paket ezik", "Kargo Gecikmesi"),
+    # Kategorisi olmayan kayıtlar
+    ("Kargo gecikti", None),
+    ("Ürün bozuk", np.nan),
+]
+
+
+def _row_wise(texts, categories):
+    return pd.Series(
+        [expand_categories_9_to_12(text, category) for text, category in zip(texts, categories)],
+        index=texts.index, dtype=object
+    )
+
+
+@pytest.mark.parametrize('dtype', [object, 'category'])
+def test_batch_matches_row_wise(dtype):
+    # Varsayılan olmayan index, sonuçların satırlara doğru yazıldığını da sınar
+    index = pd.RangeIndex(100, 100 + 2 * len(ROWS), 2)
+    texts = pd.Series([text for text, _ in ROWS], index=index)
+    categories = pd.Series([category for _, category in ROWS], index=index, dtype=dtype)
+
+    expected = _row_wise(texts, categories)
+    result = expand_categories_9_to_12_batch(texts, categories)
+
+    pd.testing.assert_series_equal(result.astype(object), expected, check_names=False)
+
+
+def test_rows_cover_every_rule():
+    expanded = {expand_categories_9_to_12(text, category) for text, category in ROWS}
+
+    for keyword_table, default in CATEGORY_EXPANSION_RULES.values():
+        assert set(keyword_table) | {default} <= expanded
+    assert set(CATEGORY_DIRECT_MAPPING.values()) <= expanded
+    assert {"Unknown Category", "delivery issues", "Kargo Gecikmesi"} <= expanded
+
+
+def test_every_keyword_matches_like_row_wise():
+    rows = [
+        (f"{prefix} {keyword} {suffix}", category)
+        for category, (keyword_table, _) in CATEGORY_EXPANSION_RULES.items()
+        for keywords in keyword_table.values()
+        for keyword in keywords
+        for prefix, suffix in (("", ""), ("ÇOK", "!"), (keyword.upper(), ""))
+    ]
+    texts = pd.Series([text for text, _ in rows])
+    categories = pd.Series([category for _, category in rows])
+
+    pd.testing.assert_series_equal(
+        expand_categories_9_to_12_batch(texts, categories).astype(object),
+        _row_wise(texts, categories), check_names=False
+    )
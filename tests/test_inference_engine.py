@@ -0,0 +1,78 @@
+"""
+NumpyInferenceEngine ile sklearn tahmin yolunun eşdeğerlik testleri
+"""
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.sparse import csr_matrix, hstack
+
+from src.inference import NumpyInferenceEngine
+from src.pipeline import ComplaintClassificationPipeline
+from src.scoring import predict_with_proba
+
+VOCABULARY = {
+    "Kargo Gecikmesi": ["kargo", "gecikti", "teslimat", "hafta", "bekliyorum", "gelmedi"],
+    "Ödeme/Fatura Sorunu": ["fatura", "ödeme", "kart", "çekildi", "tutar", "hatalı"],
+    "İade/Değişim Sorunu": ["iade", "değişim", "para", "talep", "onaylanmadı", "ürün"],
+}
+
+TEXTS = [
+    "Kargom iki haftadır gelmedi, teslimat çok gecikti",
+    "Kartımdan iki kez ödeme çekildi, fatura tutarı hatalı",
+    "İade talebim hâlâ onaylanmadı, paramı geri istiyorum",
+    "KARGO ve FATURA ile ilgili İADE talebi",
+    "Tamamen bilinmeyen kelimelerden oluşan bir metin",
+    "ürün",
+    # Tekrarlanan terimler sublinear_tf ağırlıklarını sınar
+    "kargo kargo kargo gecikti gecikti fatura",
+    "iade iade para para para para kart",
+]
+
+
+def _training_frame(categories, rows_per_category=40):
+    """Kategori sözlüklerinden rastgele ama tekrarlanabilir şikayetler"""
+    rng = random.Random(0)
+    shared = ["çok", "kötü", "hizmet", "sipariş", "lütfen"]
+    rows = []
+    for category in categories:
+        words = VOCABULARY[category]
+        for _ in range(rows_per_category):
+            tokens = rng.choices(words, k=rng.randint(3, 8)) + rng.choices(shared, k=rng.randint(0, 3))
+            rng.shuffle(tokens)
+            rows.append({'complaint_text': ' '.join(tokens), 'complaint_category': category})
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture(params=[list(VOCABULARY), list(VOCABULARY)[:2]], ids=['multiclass', 'binary'])
+def trained_pipeline(request):
+    pipeline = ComplaintClassificationPipeline()
+    X, y = pipeline.prepare_features(_training_frame(request.param))
+    pipeline.train_model(X, y, cv_mode='none', n_jobs=1)
+    return pipeline
+
+
+def _sklearn_predict(pipeline, texts):
+    """ComplaintClassificationPipeline.predict ile aynı özellik yolu, toplu"""
+    cleaned = [pipeline.preprocess_text(text) for text in texts]
+    numerical = [[len(text), len(text.split())] for text in texts]
+    features = hstack([
+        pipeline.tfidf_vectorizer.transform(cleaned),
+        csr_matrix(pipeline.feature_scaler.transform(numerical))
+    ])
+    return predict_with_proba(pipeline.model, features)
+
+
+def test_engine_matches_sklearn_predictions(trained_pipeline, tmp_path):
+    engine = NumpyInferenceEngine.load(trained_pipeline.export_engine(tmp_path / 'engine'))
+
+    cleaned = [trained_pipeline.preprocess_text(text) for text in TEXTS]
+    numerical = np.array([[len(text), len(text.split())] for text in TEXTS], dtype=float)
+    labels, probabilities = engine.predict_with_proba(cleaned, numerical)
+    expected_labels, expected_probabilities = _sklearn_predict(trained_pipeline, TEXTS)
+
+    assert list(labels) == list(expected_labels)
+    assert probabilities.shape == expected_probabilities.shape
+    assert np.allclose(probabilities, expected_probabilities)
+    assert list(engine.classes_) == list(trained_pipeline.model.classes_)